@@ -6,6 +6,7 @@ import argparse
 import json
 import logging
 from dataclasses import asdict
+from itertools import islice
 from pathlib import Path
 from typing import Sequence
 
@@ -14,8 +15,12 @@ from symbio.coach.tuner import tune_rank_weights
 from symbio.core.ngram_kn import KNTrigram
 from symbio.core.tokenize import tokenize
 
+from symbio.batch import read_prompts, run_batch
 from symbio.biocortex import BioCortex
+from symbio.checkpoint import CheckpointStore
 from symbio.config import DEFAULT_CONFIG, SymbioConfig
+from symbio.event_log import EventLog, event_to_json, read_events
+from symbio.events import iter_by_kind
 from symbio.hpio import HPIO
 from symbio.logging_setup import configure_logging
 from symbio.orchestrator import Orchestrator
@@ -52,10 +57,21 @@ def build_parser() -> argparse.ArgumentParser:
     generate.add_argument("--neo-high", type=float, default=0.35)
 
     run = sub.add_parser("run", help="Führe eine komplette Episode aus")
-    run.add_argument("--prompt", required=True)
+    source = run.add_mutually_exclusive_group(required=True)
+    source.add_argument("--prompt")
+    source.add_argument("--prompts", help="JSONL-Datei mit einem Prompt je Zeile")
     run.add_argument("--steps", type=int, default=200)
     run.add_argument("--model-dir", default="runs/model")
-    run.add_argument("--save-run", default="runs/last_run.json")
+    run.add_argument("--save-run", help="Zusammenfassung (nur --prompt, Standard runs/last_run.json)")
+    run.add_argument("--event-log", help="Events zusätzlich als JSONL anhängen (nur --prompt)")
+    run.add_argument("--workers", type=int, default=None, help="Prozesse für --prompts")
+    run.add_argument("--output", default="runs/batch_runs.jsonl", help="Ergebnisse für --prompts")
+    run.add_argument(
+        "--quiescence-tol",
+        type=float,
+        default=None,
+        help="Ruhige Ticks ab dieser Toleranz ohne Schwarm nachführen (Feld-Sprung nur bei reflect/periodic)",
+    )
 
     auto = sub.add_parser("autopoiesis", help="Generiere Sätze aus Feldreaktionen")
     auto.add_argument("--data", nargs="+", required=True, help="Datensätze für das Denken")
@@ -64,6 +80,24 @@ def build_parser() -> argparse.ArgumentParser:
     auto.add_argument("--max-sentences", type=int, default=5)
     auto.add_argument("--model-dir", default="runs/model")
     auto.add_argument("--save", help="Optionaler Pfad für JSON-Ergebnis")
+    auto.add_argument("--event-log", help="Events zusätzlich als JSONL anhängen")
+    auto.add_argument("--checkpoint-dir", help="Verzeichnis für inkrementelle Checkpoints")
+    auto.add_argument("--checkpoint-every", type=int, default=25, help="Ticks zwischen Checkpoints")
+    auto.add_argument("--resume", action="store_true", help="Beim letzten Checkpoint fortsetzen")
+    auto.add_argument(
+        "--quiescence-tol",
+        type=float,
+        default=None,
+        help="Ruhige Ticks ab dieser Toleranz ohne Schwarm nachführen (Feld-Sprung nur bei reflect/periodic)",
+    )
+    auto.add_argument(
+        "--synthesis-workers", type=int, default=0, help="Prozesse für die Satzsynthese (0 = seriell)"
+    )
+
+    events = sub.add_parser("events", help="Lies ein ausgelagertes Event-Log")
+    events.add_argument("path", help="JSONL-Datei aus --event-log")
+    events.add_argument("--kind", choices=["pulse", "feedback", "tick", "decay"])
+    events.add_argument("--limit", type=int, default=None)
 
     tune = sub.add_parser("tune", help="Passe Rerank-Gewichte anhand des Feedback-Logs an")
     tune.add_argument("--log", default="runs/generate_log.jsonl")
@@ -84,6 +118,7 @@ def cmd_train(args: argparse.Namespace, config: SymbioConfig) -> None:
     texts = load_texts(args.data)
     cortex = BioCortex(config=config.bio)
     cortex.partial_fit(texts)
+    cortex.precompute_placements(config.field.shape)
     cortex.save(args.model_dir)
     LOGGER.info("BioCortex gespeichert in %s", args.model_dir)
 
@@ -163,16 +198,42 @@ def cmd_generate(args: argparse.Namespace, config: SymbioConfig) -> None:
 
 def cmd_run(args: argparse.Namespace, config: SymbioConfig) -> None:
     configure_logging()
+    if args.prompts:
+        if args.save_run or args.event_log:
+            raise SystemExit("--save-run/--event-log gelten nur für --prompt, nicht für --prompts")
+        cmd_run_batch(args, config)
+        return
     cortex = BioCortex.load(args.model_dir, config=config.bio)
     hpio = HPIO(field_config=config.field, swarm_config=config.swarm)
-    orchestrator = Orchestrator(cortex, hpio)
-    summary = orchestrator.run_episode(args.prompt, steps=args.steps)
-    Path(args.save_run).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    with EventLog(path=args.event_log) as event_log:
+        orchestrator = Orchestrator(
+            cortex, hpio, event_log=event_log, quiescence_tol=args.quiescence_tol
+        )
+        summary = orchestrator.run_episode(args.prompt, steps=args.steps)
+    Path(args.save_run or "runs/last_run.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
     LOGGER.info("Episode beendet: %s", summary)
 
 
+def cmd_run_batch(args: argparse.Namespace, config: SymbioConfig) -> None:
+    jobs = read_prompts(args.prompts, seed=config.swarm.seed, steps=args.steps)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as handle:
+        count = run_batch(
+            args.model_dir,
+            jobs,
+            handle,
+            config=config,
+            workers=args.workers,
+            quiescence_tol=args.quiescence_tol,
+        )
+    LOGGER.info("%d Episoden nach %s geschrieben", count, output)
+
+
 def cmd_autopoiesis(args: argparse.Namespace, config: SymbioConfig) -> None:
     configure_logging()
+    if args.resume and not args.checkpoint_dir:
+        raise SystemExit("--resume benötigt --checkpoint-dir")
     texts = load_texts(args.data)
     model_dir = Path(args.model_dir)
     if model_dir.exists():
@@ -182,13 +243,27 @@ def cmd_autopoiesis(args: argparse.Namespace, config: SymbioConfig) -> None:
         cortex = BioCortex(config=config.bio)
         cortex.partial_fit(texts)
     hpio = HPIO(field_config=config.field, swarm_config=config.swarm)
-    orchestrator = Orchestrator(cortex, hpio)
-    result = orchestrator.autopoietic_cycle(
-        texts,
-        steps=args.steps,
-        threshold=args.threshold,
-        max_sentences=args.max_sentences,
-    )
+    checkpoints = CheckpointStore(args.checkpoint_dir) if args.checkpoint_dir else None
+    with EventLog(path=args.event_log) as event_log:
+        orchestrator = Orchestrator(
+            cortex,
+            hpio,
+            event_log=event_log,
+            quiescence_tol=args.quiescence_tol,
+            synthesis_workers=args.synthesis_workers,
+        )
+        try:
+            result = orchestrator.autopoietic_cycle(
+                texts,
+                steps=args.steps,
+                threshold=args.threshold,
+                max_sentences=args.max_sentences,
+                checkpoints=checkpoints,
+                checkpoint_every=args.checkpoint_every,
+                resume=args.resume,
+            )
+        finally:
+            orchestrator.close()
     output = json.dumps(result, indent=2, ensure_ascii=False)
     if args.save:
         Path(args.save).write_text(output, encoding="utf-8")
@@ -196,6 +271,14 @@ def cmd_autopoiesis(args: argparse.Namespace, config: SymbioConfig) -> None:
     print(output)
 
 
+def cmd_events(args: argparse.Namespace, config: SymbioConfig) -> None:
+    events = read_events(args.path)
+    if args.kind:
+        events = iter_by_kind(events, args.kind)
+    for event in islice(events, args.limit):
+        print(json.dumps(event_to_json(event), ensure_ascii=False))
+
+
 def cmd_tune(args: argparse.Namespace, config: SymbioConfig) -> None:
     configure_logging()
     tuned = tune_rank_weights(args.log, step=args.step)
@@ -215,6 +298,8 @@ def main(argv: Sequence[str] | None = None) -> None:
             cmd_run(args, config)
         case "autopoiesis":
             cmd_autopoiesis(args, config)
+        case "events":
+            cmd_events(args, config)
         case "tune":
             cmd_tune(args, config)
         case _:
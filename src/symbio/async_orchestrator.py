@@ -0,0 +1,106 @@
+"""Nebenläufige Episoden auf einem asyncio-Event-Loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field as dataclass_field
+
+from .batch import episode_cortex
+from .biocortex import BioCortex
+from .config import FieldConfig, SwarmConfig
+from .hpio import HPIO
+from .orchestrator import Orchestrator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class AsyncOrchestrator:
+    """Führt viele Episoden als Koroutinen über einem geteilten BioCortex aus.
+
+    Jede Episode erhält ein eigenes :class:`HPIO` und eine Kopie des
+    veränderlichen Cortex-Zustands (siehe :func:`episode_cortex`); geteilt
+    bleiben nur Tokenizer und Sprachmodell, die eine Episode nicht
+    verändert. Jeder Tick läuft als eigener
+    Auftrag im Executor mit ``max_workers`` Threads, zwischen den Ticks gibt
+    die Koroutine den Loop frei. Höchstens ``max_episodes`` Episoden laufen
+    gleichzeitig, weitere warten auf einen freien Platz (Backpressure).
+    Ein Abbruch greift zwischen zwei Ticks; ein bereits laufender Tick wird
+    im Hintergrund zu Ende gerechnet, sein Ergebnis verworfen.
+    """
+
+    biocortex: BioCortex
+    field_config: FieldConfig = dataclass_field(default_factory=FieldConfig)
+    swarm_config: SwarmConfig = dataclass_field(default_factory=SwarmConfig)
+    max_workers: int | None = None
+    max_episodes: int = 8
+    active: int = 0
+    _executor: ThreadPoolExecutor = dataclass_field(init=False, repr=False)
+    _slots: asyncio.Semaphore = dataclass_field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_episodes < 1:
+            raise ValueError("max_episodes must be at least 1")
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="symbio-tick")
+        self._slots = asyncio.Semaphore(self.max_episodes)
+
+    async def __aenter__(self) -> "AsyncOrchestrator":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Beende den Executor, ohne den Event-Loop zu blockieren."""
+
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=True)
+
+    def close(self) -> None:
+        """Synchrones Beenden; nur außerhalb eines laufenden Event-Loops aufrufen."""
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def run_episode(
+        self, prompt: str, steps: int = 50, *, hpio: HPIO | None = None
+    ) -> dict:
+        """Asynchrones Gegenstück zu :meth:`Orchestrator.run_episode`."""
+
+        async with self._slots:
+            self.active += 1
+            try:
+                return await self._run(prompt, steps, hpio)
+            finally:
+                self.active -= 1
+
+    async def run_episodes(self, prompts: list[str], steps: int = 50) -> list[dict]:
+        """Alle ``prompts`` nebenläufig; Ergebnisse in Eingabereihenfolge."""
+
+        return list(await asyncio.gather(*(self.run_episode(p, steps) for p in prompts)))
+
+    async def _run(self, prompt: str, steps: int, hpio: HPIO | None) -> dict:
+        loop = asyncio.get_running_loop()
+        if hpio is None:
+            hpio = HPIO(field_config=self.field_config, swarm_config=self.swarm_config)
+        orchestrator = Orchestrator(episode_cortex(self.biocortex), hpio)
+        queue = await loop.run_in_executor(self._executor, orchestrator.start_episode, prompt)
+        monitor = orchestrator.new_monitor()
+        skipped = 0
+        for step in range(steps):
+            quiet = await loop.run_in_executor(
+                self._executor, orchestrator.run_tick, queue, step, monitor
+            )
+            if quiet:
+                await loop.run_in_executor(self._executor, orchestrator.flush_feedback, queue)
+                skipped = await loop.run_in_executor(
+                    self._executor, orchestrator.skip_ticks, step + 1, steps
+                )
+                break
+        else:
+            await loop.run_in_executor(self._executor, orchestrator.flush_feedback, queue)
+        logger.debug("Episode beendet nach %d Ticks (%d übersprungen)", steps, skipped)
+        return orchestrator.summary(queue, skipped)
+
+
+__all__ = ["AsyncOrchestrator"]
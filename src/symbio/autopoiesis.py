@@ -2,23 +2,81 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Sequence
 
 from .biocortex import BioCortex
+from .metrics.neology import NeologyStats
 from .types import Hotspot
+from .utils import worker_context
+
+_CORTEX: BioCortex | None = None
+
+
+def _prompt_tags(hotspot: Hotspot, top_k: int) -> list[str]:
+    # Agenten-Spuren (``agent:<rolle>``) vor der Auswahl verwerfen, sonst
+    # verdrängen sie in zusammengefassten Hotspots alle Konzept-Tags.
+    concepts = sorted(
+        ((name.strip(), value) for name, value in hotspot.tags.items() if ":" not in name),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return [name for name, _ in concepts if name][:top_k]
 
 
 def _compose_prompt(hotspot: Hotspot, top_k: int) -> str | None:
-    tags = [
-        name.strip()
-        for name, _ in hotspot.top_tags(top_k)
-        if name.strip() and ":" not in name
-    ]
+    tags = _prompt_tags(hotspot, top_k)
     if not tags:
         return None
     return " ".join(tags)
 
 
+def tag_key(tags: Iterable[str]) -> tuple[str, ...]:
+    """Normalisierte Tag-Multimenge: klein geschrieben und sortiert."""
+
+    return tuple(sorted(tag.casefold() for tag in tags))
+
+
+@dataclass(slots=True)
+class SynthesisCache:
+    """Begrenzter LRU-Cache für Sätze des parallelen Synthesemodus.
+
+    Ein Eintrag gilt nur für den Modellstand, unter dem er erzeugt wurde
+    (siehe :meth:`validate`); ändert er sich, wird der Cache geleert.
+    Höchstens ``maxsize`` Einträge bleiben erhalten.
+    """
+
+    maxsize: int = 256
+    model_state: Hashable = None
+    entries: OrderedDict = field(default_factory=OrderedDict)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def validate(self, model_state: Hashable) -> None:
+        """Leere den Cache, falls ``model_state`` vom gespeicherten abweicht."""
+
+        if model_state != self.model_state:
+            self.entries.clear()
+            self.model_state = model_state
+
+    def get(self, key: Hashable) -> str:
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: Hashable, value: str) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > max(self.maxsize, 0):
+            self.entries.popitem(last=False)
+
+
 def synthesize_thoughts(
     biocortex: BioCortex,
     hotspots: Sequence[Hotspot],
@@ -26,12 +84,37 @@ def synthesize_thoughts(
     max_sentences: int = 5,
     top_k_tags: int = 3,
     max_new_tokens: int = 48,
+    workers: int = 0,
+    cache: SynthesisCache | None = None,
+    pool: SynthesisPool | None = None,
 ) -> list[str]:
-    """Erzeugt neue Sätze aus den stärksten Feldreaktionen."""
+    """Erzeugt neue Sätze aus den stärksten Feldreaktionen.
+
+    Mit ``workers >= 1`` läuft der parallele Modus: Prompts werden über ihre
+    normalisierte Tag-Multimenge (:func:`tag_key`) dedupliziert, Treffer aus
+    ``cache`` wiederverwendet und die übrigen Prompts gemeinsam in einem
+    Prozesspool mit ``workers`` Prozessen erzeugt. Jeder Prompt erhält einen
+    vorab in Rangfolge gezogenen Seed, daher hängen die Sätze nicht von der
+    Worker-Zahl ab; die Reihenfolge entspricht dem sequentiellen Pfad.
+    ``biocortex.last_neology`` beschreibt danach den zuletzt neu erzeugten
+    Satz in Rangfolge (unverändert, wenn alle Sätze aus dem Cache kamen).
+    Ein übergebener :class:`SynthesisPool` wird wiederverwendet und bleibt
+    offen; sonst wird für den Aufruf ein eigener Pool gestartet.
+    """
 
     if not hotspots:
         return []
     ranked = sorted(hotspots, key=lambda spot: spot.value, reverse=True)
+    if workers >= 1:
+        own = pool is None
+        pool = SynthesisPool(workers) if own else pool
+        try:
+            return _synthesize_pooled(
+                biocortex, ranked, max_sentences, top_k_tags, max_new_tokens, pool, cache
+            )
+        finally:
+            if own:
+                pool.close()
     sentences: list[str] = []
     seen_prompts: set[str] = set()
     for hotspot in ranked:
@@ -46,6 +129,109 @@ def synthesize_thoughts(
     return sentences
 
 
+def model_state(biocortex: BioCortex) -> Hashable:
+    """Modellstand, unter dem ein zwischengespeicherter Satz gültig bleibt.
+
+    ``revision`` ändert sich mit jedem ``partial_fit`` (Tokenizer,
+    Sprachmodell, Lexikon), ``neo_rate`` steuert den Neologismus-Anteil.
+    Dopamin schärft die Verteilung nur leicht und schwankt mit jedem
+    Feedback; es zählt wie der Seed zum Zufall der Stichprobe, sonst gäbe es
+    über Zyklen hinweg keine Treffer.
+    """
+
+    return (biocortex.revision, biocortex.config.neo_rate)
+
+
+@dataclass(slots=True)
+class SynthesisPool:
+    """Prozesspool des parallelen Synthesemodus, der über Zyklen bestehen bleibt.
+
+    Die Worker erhalten den Cortex einmal beim Start (``forkserver``, sonst
+    ``spawn``). Der Pool startet nur neu, wenn ein anderer Cortex oder ein
+    neuer Modellstand (``BioCortex.revision``) kommt; je Auftrag reisen nur
+    Prompt, Seed, Dopamin und ``neo_rate`` mit. :meth:`close` beendet ihn.
+    """
+
+    workers: int
+    _executor: ProcessPoolExecutor | None = field(default=None, repr=False)
+    _model: tuple | None = field(default=None, repr=False)
+
+    def map(
+        self, biocortex: BioCortex, jobs: list[tuple]
+    ) -> list[tuple[str, NeologyStats | None]]:
+        if self.workers == 1 or len(jobs) == 1:
+            _init_worker(biocortex)
+            try:
+                return [_generate(job) for job in jobs]
+            finally:
+                _init_worker(None)
+        model = (id(biocortex), model_state(biocortex))
+        if self._executor is None or self._model != model:
+            self.close()
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=worker_context(),
+                initializer=_init_worker,
+                initargs=(biocortex,),
+            )
+            self._model = model
+        return list(self._executor.map(_generate, jobs))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._model = None
+
+
+def _synthesize_pooled(
+    biocortex: BioCortex,
+    ranked: Sequence[Hotspot],
+    max_sentences: int,
+    top_k_tags: int,
+    max_new_tokens: int,
+    pool: SynthesisPool,
+    cache: SynthesisCache | None,
+) -> list[str]:
+    cache = SynthesisCache() if cache is None else cache
+    cache.validate(model_state(biocortex))
+    keys: list[tuple] = []
+    pending: dict[tuple, tuple] = {}
+    dopamine = biocortex.neuromod.dopamine
+    for hotspot in ranked:
+        if len(keys) >= max_sentences:
+            break
+        tags = _prompt_tags(hotspot, top_k_tags)
+        key = (tag_key(tags), max_new_tokens)
+        if not tags or key in keys:
+            continue
+        keys.append(key)
+        if key not in cache:
+            seed = biocortex.rng.randint(0, 2**63 - 1)
+            pending[key] = (" ".join(tags), max_new_tokens, seed, dopamine)
+    found = {key: cache.get(key) for key in keys if key not in pending}
+    if pending:
+        results = pool.map(biocortex, list(pending.values()))
+        for key, (text, neology) in zip(pending, results):
+            found[key] = text
+            cache.put(key, text)
+            biocortex.last_neology = neology
+    return [found[key] for key in keys]
+
+
+def _init_worker(biocortex: BioCortex | None) -> None:
+    global _CORTEX
+    _CORTEX = biocortex
+
+
+def _generate(job: tuple) -> tuple[str, NeologyStats | None]:
+    assert _CORTEX is not None, "synthesis worker not initialised"
+    prompt, max_new_tokens, seed, dopamine = job
+    _CORTEX.neuromod.dopamine = dopamine
+    text = _CORTEX.generate(prompt, max_new_tokens=max_new_tokens, rng=random.Random(seed))
+    return text.strip(), _CORTEX.last_neology
+
+
 def aggregate_prompts(hotspots: Iterable[Hotspot], top_k_tags: int = 3) -> list[str]:
     """Hilfsfunktion für Debugging und Analyse."""
 
@@ -57,4 +243,11 @@ def aggregate_prompts(hotspots: Iterable[Hotspot], top_k_tags: int = 3) -> list[
     return prompts
 
 
-__all__ = ["aggregate_prompts", "synthesize_thoughts"]
+__all__ = [
+    "SynthesisCache",
+    "SynthesisPool",
+    "aggregate_prompts",
+    "model_state",
+    "synthesize_thoughts",
+    "tag_key",
+]
@@ -0,0 +1,140 @@
+"""Episoden für viele Prompts in einem Prozesspool."""
+
+from __future__ import annotations
+
+import copy
+import json
+import multiprocessing
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+from .biocortex import BioCortex
+from .config import SymbioConfig
+from .hpio import HPIO
+from .orchestrator import Orchestrator
+
+_BASE: BioCortex | None = None
+_CONFIG: SymbioConfig | None = None
+_QUIESCENCE_TOL: float | None = None
+# Wall-Clock-Messwerte machen Datensätze unvergleichbar und bleiben draußen.
+_TIMING_FIELDS = frozenset({"events_per_sec"})
+
+
+@dataclass(slots=True)
+class PromptJob:
+    """Ein Prompt aus der Eingabedatei samt Seed und Schrittzahl."""
+
+    index: int
+    prompt: str
+    seed: int
+    steps: int
+    id: str | int | None = None
+
+
+def read_prompts(path: Path | str, *, seed: int, steps: int) -> Iterator[PromptJob]:
+    """Lies ``{"prompt": ..., "seed"?: ..., "steps"?: ..., "id"?: ...}`` je Zeile."""
+
+    with Path(path).open(encoding="utf-8") as handle:
+        lines = (line for line in handle if line.strip())
+        for index, line in enumerate(lines):
+            data = json.loads(line)
+            if isinstance(data, str):
+                data = {"prompt": data}
+            yield PromptJob(
+                index=index,
+                prompt=data["prompt"],
+                seed=int(data.get("seed", seed)),
+                steps=int(data.get("steps", steps)),
+                id=data.get("id"),
+            )
+
+
+def episode_cortex(base: BioCortex) -> BioCortex:
+    """Flache Kopie von ``base`` mit eigenem veränderlichem Zustand.
+
+    Tokenizer und Sprachmodell werden geteilt; Graph, Neuromodulatoren,
+    Replay, Platzierungstabelle und Zufallsgenerator, die eine Episode
+    verändert, werden kopiert.
+    So hängt jede Episode nur vom geladenen Modell und ihrem Prompt ab.
+    """
+
+    cortex = copy.copy(base)
+    cortex.graph = copy.deepcopy(base.graph)
+    cortex.neuromod = copy.deepcopy(base.neuromod)
+    cortex.replay = copy.deepcopy(base.replay)
+    cortex.placements = {shape: dict(table) for shape, table in base.placements.items()}
+    cortex.rng = copy.deepcopy(base.rng)
+    return cortex
+
+
+def run_prompt(job: PromptJob) -> tuple[int, dict]:
+    """Führe eine Episode mit eigenem :class:`HPIO` für ``job`` aus.
+
+    Der Datensatz enthält keine Zeitmessungen und ist damit reproduzierbar.
+    """
+
+    assert _BASE is not None and _CONFIG is not None, "batch worker not initialised"
+    swarm_config = replace(_CONFIG.swarm, seed=job.seed)
+    hpio = HPIO(field_config=_CONFIG.field, swarm_config=swarm_config)
+    orchestrator = Orchestrator(episode_cortex(_BASE), hpio, quiescence_tol=_QUIESCENCE_TOL)
+    summary = orchestrator.run_episode(job.prompt, steps=job.steps)
+    record = {"id": job.id, "prompt": job.prompt, "seed": job.seed, "steps": job.steps}
+    record.update((key, value) for key, value in summary.items() if key not in _TIMING_FIELDS)
+    return job.index, record
+
+
+def _load(model_dir: str, config: SymbioConfig, quiescence_tol: float | None) -> None:
+    global _BASE, _CONFIG, _QUIESCENCE_TOL
+    _BASE = BioCortex.load(model_dir, config=config.bio)
+    _CONFIG = config
+    _QUIESCENCE_TOL = quiescence_tol
+
+
+def _init_worker(model_dir: str, config: SymbioConfig, quiescence_tol: float | None) -> None:
+    if _BASE is None:
+        _load(model_dir, config, quiescence_tol)
+
+
+def run_batch(
+    model_dir: Path | str,
+    jobs: Iterable[PromptJob],
+    output: IO[str],
+    *,
+    config: SymbioConfig,
+    workers: int | None = None,
+    quiescence_tol: float | None = None,
+) -> int:
+    """Führe alle ``jobs`` aus und schreibe je Prompt eine JSON-Zeile.
+
+    Das Modell wird vor dem Start des Pools geladen; bei ``fork`` erben die
+    Worker es per Copy-on-Write, sonst lädt es jeder Worker einmal. Fertige
+    Episoden landen in einem Reorder-Puffer und werden in Eingabereihenfolge
+    geschrieben, sobald alle Vorgänger vorliegen. Liefert die Zahl der
+    geschriebenen Zeilen. ``quiescence_tol`` wird an jeden
+    :class:`Orchestrator` weitergereicht.
+    """
+
+    _load(str(model_dir), config, quiescence_tol)
+    if workers == 1:
+        results = map(run_prompt, jobs)
+        return _write_ordered(results, output)
+    with multiprocessing.Pool(
+        workers, initializer=_init_worker, initargs=(str(model_dir), config, quiescence_tol)
+    ) as pool:
+        return _write_ordered(pool.imap_unordered(run_prompt, jobs), output)
+
+
+def _write_ordered(results: Iterable[tuple[int, dict]], output: IO[str]) -> int:
+    pending: dict[int, dict] = {}
+    written = 0
+    for index, record in results:
+        pending[index] = record
+        while written in pending:
+            output.write(json.dumps(pending.pop(written), ensure_ascii=False) + "\n")
+            output.flush()
+            written += 1
+    return written
+
+
+__all__ = ["PromptJob", "episode_cortex", "read_prompts", "run_batch", "run_prompt"]
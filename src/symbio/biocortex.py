@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import random
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Sequence
@@ -21,10 +22,17 @@ from .neuromod import NeuromodulatorState
 from .replay import ReplayBuffer
 from .tokenization import BioBPETokenizer
 from .types import Concept, Edge, Pulse
-from .utils import ensure_dir, softmax
+from .utils import ensure_dir, read_json, softmax, stable_hash, write_json
 
 logger = logging.getLogger(__name__)
 
+PULSE_BASE_AMPLITUDE = 0.5
+
+
+def _hashed_position(name: str, h: int, w: int) -> tuple[int, int]:
+    seed = stable_hash(name)
+    return seed % h, (seed // h) % w
+
 
 @dataclass(slots=True)
 class BioCortex:
@@ -41,11 +49,17 @@ class BioCortex:
     corpus_lexicon: set[str] = field(default_factory=set)
     morph_generator: Callable[[random.Random], str] = field(init=False)
     last_neology: NeologyStats | None = None
+    placements: dict[tuple[int, int], dict[str, tuple[int, int]]] = field(default_factory=dict)
+    revision: int = 0
 
     def __post_init__(self) -> None:
         self.lm = KneserNeyLM(order=self.config.ngram_order, discount=self.config.discount)
         self.replay = ReplayBuffer(capacity=self.config.replay_capacity)
         self.morph_generator = morph_wrapper(self._base_neologism)
+        if self.config.graph_max_out_edges is not None:
+            self.graph.max_out_edges = self.config.graph_max_out_edges
+        if self.config.graph_max_edges is not None:
+            self.graph.max_edges = self.config.graph_max_edges
 
     def partial_fit(self, texts: Sequence[str]) -> None:
         if not texts:
@@ -60,6 +74,7 @@ class BioCortex:
             self.replay.add(seq)
             for a, b in zip(seq, seq[1:]):
                 self.graph.update_edge(edge=Edge(a, b), pre=1.0, post=1.0)
+        self.revision += 1
 
     def generate(
         self,
@@ -68,11 +83,13 @@ class BioCortex:
         nucleus_p: float = 0.9,
         temperature: float = 1.0,
         neo_rate: float | None = None,
+        rng: random.Random | None = None,
     ) -> str:
+        rng = rng or self.rng
         tokens = self.tokenizer.encode(prompt)
         generated = list(tokens)
         neo_rate_value = self.config.neo_rate if neo_rate is None else max(0.0, min(neo_rate, 1.0))
-        np_rng = np.random.default_rng(self.rng.randint(0, 2**32 - 1))
+        np_rng = np.random.default_rng(rng.randint(0, 2**32 - 1))
         for _ in range(max_new_tokens):
             context = generated[-(self.lm.order - 1) :]
             probs = self.lm.prob_next(context)
@@ -92,7 +109,7 @@ class BioCortex:
             p_vocab = np.asarray(distribution, dtype=float)
             idx, is_neologism = sample_mixed(p_vocab, neo_rate_value, np_rng)
             if is_neologism:
-                neo_seed = self.rng.randint(1, 2**31 - 1)
+                neo_seed = rng.randint(1, 2**31 - 1)
                 word = self._sanitize_word(self.morph_generator(random.Random(neo_seed)))
                 if not word:
                     continue
@@ -182,34 +199,106 @@ class BioCortex:
         return cleaned
 
     def extract_concepts(self, prompt: str) -> list[Concept]:
-        tokens = self.tokenizer.encode(prompt)
-        unique = sorted(set(tokens))
+        return self.concepts_from_tokens(self.tokenizer.encode(prompt))
+
+    def concepts_from_tokens(
+        self, tokens: Sequence[int], lookup: dict[int, tuple[str, float]] | None = None
+    ) -> list[Concept]:
+        """Konzepte aus bereits kodierten Tokens.
+
+        ``lookup`` merkt sich Name und Pheromon je Token über mehrere Aufrufe;
+        der Graph darf sich dazwischen nicht ändern.
+        """
+
+        counts = Counter(tokens)
         concepts: list[Concept] = []
         total = len(tokens) or 1
-        for token in unique:
-            strength = tokens.count(token) / total
-            successors = self.graph.top_k_successors(token, k=1)
-            pher = max(
-                [self.graph.pheromones.get((token, succ), 0.0) for succ in successors]
-                or [self.graph.pheromones.get((token, token), 0.0)]
-            )
-            name = self.tokenizer.decode([token])
-            concepts.append(Concept(name=name or f"tok{token}", strength=strength, pheromone=pher))
+        for token in sorted(counts):
+            strength = counts[token] / total
+            info = lookup.get(token) if lookup is not None else None
+            if info is None:
+                info = self._token_concept(token)
+                if lookup is not None:
+                    lookup[token] = info
+            name, pher = info
+            concepts.append(Concept(name=name, strength=strength, pheromone=pher))
         concepts.sort(key=lambda c: c.strength, reverse=True)
         return concepts[: self.config.concept_top_k]
 
+    def _token_concept(self, token: int) -> tuple[str, float]:
+        successors = self.graph.top_k_successors(token, k=1)
+        pher = max(
+            [self.graph.pheromones.get((token, succ), 0.0) for succ in successors]
+            or [self.graph.pheromones.get((token, token), 0.0)]
+        )
+        name = self.tokenizer.decode([token])
+        return name or f"tok{token}", pher
+
+    def concept_position(self, name: str, field_shape: tuple[int, int]) -> tuple[int, int]:
+        """Feste Feldposition eines Konzepts aus :func:`stable_hash`.
+
+        Vorberechnete Vokabular-Positionen werden nachgeschlagen; andere Namen
+        werden jedes Mal neu gehasht und nicht in ``placements`` abgelegt,
+        damit die Tabelle höchstens so groß wie das Vokabular wird.
+        """
+
+        h, w = field_shape
+        position = self.placements.get((h, w), {}).get(name)
+        if position is None:
+            position = _hashed_position(name, h, w)
+        return position
+
+    def precompute_placements(self, field_shape: tuple[int, int]) -> None:
+        """Trage die Positionen aller Vokabular-Tokens für ``field_shape`` ein."""
+
+        h, w = field_shape
+        table = self.placements[(h, w)] = {}
+        for token in self.tokenizer.vocab.values():
+            name = self.tokenizer.decode([token]) or f"tok{token}"
+            table[name] = _hashed_position(name, h, w)
+
     def concepts_to_pulses(self, concepts: Sequence[Concept], field_shape: tuple[int, int]) -> list[Pulse]:
         h, w = field_shape
         pulses: list[Pulse] = []
         for concept in concepts:
-            seed = abs(hash(concept.name))
-            y = seed % h
-            x = (seed // h) % w
-            amplitude = 0.5 + concept.strength * (1.0 + concept.pheromone)
+            y, x = self.concept_position(concept.name, (h, w))
+            amplitude = PULSE_BASE_AMPLITUDE + concept.strength * (1.0 + concept.pheromone)
             spread = 1.5 + concept.pheromone
             pulses.append(Pulse(position=(y, x), amplitude=amplitude, spread=spread, tag=concept.name))
         return pulses
 
+    def get_state(self) -> dict:
+        """Episodenzustand für Checkpoints.
+
+        Graph, Neuromodulatoren, Replay und Zufallsgenerator; Tokenizer und
+        Sprachmodell gehören zu den Artefakten von :meth:`save`.
+        """
+
+        version, internal, gauss = self.rng.getstate()
+        return {
+            "graph": self.graph.get_state(),
+            "neuromod": {
+                attr: getattr(self.neuromod, attr)
+                for attr in ("dopamine", "serotonin", "acetylcholine")
+            },
+            "replay": [list(sequence) for sequence in self.replay.buffer],
+            "rng": {
+                "version": version,
+                "internal": np.array(internal, dtype=np.uint64),
+                "gauss": gauss,
+            },
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.graph.set_state(state["graph"])
+        for attr, value in state["neuromod"].items():
+            setattr(self.neuromod, attr, float(value))
+        self.replay.buffer.clear()
+        self.replay.buffer.extend(list(sequence) for sequence in state["replay"])
+        rng = state["rng"]
+        internal = tuple(int(value) for value in rng["internal"].tolist())
+        self.rng.setstate((rng["version"], internal, rng["gauss"]))
+
     def save(self, directory: str | Path) -> None:
         directory = ensure_dir(directory)
         self.tokenizer.save(str(Path(directory) / "tokenizer.json"))
@@ -220,6 +309,11 @@ class BioCortex:
             "pheromones": {f"{a},{b}": p for (a, b), p in self.graph.pheromones.items()},
         }
         graph_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        placements = {
+            f"{h}x{w}": {name: list(position) for name, position in table.items()}
+            for (h, w), table in self.placements.items()
+        }
+        write_json(Path(directory) / "placements.json", placements)
 
     @classmethod
     def load(cls, directory: str | Path, config: BioConfig | None = None) -> "BioCortex":
@@ -233,6 +327,15 @@ class BioCortex:
         instance.graph.pheromones = {
             tuple(map(int, key.split(","))): float(value) for key, value in data["pheromones"].items()
         }
+        instance.graph.rebuild_index()
+        instance.graph.enforce_capacity()
+        placements_path = directory / "placements.json"
+        if placements_path.exists():
+            for shape, table in read_json(placements_path).items():
+                h, w = (int(part) for part in shape.split("x"))
+                instance.placements[(h, w)] = {
+                    name: (int(y), int(x)) for name, (y, x) in table.items()
+                }
         return instance
 
 
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from .biocortex import BioCortex
-from .types import Pulse
+from .biocortex import PULSE_BASE_AMPLITUDE, BioCortex
+from .types import Concept, Pulse
 
 
 def text_to_pulses(biocortex: BioCortex, text: str, field_shape: tuple[int, int]) -> list[Pulse]:
@@ -14,9 +14,47 @@ def text_to_pulses(biocortex: BioCortex, text: str, field_shape: tuple[int, int]
     concepts = biocortex.extract_concepts(text)
     pulses = biocortex.concepts_to_pulses(concepts, field_shape)
     for concept, pulse in zip(concepts, pulses):
-        pulse.amplitude *= 1.0 + concept.pheromone
-        pulse.spread = max(1.0, pulse.spread)
+        _scale(pulse, concept)
     return pulses
 
 
-__all__ = ["text_to_pulses"]
+def texts_to_pulses(
+    biocortex: BioCortex, texts: Sequence[str], field_shape: tuple[int, int]
+) -> list[Pulse]:
+    """Batch-Variante von :func:`text_to_pulses` für viele Texte.
+
+    Alle Texte werden mit ``encode_batch`` kodiert, Name und Pheromon je
+    Token nur einmal bestimmt und die Konzepte aller Texte pro
+    ``(Name, Pheromon)`` summiert. Gleicher Name heißt gleiche Feldposition,
+    das Pheromon bestimmt Breite und Verstärkung; Tokens, die zum selben
+    Namen dekodieren, aber verschiedene Pheromone tragen, bleiben daher
+    getrennte Pulse. Das Ergebnis ist ein Puls je Konzept, dessen Amplitude
+    der Summe der Einzelpulse entspricht; es lässt sich mit einem einzigen
+    ``inject_many`` ins Feld schreiben.
+    """
+
+    lookup: dict[int, tuple[str, float]] = {}
+    totals: dict[tuple[str, float], list[float]] = {}
+    for tokens in biocortex.tokenizer.encode_batch(texts):
+        for concept in biocortex.concepts_from_tokens(tokens, lookup):
+            entry = totals.setdefault((concept.name, concept.pheromone), [0, 0.0])
+            entry[0] += 1
+            entry[1] += concept.strength
+    concepts = [
+        Concept(name=name, strength=strength, pheromone=pheromone)
+        for (name, pheromone), (_, strength) in totals.items()
+    ]
+    pulses = biocortex.concepts_to_pulses(concepts, field_shape)
+    for concept, pulse, (count, _) in zip(concepts, pulses, totals.values()):
+        # Jeder weitere Text steuert seine eigene Grundamplitude bei.
+        pulse.amplitude += PULSE_BASE_AMPLITUDE * (count - 1)
+        _scale(pulse, concept)
+    return pulses
+
+
+def _scale(pulse: Pulse, concept: Concept) -> None:
+    pulse.amplitude *= 1.0 + concept.pheromone
+    pulse.spread = max(1.0, pulse.spread)
+
+
+__all__ = ["text_to_pulses", "texts_to_pulses"]
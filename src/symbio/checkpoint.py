@@ -0,0 +1,115 @@
+"""Inkrementelle, inhaltsadressierte Checkpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+CHUNK_BYTES = 1 << 16
+MANIFEST = "manifest.json"
+
+
+class CheckpointStore:
+    """Speichert verschachtelte Zustände als Manifest plus Datenblöcke.
+
+    Arrays und ``bytes`` werden in Blöcke zu ``chunk_bytes`` zerlegt und unter
+    ihrem BLAKE2-Hash in ``objects/`` abgelegt; alles Übrige landet als JSON
+    im Manifest. Ein Block, den es schon gibt, wird nicht erneut geschrieben,
+    sodass ein Checkpoint nur die seit dem letzten geänderten Blöcke kostet.
+    Das Manifest wird atomar ersetzt; danach werden nicht mehr referenzierte
+    Blöcke gelöscht.
+    """
+
+    def __init__(self, root: Path | str, *, chunk_bytes: int = CHUNK_BYTES) -> None:
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.chunk_bytes = max(1, chunk_bytes)
+        self.written = 0
+        self.reused = 0
+
+    @property
+    def manifest(self) -> Path:
+        return self.root / MANIFEST
+
+    def exists(self) -> bool:
+        return self.manifest.exists()
+
+    def save(self, state: dict) -> None:
+        self.objects.mkdir(parents=True, exist_ok=True)
+        referenced: set[str] = set()
+        document = self._encode(state, referenced)
+        tmp = self.manifest.with_suffix(".tmp")
+        tmp.write_text(json.dumps(document), encoding="utf-8")
+        os.replace(tmp, self.manifest)
+        for path in self.objects.glob("*/*"):
+            if path.parent.name + path.name not in referenced:
+                path.unlink()
+
+    def load(self) -> dict | None:
+        """Letzter Checkpoint oder ``None``, falls keiner existiert."""
+
+        if not self.exists():
+            return None
+        return self._decode(json.loads(self.manifest.read_text(encoding="utf-8")))
+
+    def _encode(self, value: Any, referenced: set[str]) -> Any:
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value)
+            return {
+                "__array__": data.dtype.str,
+                "shape": list(data.shape),
+                "chunks": self._write(data.tobytes(), referenced),
+            }
+        if isinstance(value, bytes):
+            return {"__bytes__": self._write(value, referenced)}
+        if isinstance(value, dict):
+            return {str(key): self._encode(item, referenced) for key, item in value.items()}
+        if isinstance(value, list | tuple):
+            return [self._encode(item, referenced) for item in value]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if "__array__" in value:
+                data = self._read(value["chunks"])
+                return np.frombuffer(data, dtype=value["__array__"]).reshape(value["shape"]).copy()
+            if "__bytes__" in value:
+                return self._read(value["__bytes__"])
+            return {key: self._decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        return value
+
+    def _write(self, data: bytes, referenced: set[str]) -> list[str]:
+        digests = []
+        for start in range(0, len(data), self.chunk_bytes):
+            chunk = data[start : start + self.chunk_bytes]
+            digest = hashlib.blake2b(chunk, digest_size=20).hexdigest()
+            digests.append(digest)
+            referenced.add(digest)
+            path = self._path(digest)
+            if path.exists():
+                self.reused += 1
+                continue
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(chunk)
+            os.replace(tmp, path)
+            self.written += 1
+        return digests
+
+    def _read(self, digests: list[str]) -> bytes:
+        return b"".join(self._path(digest).read_bytes() for digest in digests)
+
+    def _path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+
+__all__ = ["CHUNK_BYTES", "CheckpointStore"]
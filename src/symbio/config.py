@@ -12,6 +12,8 @@ class BioConfig:
     replay_capacity: int = 64
     concept_top_k: int = 8
     neo_rate: float = 0.25
+    graph_max_out_edges: int | None = None
+    graph_max_edges: int | None = None
 
 
 @dataclass(slots=True)
@@ -19,6 +21,16 @@ class FieldConfig:
     shape: tuple[int, int] = (64, 64)
     relax_alpha: float = 0.1
     evaporate_rate: float = 0.01
+    backend: str = "python"
+    tag_floor: float = 1e-6
+    kernel_truncate: float | None = None
+    hotspot_top_n: int | None = None
+    boundary: str = "edge"
+    workers: int | None = None
+    tile_rows: int | None = None
+    block_size: int = 16
+    block_floor: float = 1e-6
+    dtype: str = "float64"
 
 
 @dataclass(slots=True)
@@ -26,6 +38,8 @@ class SwarmConfig:
     n_agents: int = 16
     boundary: str = "reflect"
     seed: int = 13
+    engine: str = "python"
+    synchronous: bool = True
 
 
 @dataclass(slots=True)
@@ -0,0 +1,189 @@
+"""Begrenztes Event-Log mit optionalem Auslagern in eine JSONL-Datei."""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from .types import Event, Hotspot, Pulse
+
+_STOP = object()
+
+
+def event_to_json(event: Event) -> dict:
+    """Wandle ein Event in JSON-kompatible Grundtypen um."""
+
+    return {"kind": event.kind, "payload": _plain(event.payload)}
+
+
+def event_from_json(data: dict) -> Event:
+    """Baue ein Event aus :func:`event_to_json` wieder auf.
+
+    Pulse und Hotspots werden wieder zu :class:`Pulse` bzw. :class:`Hotspot`;
+    andere Nutzlasten bleiben JSON-Grundtypen.
+    """
+
+    kind, payload = data["kind"], data["payload"]
+    if kind == "pulse" and isinstance(payload, list):
+        payload = [
+            Pulse(
+                position=tuple(item["position"]),
+                amplitude=float(item["amplitude"]),
+                spread=float(item["spread"]),
+                tag=item["tag"],
+            )
+            for item in payload
+        ]
+    elif kind == "feedback" and isinstance(payload, dict):
+        hotspots = [Hotspot.from_dict(item) for item in payload.get("hotspots", [])]
+        payload = {**payload, "hotspots": hotspots}
+    return Event(kind=kind, payload=payload)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Hotspot):
+        return value.to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_plain(item) for item in value]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return value
+
+
+def read_events(path: Path | str) -> Iterator[Event]:
+    """Lies ein ausgelagertes Log zeilenweise und ohne es ganz zu laden."""
+
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield event_from_json(json.loads(line))
+
+
+class EventLog:
+    """Ringpuffer der letzten ``capacity`` Events.
+
+    Mit ``path`` wird jedes Event zusätzlich an eine JSONL-Datei angehängt.
+    Das Schreiben übernimmt ein Hintergrund-Thread, der bis zu ``batch_size``
+    Events pro Schreibvorgang bündelt; :meth:`close` leert die Warteschlange
+    und beendet den Thread. Die Warteschlange fasst höchstens
+    ``max_pending`` Events; ist sie voll, blockiert :meth:`append`, bis der
+    Thread aufgeholt hat (Backpressure statt unbegrenztem Speicher).
+    Scheitert ein Schreibvorgang, merkt sich der Thread den ersten Fehler
+    und schreibt nichts mehr; :meth:`append`, :meth:`flush` und
+    :meth:`close` lösen ihn danach bei jedem Aufruf erneut aus, die Datei
+    endet also am Fehler statt stillschweigend Lücken zu bekommen.
+    ``total`` zählt alle jemals angehängten Events.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = 10_000,
+        path: Path | str | None = None,
+        *,
+        batch_size: int = 256,
+        max_pending: int = 8192,
+    ) -> None:
+        self.events: deque[Event] = deque(maxlen=capacity)
+        self.path = Path(path) if path is not None else None
+        self.batch_size = max(1, batch_size)
+        self.total = 0
+        self._queue: queue.Queue | None = None
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._queue = queue.Queue(maxsize=max(1, max_pending))
+            self._writer = threading.Thread(
+                target=self._write_loop, name="symbio-event-log", daemon=True
+            )
+            self._writer.start()
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self.events)
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, event: Event) -> None:
+        self._raise_error()
+        self.events.append(event)
+        self.total += 1
+        if self._queue is not None:
+            self._queue.put(event)
+
+    def flush(self) -> None:
+        """Warte, bis alle bisher angehängten Events geschrieben sind."""
+
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        if self._queue is not None and self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._queue = None
+            self._writer = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _write_loop(self) -> None:
+        assert self._queue is not None and self.path is not None
+        pending = self._queue
+        handle = None
+        try:
+            handle = self.path.open("a", encoding="utf-8")
+        except OSError as error:
+            self._error = error
+        try:
+            while True:
+                batch = [pending.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(pending.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    if self._error is None:
+                        self._write_batch(handle, batch)
+                except Exception as error:
+                    self._error = error
+                finally:
+                    for _ in batch:
+                        pending.task_done()
+                if any(item is _STOP for item in batch):
+                    return
+        finally:
+            if handle is not None:
+                handle.close()
+
+    @staticmethod
+    def _write_batch(handle: IO[str], batch: list) -> None:
+        lines = [
+            json.dumps(event_to_json(item), ensure_ascii=False) + "\n"
+            for item in batch
+            if item is not _STOP
+        ]
+        handle.writelines(lines)
+        handle.flush()
+
+
+__all__ = ["EventLog", "event_from_json", "event_to_json", "read_events"]
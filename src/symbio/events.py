@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Any, Iterable
 
+from .event_log import event_from_json, event_to_json
 from .types import Event
 
+COALESCED_KINDS = ("pulse", "feedback")
+
 
 def make_event(kind: Event.kind, payload: Any) -> Event:
     """Erzeuge ein Event und validiere den Inhalt.
@@ -28,6 +33,77 @@ def make_event(kind: Event.kind, payload: Any) -> Event:
     return Event(kind=kind, payload=payload)
 
 
+def coalesce(first: Event, second: Event) -> Event:
+    """Fasse zwei aufeinanderfolgende Events derselben Art zusammen.
+
+    Pulse werden zu einer gemeinsamen Injektion verkettet, Feedback-Events
+    sammeln ihre Hotspots und behalten die jüngsten Metriken.
+    """
+
+    match first.kind, second.kind:
+        case "pulse", "pulse":
+            return Event(kind="pulse", payload=[*first.payload, *second.payload])
+        case "feedback", "feedback":
+            hotspots = [*first.payload.get("hotspots", []), *second.payload.get("hotspots", [])]
+            return Event(kind="feedback", payload={**second.payload, "hotspots": hotspots})
+        case _:
+            raise ValueError(f"cannot coalesce {first.kind!r} with {second.kind!r}")
+
+
+@dataclass(slots=True)
+class EventQueue:
+    """FIFO-Warteschlange auf Basis von :class:`collections.deque`.
+
+    :meth:`pop` fasst direkt aufeinanderfolgende Events der Arten
+    ``COALESCED_KINDS`` zu einem Event zusammen. Mit :meth:`defer`
+    zurückgestellte Events sammeln sich, bis :meth:`release` sie gemeinsam
+    einreiht.
+    """
+
+    events: deque[Event] = field(default_factory=deque)
+    deferred: deque[Event] = field(default_factory=deque)
+    coalesced: int = 0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def push(self, event: Event) -> None:
+        self.events.append(event)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        self.events.extend(events)
+
+    def defer(self, event: Event) -> None:
+        self.deferred.append(event)
+
+    def release(self) -> None:
+        """Reihe alle zurückgestellten Events am Ende der Warteschlange ein."""
+
+        self.events.extend(self.deferred)
+        self.deferred.clear()
+
+    def get_state(self) -> dict:
+        """Ausstehende Events im JSON-Format von :func:`event_to_json` und Zähler."""
+
+        return {
+            "events": [event_to_json(event) for event in self.events],
+            "deferred": [event_to_json(event) for event in self.deferred],
+            "coalesced": self.coalesced,
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.events = deque(event_from_json(data) for data in state["events"])
+        self.deferred = deque(event_from_json(data) for data in state.get("deferred", []))
+        self.coalesced = int(state["coalesced"])
+
+    def pop(self) -> Event:
+        event = self.events.popleft()
+        while self.events and event.kind in COALESCED_KINDS and self.events[0].kind == event.kind:
+            event = coalesce(event, self.events.popleft())
+            self.coalesced += 1
+        return event
+
+
 def iter_by_kind(events: Iterable[Event], kind: Event.kind) -> Iterable[Event]:
     """Filtere Events nach ihrem Typ."""
 
@@ -52,4 +128,11 @@ def debug_match(event: Event) -> str:
             return "unknown"
 
 
-__all__ = ["make_event", "iter_by_kind", "debug_match"]
+__all__ = [
+    "COALESCED_KINDS",
+    "EventQueue",
+    "coalesce",
+    "make_event",
+    "iter_by_kind",
+    "debug_match",
+]
@@ -2,40 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from .biocortex import BioCortex
 from .field import Field
 from .types import Hotspot
 
+if TYPE_CHECKING:  # pragma: no cover - nur für Typprüfung
+    import numpy as np
 
-def detect_hotspots(field: Field, threshold: float = 0.6) -> list[Hotspot]:
-    """Ermittle Hotspots im Feld."""
 
-    return field.hotspots(threshold)
+HOTSPOT_THRESHOLD = 0.6
+
+
+def detect_hotspots(
+    field: Field,
+    threshold: float = HOTSPOT_THRESHOLD,
+    *,
+    merge: bool = True,
+    top_n: int | None = None,
+    mask: np.ndarray | None = None,
+) -> list[Hotspot]:
+    """Ermittle Hotspots im Feld, standardmäßig ein Hotspot pro Region.
+
+    ``mask`` übernimmt eine bereits berechnete Schwellenmaske (z. B. aus
+    :meth:`HPIO.tick`).
+    """
+
+    return field.hotspots(threshold, merge=merge, top_n=top_n, mask=mask)
 
 
 def apply_feedback(biocortex: BioCortex, hotspots: Iterable[Hotspot]) -> dict:
-    """Verstärkt Myzel-Kanten basierend auf Hotspots."""
+    """Verstärkt Myzel-Kanten basierend auf Hotspots.
+
+    Jeder Hotspot verstärkt die aktuell stärkste Pheromon-Kante. Da die
+    Verstärkung diese Kante nur weiter stärkt, wird sie einmal nachgeschlagen
+    und die Summe aller Beträge in einem einzigen ``reinforce`` angewendet.
+    """
 
     reinforcements = []
+    strongest = biocortex.graph.strongest_edge()
+    if strongest is None:
+        return {"reinforcements": reinforcements, "count": 0}
+    (a, b), _ = strongest
+    total = 0.0
     for hotspot in hotspots:
-        y, x = hotspot.position
         value = hotspot.value
-        edges = sorted(
-            biocortex.graph.pheromones.items(),
-            key=lambda item: item[1],
-            reverse=True,
-        )
-        if not edges:
-            continue
-        ((a, b), pher) = edges[0]
         amount = value * (1.0 + biocortex.neuromod.dopamine)
-        biocortex.graph.reinforce([a, b], amount=amount)
         biocortex.replay.add([a, b])
         biocortex.neuromod.apply_reward(value * 0.1)
         reinforcements.append(((a, b), amount))
+        total += amount
+    if reinforcements:
+        biocortex.graph.reinforce([a, b], amount=total)
     return {"reinforcements": reinforcements, "count": len(reinforcements)}
 
 
-__all__ = ["detect_hotspots", "apply_feedback"]
+__all__ = ["HOTSPOT_THRESHOLD", "detect_hotspots", "apply_feedback"]
@@ -3,84 +3,350 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from .types import Hotspot, Pulse
-from .utils import gaussian_2d
+from .utils import gaussian_2d, gaussian_kernel, kernel_anchor
+
+if TYPE_CHECKING:  # pragma: no cover - nur für Typprüfung
+    import numpy as np
+
+    from .config import FieldConfig
+
+FIELD_BACKENDS = ("python", "numpy", "tiled", "sparse")
+FIELD_BOUNDARIES = ("edge", "reflect", "periodic")
+
+
+def neighbor_table(
+    shape: tuple[int, int], boundary: str = "edge"
+) -> list[list[list[tuple[int, int]]]]:
+    """Kreuznachbarn (oben, unten, links, rechts) jeder Zelle je Randbedingung.
+
+    ``edge`` lässt fehlende Nachbarn weg, ``reflect`` ersetzt sie durch die
+    Zelle selbst, ``periodic`` schließt das Feld zum Torus.
+    """
+
+    if boundary not in FIELD_BOUNDARIES:
+        raise ValueError(f"unknown field boundary {boundary!r}, expected one of {FIELD_BOUNDARIES}")
+    h, w = shape
+    table = []
+    for y in range(h):
+        row = []
+        for x in range(w):
+            cells = []
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < h and 0 <= nx < w:
+                    cells.append((ny, nx))
+                elif boundary == "reflect":
+                    cells.append((y, x))
+                elif boundary == "periodic":
+                    cells.append((ny % h, nx % w))
+            row.append(cells)
+        table.append(row)
+    return table
 
 
 class Field:
-    """Repräsentiert das 2D-Feld Φ."""
+    """Repräsentiert das 2D-Feld Φ.
+
+    Standardmäßig wird der Gauß eines Pulses über das ganze Feld
+    ausgewertet. Mit ``truncate`` wird er nur im Fenster
+    ``±ceil(truncate·σ)`` um sein Zentrum aus einem zwischengespeicherten
+    Kernel geschrieben, dessen Zentrum auf 1/8 Zelle gerundet ist.
+    ``boundary`` wählt die Randbedingung der Diffusion (siehe
+    :func:`neighbor_table`).
+
+    :meth:`fused_tick` hält in ``tick_change`` fest, wie stark sich Φ
+    gegenüber dem vorigen Tick verändert hat: Masseänderung, eine obere
+    Schranke der größten Zelländerung (einschließlich der seitdem
+    injizierten Pulse) und das neue Maximum. So muss
+    :class:`~symbio.quiescence.QuiescenceMonitor` keine Kopie des Felds
+    vergleichen.
+    """
 
-    def __init__(self, shape: tuple[int, int]) -> None:
+    tick_change: tuple[float, float, float] | None = None
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        *,
+        truncate: float | None = None,
+        boundary: str = "edge",
+    ) -> None:
         self.shape = shape
+        self.truncate = truncate
+        self.boundary = boundary
+        self._neighbors = neighbor_table(shape, boundary)
         self.phi = [[0.0 for _ in range(shape[1])] for _ in range(shape[0])]
         self.imprint: list[list[dict[str, float]]] = [
             [defaultdict(float) for _ in range(shape[1])] for _ in range(shape[0])
         ]
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
 
     def relax(self, alpha: float = 0.1) -> None:
         """Einfache Diffusion mit Kreuznachbarn."""
 
         h, w = self.shape
         new_phi = [[0.0 for _ in range(w)] for _ in range(h)]
-        new_imprint: list[list[defaultdict[str, float]]] = [
-            [defaultdict(float) for _ in range(w)] for _ in range(h)
-        ]
         for y in range(h):
             for x in range(w):
-                neighbors = []
-                neighbor_tags = []
-                if y > 0:
-                    neighbors.append(self.phi[y - 1][x])
-                    neighbor_tags.append(self.imprint[y - 1][x])
-                if y < h - 1:
-                    neighbors.append(self.phi[y + 1][x])
-                    neighbor_tags.append(self.imprint[y + 1][x])
-                if x > 0:
-                    neighbors.append(self.phi[y][x - 1])
-                    neighbor_tags.append(self.imprint[y][x - 1])
-                if x < w - 1:
-                    neighbors.append(self.phi[y][x + 1])
-                    neighbor_tags.append(self.imprint[y][x + 1])
+                neighbors = [self.phi[ny][nx] for ny, nx in self._neighbors[y][x]]
                 if neighbors:
                     avg = sum(neighbors) / len(neighbors)
                     new_phi[y][x] = self.phi[y][x] + alpha * (avg - self.phi[y][x])
                 else:
                     new_phi[y][x] = self.phi[y][x]
-                new_imprint[y][x] = self._diffuse_tags(
-                    self.imprint[y][x], neighbor_tags, alpha
-                )
         self.phi = new_phi
-        self.imprint = new_imprint
+        self._relax_imprint(alpha)
 
     def evaporate(self, rate: float) -> None:
         factor = max(0.0, 1.0 - rate)
         for y in range(self.shape[0]):
             for x in range(self.shape[1]):
                 self.phi[y][x] *= factor
+        self._evaporate_imprint(factor)
+
+    def relax_n(self, alpha: float, n: int, evaporate_rate: float = 0.0) -> None:
+        """Wende ``n``-mal ``relax`` gefolgt von ``evaporate`` an."""
+
+        for _ in range(n):
+            self.relax(alpha)
+            self.evaporate(evaporate_rate)
+
+    def fused_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        """``argmax`` vor der Diffusion, dann ``relax`` und ``evaporate``.
+
+        Liefert Position und Wert des Maximums sowie die Kandidatenmaske
+        ``Φ >= threshold`` nach dem Schritt, falls das Backend sie im selben
+        Durchlauf berechnen kann (sonst ``None``). Die Listenfassung rechnet
+        Diffusion und Verdunstung von Φ in einer Schleife und füllt dabei
+        ``tick_change``.
+        """
+
+        best_pos, best_val = self.argmax()
+        h, w = self.shape
+        factor = max(0.0, 1.0 - rate)
+        phi = self.phi
+        new_phi = []
+        mass_before = mass_after = max_delta = 0.0
+        peak = float("-inf")
+        for y in range(h):
+            row = phi[y]
+            neighbors_row = self._neighbors[y]
+            new_row = []
+            for x in range(w):
+                value = row[x]
+                cells = neighbors_row[x]
+                if cells:
+                    avg = sum(phi[ny][nx] for ny, nx in cells) / len(cells)
+                    relaxed = value + alpha * (avg - value)
+                else:
+                    relaxed = value
+                relaxed *= factor
+                new_row.append(relaxed)
+                mass_before += value
+                mass_after += relaxed
+                delta = abs(relaxed - value)
+                if delta > max_delta:
+                    max_delta = delta
+                if relaxed > peak:
+                    peak = relaxed
+            new_phi.append(new_row)
+        self.phi = new_phi
+        self._relax_imprint(alpha)
+        self._evaporate_imprint(factor)
+        self.tick_change = (
+            mass_after - mass_before + self._injected_mass,
+            max_delta + self._injected_peak,
+            peak,
+        )
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
+        return best_pos, best_val, None
+
+    def _sequential_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        """``argmax``, ``relax`` und ``evaporate`` nacheinander (für Backends)."""
+
+        best_pos, best_val = self.argmax()
+        self.relax(alpha)
+        self.evaporate(rate)
+        return best_pos, best_val, None
+
+    def inject_gaussian(self, pulse: Pulse) -> None:
+        if self.truncate is None:
+            gauss = gaussian_2d(self.shape, pulse.position, pulse.spread, pulse.amplitude)
+            for y in range(self.shape[0]):
+                for x in range(self.shape[1]):
+                    self.phi[y][x] += gauss[y][x]
+            self._imprint_gaussian(pulse.tag, gauss)
+            self._injected_mass += sum(map(sum, gauss))
+            self._injected_peak += abs(pulse.amplitude)
+            return
+        h, w = self.shape
+        (cy, cx), offset = kernel_anchor(pulse.position)
+        kernel = gaussian_kernel(pulse.spread, offset, self.truncate)
+        radius = len(kernel) // 2
+        self._injected_peak += abs(pulse.amplitude)
+        for ky, kernel_row in enumerate(kernel):
+            y = cy - radius + ky
+            if not 0 <= y < h:
+                continue
+            phi_row = self.phi[y]
+            imprint_row = self.imprint[y]
+            for kx, weight in enumerate(kernel_row):
+                x = cx - radius + kx
+                if 0 <= x < w:
+                    value = pulse.amplitude * weight
+                    phi_row[x] += value
+                    self._injected_mass += value
+                    if value > 0.0:
+                        imprint_row[x][pulse.tag] += value
+
+    def inject_many(self, pulses: Iterable[Pulse]) -> None:
+        """Injiziere mehrere Pulse in einem Aufruf."""
+
+        for pulse in pulses:
+            self.inject_gaussian(pulse)
+
+    def hotspots(
+        self,
+        threshold: float = 0.5,
+        *,
+        merge: bool = False,
+        top_n: int | None = None,
+        radius: int = 1,
+        mask: np.ndarray | None = None,
+    ) -> list[Hotspot]:
+        """Zellen mit ``Φ >= threshold``.
+
+        Mit ``merge=True`` bleiben nur lokale Maxima im Fenster ``±radius``
+        übrig (Non-Maximum-Suppression); ihre Tags werden über die Fensterzellen
+        oberhalb der Schwelle summiert. Zusammengefasste oder per ``top_n``
+        begrenzte Ergebnisse sind absteigend nach Wert sortiert. ``mask`` ist
+        eine bereits berechnete Maske ``Φ >= threshold`` (siehe
+        :meth:`fused_tick`) und erspart den Schwellenvergleich.
+        """
+
+        if merge:
+            peaks = self._peak_hotspots(threshold, radius, mask)
+            return rank_hotspots(peaks, top_n, always_sort=True)
+        hotspots: list[Hotspot] = []
+        for y, row in enumerate(self.phi):
+            for x, value in enumerate(row):
+                if mask[y][x] if mask is not None else value >= threshold:
+                    tags = self.cell_tags(y, x)
+                    hotspots.append(Hotspot(position=(y, x), value=value, tags=tags))
+        return rank_hotspots(hotspots, top_n)
+
+    def cell_tags(self, y: int, x: int) -> dict[str, float]:
+        """Kopie der Tag-Imprints einer Zelle."""
+
+        return dict(self.imprint[y][x])
+
+    def get_state(self) -> dict:
+        """Φ und Tag-Imprints als Arrays; fehlende Tags einer Zelle sind ``NaN``."""
+
+        import numpy as np
+
+        tags = sorted({tag for row in self.imprint for cell in row for tag in cell})
+        channels = {tag: ch for ch, tag in enumerate(tags)}
+        imprint = np.full((len(tags), *self.shape), np.nan)
+        for y, row in enumerate(self.imprint):
+            for x, cell in enumerate(row):
+                for tag, value in cell.items():
+                    imprint[channels[tag], y, x] = value
+        return {"phi": np.array(self.phi, dtype=np.float64), "tags": tags, "imprint": imprint}
+
+    def set_state(self, state: dict) -> None:
+        """Stelle einen mit :meth:`get_state` gesicherten Zustand wieder her."""
+
+        import numpy as np
+
+        phi = np.asarray(state["phi"], dtype=np.float64)
+        imprint = np.asarray(state["imprint"])
+        check_field_state(self.shape, phi.shape, imprint.shape, len(state["tags"]))
+        self.phi = phi.tolist()
+        self.tick_change = None
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
+        h, w = self.shape
+        self.imprint = [[defaultdict(float) for _ in range(w)] for _ in range(h)]
+        for ch, y, x in zip(*np.nonzero(~np.isnan(imprint))):
+            self.imprint[y][x][state["tags"][ch]] = float(imprint[ch, y, x])
+
+    def argmax(self) -> tuple[tuple[int, int] | None, float]:
+        """Position und Wert des ersten Maximums von Φ."""
+
+        best_val = float("-inf")
+        best_pos = None
+        for y, row in enumerate(self.phi):
+            for x, value in enumerate(row):
+                if value > best_val:
+                    best_val = value
+                    best_pos = (y, x)
+        return best_pos, best_val
+
+    def _peak_hotspots(
+        self, threshold: float, radius: int, mask: np.ndarray | None = None
+    ) -> list[Hotspot]:
+        h, w = self.shape
+        peaks: list[Hotspot] = []
+        for y in range(h):
+            for x in range(w):
+                value = self.phi[y][x]
+                if not (mask[y][x] if mask is not None else value >= threshold):
+                    continue
+                window = [
+                    (yy, xx)
+                    for yy in range(max(0, y - radius), min(h, y + radius + 1))
+                    for xx in range(max(0, x - radius), min(w, x + radius + 1))
+                ]
+                # Plateaus: die erste Zelle in Zeilenreihenfolge gewinnt.
+                if any(
+                    self.phi[yy][xx] > value or ((yy, xx) < (y, x) and self.phi[yy][xx] == value)
+                    for yy, xx in window
+                ):
+                    continue
+                tags: dict[str, float] = defaultdict(float)
+                for yy, xx in window:
+                    if self.phi[yy][xx] >= threshold:
+                        for tag, strength in self.cell_tags(yy, xx).items():
+                            tags[tag] += strength
+                peaks.append(Hotspot(position=(y, x), value=value, tags=dict(tags)))
+        return peaks
+
+    def _relax_imprint(self, alpha: float) -> None:
+        h, w = self.shape
+        new_imprint: list[list[defaultdict[str, float]]] = [
+            [defaultdict(float) for _ in range(w)] for _ in range(h)
+        ]
+        for y in range(h):
+            for x in range(w):
+                neighbor_tags = [self.imprint[ny][nx] for ny, nx in self._neighbors[y][x]]
+                new_imprint[y][x] = self._diffuse_tags(
+                    self.imprint[y][x], neighbor_tags, alpha
+                )
+        self.imprint = new_imprint
+
+    def _evaporate_imprint(self, factor: float) -> None:
+        for y in range(self.shape[0]):
+            for x in range(self.shape[1]):
                 cell = self.imprint[y][x]
                 for tag in list(cell.keys()):
                     cell[tag] *= factor
                     if cell[tag] < 1e-6:
                         del cell[tag]
 
-    def inject_gaussian(self, pulse: Pulse) -> None:
-        gauss = gaussian_2d(self.shape, pulse.position, pulse.spread, pulse.amplitude)
+    def _imprint_gaussian(self, tag: str, gauss: list[list[float]]) -> None:
         for y in range(self.shape[0]):
             for x in range(self.shape[1]):
-                self.phi[y][x] += gauss[y][x]
                 if gauss[y][x] > 0.0:
-                    self.imprint[y][x][pulse.tag] += gauss[y][x]
-
-    def hotspots(self, threshold: float = 0.5) -> list[Hotspot]:
-        hotspots: list[Hotspot] = []
-        for y, row in enumerate(self.phi):
-            for x, value in enumerate(row):
-                if value >= threshold:
-                    tags = dict(self.imprint[y][x])
-                    hotspots.append(Hotspot(position=(y, x), value=value, tags=tags))
-        return hotspots
+                    self.imprint[y][x][tag] += gauss[y][x]
 
     def _diffuse_tags(
         self,
@@ -104,4 +370,92 @@ class Field:
         return defaultdict(float, updated)
 
 
-__all__ = ["Field"]
+def check_field_state(
+    shape: tuple[int, int],
+    phi_shape: tuple[int, ...],
+    imprint_shape: tuple[int, ...],
+    n_tags: int,
+) -> None:
+    """Prüfe, ob ein gesicherter Feldzustand zur Feldgröße ``shape`` passt."""
+
+    expected = (n_tags, *shape)
+    if tuple(phi_shape) != tuple(shape) or tuple(imprint_shape) != expected:
+        raise ValueError(
+            f"field state has phi {tuple(phi_shape)} and imprint {tuple(imprint_shape)}, "
+            f"expected {tuple(shape)} and {expected}"
+        )
+
+
+def rank_hotspots(
+    hotspots: list[Hotspot], top_n: int | None = None, *, always_sort: bool = False
+) -> list[Hotspot]:
+    """Sortiere Hotspots absteigend nach Wert und begrenze auf ``top_n``.
+
+    Ohne ``top_n`` und ``always_sort`` bleibt die Zeilenreihenfolge erhalten.
+    """
+
+    if top_n is None and not always_sort:
+        return hotspots
+    ranked = sorted(hotspots, key=lambda spot: spot.value, reverse=True)
+    return ranked if top_n is None else ranked[: max(top_n, 0)]
+
+
+def create_field(config: "FieldConfig") -> Field:
+    """Erzeuge ein Feld mit dem in ``config.backend`` gewählten Backend."""
+
+    match config.backend:
+        case "python":
+            if config.dtype != "float64":
+                raise ValueError("the python field backend only supports dtype 'float64'")
+            return Field(
+                config.shape, truncate=config.kernel_truncate, boundary=config.boundary
+            )
+        case "numpy":
+            from .field_numpy import NumpyField
+
+            return NumpyField(
+                config.shape,
+                truncate=config.kernel_truncate,
+                boundary=config.boundary,
+                tag_floor=config.tag_floor,
+                dtype=config.dtype,
+            )
+        case "tiled":
+            from .field_tiled import TiledField
+
+            return TiledField(
+                config.shape,
+                workers=config.workers,
+                tile_rows=config.tile_rows,
+                truncate=config.kernel_truncate,
+                boundary=config.boundary,
+                tag_floor=config.tag_floor,
+                dtype=config.dtype,
+            )
+        case "sparse":
+            from .field_sparse import SparseField
+
+            return SparseField(
+                config.shape,
+                block_size=config.block_size,
+                block_floor=config.block_floor,
+                truncate=config.kernel_truncate,
+                boundary=config.boundary,
+                tag_floor=config.tag_floor,
+                dtype=config.dtype,
+            )
+        case _:
+            raise ValueError(
+                f"unknown field backend {config.backend!r}, expected one of {FIELD_BACKENDS}"
+            )
+
+
+__all__ = [
+    "Field",
+    "FIELD_BACKENDS",
+    "FIELD_BOUNDARIES",
+    "check_field_state",
+    "create_field",
+    "neighbor_table",
+    "rank_hotspots",
+]
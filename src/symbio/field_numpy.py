@@ -0,0 +1,597 @@
+"""NumPy-Backend für das Φ-Feld."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+
+from .field import FIELD_BOUNDARIES, Field, check_field_state, rank_hotspots
+from .types import Hotspot, Pulse
+from .utils import gaussian_kernel, kernel_anchor
+
+_TAG_EPSILON = 1e-6
+FIELD_DTYPES = ("float64", "float32", "float16")
+TICK_CHUNK_ROWS = 64
+
+
+def neighbor_count(shape: tuple[int, int], boundary: str = "edge") -> np.ndarray:
+    """Anzahl der Kreuznachbarn je Zelle (bei ``edge`` haben Randzellen weniger)."""
+
+    if boundary != "edge":
+        return np.full(shape, 4.0, dtype=np.float64)
+    count = np.zeros(shape, dtype=np.float64)
+    count[1:, :] += 1.0
+    count[:-1, :] += 1.0
+    count[:, 1:] += 1.0
+    count[:, :-1] += 1.0
+    return count
+
+
+@lru_cache(maxsize=256)
+def kernel_array(sigma: float, offset: tuple[float, float], truncate: float) -> np.ndarray:
+    """Schreibgeschützte ndarray-Fassung von :func:`gaussian_kernel`."""
+
+    kernel = np.array(gaussian_kernel(sigma, offset, truncate), dtype=np.float64)
+    kernel.setflags(write=False)
+    return kernel
+
+
+def relax_region(
+    src: np.ndarray,
+    dst: np.ndarray,
+    alpha: float | np.ndarray,
+    count: np.ndarray,
+    rows: tuple[int, int],
+    cols: tuple[int, int],
+    boundary: str = "edge",
+) -> None:
+    """Schreibe einen Diffusionsschritt für ``[y0:y1, x0:x1]`` nach ``dst``.
+
+    Die Stencil-Operation arbeitet über die letzten beiden Achsen, führende
+    Achsen (z. B. Tag-Kanäle) werden mitgeführt; ``alpha`` darf ein dagegen
+    broadcastbares Array sein. Die Summationsreihenfolge
+    (oben, unten, links, rechts) und die Randbedingungen entsprechen der
+    Listen-Implementierung. Speicher unter 32 Bit (float16) wird in einem
+    float32-Zwischenpuffer akkumuliert und erst am Ende gerundet.
+    """
+
+    h, w = src.shape[-2:]
+    y0, y1 = rows
+    x0, x1 = cols
+    target = dst[..., y0:y1, x0:x1]
+    if dst.dtype.itemsize < 4:
+        out = np.zeros(target.shape, dtype=np.float32)
+    else:
+        out = target
+        out.fill(0.0)
+    top = max(y0, 1)
+    out[..., top - y0 :, :] = src[..., top - 1 : y1 - 1, x0:x1]
+    wrap = boundary == "periodic"
+    ghosts = boundary != "edge"
+    if ghosts and y0 == 0:
+        out[..., 0, :] = src[..., h - 1 if wrap else 0, x0:x1]
+    bottom = min(y1, h - 1)
+    out[..., : bottom - y0, :] += src[..., y0 + 1 : bottom + 1, x0:x1]
+    if ghosts and y1 == h:
+        out[..., -1, :] += src[..., 0 if wrap else h - 1, x0:x1]
+    left = max(x0, 1)
+    out[..., :, left - x0 :] += src[..., y0:y1, left - 1 : x1 - 1]
+    if ghosts and x0 == 0:
+        out[..., :, 0] += src[..., y0:y1, w - 1 if wrap else 0]
+    right = min(x1, w - 1)
+    out[..., :, : right - x0] += src[..., y0:y1, x0 + 1 : right + 1]
+    if ghosts and x1 == w:
+        out[..., :, -1] += src[..., y0:y1, 0 if wrap else w - 1]
+    out /= count[y0:y1, x0:x1]
+    center = src[..., y0:y1, x0:x1]
+    out -= center
+    out *= alpha
+    out += center
+    if out is not target:
+        target[...] = out
+
+
+def spectral_decay(
+    shape: tuple[int, int], boundary: str, alpha: float, n: int, evaporate_rate: float
+) -> np.ndarray:
+    """Abklingfaktoren je Mode für ``n`` Schritte aus ``relax`` und ``evaporate``.
+
+    Ein Schritt multipliziert die Mode ``(ky, kx)`` mit
+    ``(1 - α + α·(cos θy + cos θx)/2)·(1 - rate)`` mit ``θ = 2πk/N`` über
+    das rFFT-Halbspektrum. Für ``reflect`` gilt das für die gespiegelte
+    Erweiterung der Größe ``(2H, 2W)`` (siehe :func:`spectral_relax`).
+    """
+
+    h, w = shape
+    if boundary == "reflect":
+        h, w = 2 * h, 2 * w
+    elif boundary != "periodic":
+        raise ValueError(f"no spectral form for boundary {boundary!r}")
+    theta_y = 2.0 * np.pi * np.arange(h) / h
+    theta_x = 2.0 * np.pi * np.arange(w // 2 + 1) / w
+    step = (1.0 - alpha) + alpha * (np.cos(theta_y)[:, None] + np.cos(theta_x)[None, :]) / 2.0
+    return (step * max(0.0, 1.0 - evaporate_rate)) ** n
+
+
+def spectral_relax(values: np.ndarray, boundary: str, decay: np.ndarray) -> np.ndarray:
+    """Wende vorberechnete Abklingfaktoren über die letzten beiden Achsen an.
+
+    ``reflect`` ersetzt einen fehlenden Nachbarn durch die Zelle selbst; das
+    ist dieselbe Diffusion wie ``periodic`` auf der halbzellig gespiegelten
+    Erweiterung ``[x, x[::-1]]`` je Achse. Statt einer dichten DCT-Matrix
+    (O(N³) je Achse) läuft daher auch ``reflect`` als rFFT in O(N² log N).
+    """
+
+    h, w = values.shape[-2:]
+    data = values.astype(np.float64, copy=False)
+    if boundary == "reflect":
+        data = np.concatenate([data, data[..., ::-1, :]], axis=-2)
+        data = np.concatenate([data, data[..., ::-1]], axis=-1)
+    spectrum = np.fft.rfft2(data, axes=(-2, -1))
+    spectrum *= decay
+    result = np.fft.irfft2(spectrum, s=data.shape[-2:], axes=(-2, -1))
+    return result[..., :h, :w]
+
+
+def local_maxima(values: np.ndarray, mask: np.ndarray, radius: int) -> np.ndarray:
+    """Maske der lokalen Maxima im Fenster ``±radius`` (erste Zelle gewinnt Plateaus)."""
+
+    h, w = values.shape
+    padded = np.full((h + 2 * radius, w + 2 * radius), -np.inf, dtype=values.dtype)
+    padded[radius : radius + h, radius : radius + w] = values
+    peaks = mask.copy()
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if dy == 0 and dx == 0:
+                continue
+            neighbor = padded[radius + dy : radius + dy + h, radius + dx : radius + dx + w]
+            if (dy, dx) < (0, 0):
+                peaks &= values > neighbor
+            else:
+                peaks &= values >= neighbor
+    return peaks
+
+
+class NumpyField(Field):
+    """Φ-Feld auf Basis von ``numpy.ndarray`` mit zwei getauschten Puffern.
+
+    Tag-Imprints liegen als dichter Tensor ``(n_tags, H, W)`` vor,
+    ``channels`` ordnet jedem Tag seinen Kanal zu. Kanäle, deren Gesamtmasse
+    unter ``tag_floor`` fällt, werden beim Verdunsten entfernt.
+
+    ``dtype`` wählt den Speichertyp von Φ (``float64``, ``float32`` oder
+    ``float16``); die Tags nutzen höchstens float32. Diffusion in float16
+    akkumuliert in float32.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        *,
+        truncate: float | None = None,
+        boundary: str = "edge",
+        tag_floor: float = 1e-6,
+        dtype: str = "float64",
+    ) -> None:
+        if boundary not in FIELD_BOUNDARIES:
+            raise ValueError(
+                f"unknown field boundary {boundary!r}, expected one of {FIELD_BOUNDARIES}"
+            )
+        if dtype not in FIELD_DTYPES:
+            raise ValueError(f"unknown field dtype {dtype!r}, expected one of {FIELD_DTYPES}")
+        self.shape = shape
+        self.truncate = truncate
+        self.boundary = boundary
+        self.tag_floor = tag_floor
+        self.channels: dict[str, int] = {}
+        self.dtype = np.dtype(dtype)
+        tag_dtype = min(self.dtype, np.dtype(np.float32), key=lambda dt: dt.itemsize)
+        self._phi = self._allocate(shape, self.dtype)
+        self._buffer = self._allocate(shape, self.dtype)
+        self._tags = self._allocate((0, *shape), tag_dtype)
+        self._tag_buffer = self._allocate((0, *shape), tag_dtype)
+        self._count = neighbor_count(shape, boundary)
+        self._isolated = shape == (1, 1) and boundary == "edge"
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
+
+    @property
+    def phi(self) -> np.ndarray:
+        return self._phi
+
+    @phi.setter
+    def phi(self, value) -> None:
+        self._phi[...] = value
+
+    @property
+    def imprint(self) -> np.ndarray:
+        """Aktive Tag-Kanäle als ``(n_tags, H, W)``-Ansicht."""
+
+        return self._tags[: len(self.channels)]
+
+    def relax(self, alpha: float = 0.1) -> None:
+        """Vektorisierte Diffusion mit Kreuznachbarn."""
+
+        if self._isolated:
+            return
+        h, w = self.shape
+        full = ((0, h), (0, w))
+        relax_region(self._phi, self._buffer, alpha, self._count, *full, self.boundary)
+        self._phi, self._buffer = self._buffer, self._phi
+        n = len(self.channels)
+        if n:
+            relax_region(
+                self._tags[:n], self._tag_buffer[:n], alpha, self._count, *full, self.boundary
+            )
+            self._tags, self._tag_buffer = self._tag_buffer, self._tags
+            self._clear_small_tags(n, inclusive=True)
+
+    def relax_n(self, alpha: float, n: int, evaporate_rate: float = 0.0) -> None:
+        """Spule ``n`` Schritte aus ``relax`` und ``evaporate`` vor.
+
+        Für ``reflect`` und ``periodic`` werden die Abklingfaktoren der
+        diskreten Laplace-Moden per FFT direkt potenziert; die Kosten hängen
+        dann nicht von ``n`` ab. Die Standard-Randbedingung ``edge`` mittelt
+        nur über vorhandene Nachbarn; ihr Operator zerfällt weder in Achsen
+        noch in Fourier-Moden, daher laufen dort alle ``n`` Schritte einzeln
+        zum vollen Preis. Die Kleinstwert-Bereinigung der Tags erfolgt im
+        spektralen Pfad nur einmal am Ende.
+        """
+
+        if n <= 0:
+            return
+        if self.boundary == "edge":
+            super().relax_n(alpha, n, evaporate_rate)
+            return
+        decay = spectral_decay(self.shape, self.boundary, alpha, n, evaporate_rate)
+        self._phi[...] = spectral_relax(self._phi, self.boundary, decay)
+        count = len(self.channels)
+        if count:
+            self._tags[:count] = spectral_relax(self._tags[:count], self.boundary, decay)
+            self._clear_small_tags(count, inclusive=True)
+            self._drop_faint_channels()
+
+    def fused_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        """Diffusion, Verdunstung, ``argmax`` und Schwellenmaske in einem Durchlauf.
+
+        Das Gitter wird in Zeilenbändern von ``TICK_CHUNK_ROWS`` Zeilen
+        durchlaufen, sodass jedes Band nur einmal aus dem Speicher gelesen und
+        geschrieben wird. Die Ergebnisse sind bitgleich mit ``argmax``,
+        ``relax``, ``evaporate`` und ``phi >= threshold`` nacheinander.
+        """
+
+        if self._isolated or self._phi.size == 0:
+            return self._sequential_tick(alpha, rate, threshold)
+        h, w = self.shape
+        factor = max(0.0, 1.0 - rate)
+        n = len(self.channels)
+        src, dst = self._phi, self._buffer
+        mask = None if threshold is None else np.empty(self.shape, dtype=bool)
+        best_pos, best_val = None, float("-inf")
+        mass_change = max_delta = 0.0
+        peak = float("-inf")
+        for y0 in range(0, h, TICK_CHUNK_ROWS):
+            y1 = min(h, y0 + TICK_CHUNK_ROWS)
+            band = src[y0:y1]
+            flat = int(np.argmax(band))
+            value = float(band.flat[flat])
+            if value > best_val:
+                dy, dx = divmod(flat, w)
+                best_pos, best_val = (y0 + dy, dx), value
+            relax_region(src, dst, alpha, self._count, (y0, y1), (0, w), self.boundary)
+            out = dst[y0:y1]
+            out *= factor
+            mass_change += float(out.sum(dtype=np.float64)) - float(band.sum(dtype=np.float64))
+            max_delta = max(max_delta, float(np.abs(out - band).max()))
+            peak = max(peak, float(out.max()))
+            if mask is not None:
+                np.greater_equal(out, threshold, out=mask[y0:y1])
+            if n:
+                rows = (y0, y1)
+                relax_region(
+                    self._tags[:n], self._tag_buffer[:n], alpha, self._count, rows, (0, w), self.boundary
+                )
+                tags = self._tag_buffer[:n, y0:y1]
+                tags[tags <= _TAG_EPSILON] = 0.0
+                tags *= factor
+                tags[tags < _TAG_EPSILON] = 0.0
+        self._phi, self._buffer = dst, src
+        if n:
+            self._tags, self._tag_buffer = self._tag_buffer, self._tags
+            self._drop_faint_channels()
+        self._set_tick_change(mass_change, max_delta, peak)
+        return best_pos, best_val, mask
+
+    def _sequential_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        """Wie :meth:`Field._sequential_tick`, füllt zusätzlich ``tick_change``.
+
+        ``relax`` tauscht die Puffer, danach liegt Φ vor dem Tick unverändert
+        in ``_buffer`` (``evaporate`` schreibt nur Φ); die Änderung wird ohne
+        Kopie daraus bestimmt. Nur wenn ``relax`` nicht tauscht, wird Φ vorher
+        kopiert.
+        """
+
+        before = self._phi if self._relax_swaps() else self._phi.copy()
+        result = super()._sequential_tick(alpha, rate, threshold)
+        after = self._phi
+        if after.size:
+            self._set_tick_change(
+                float(after.sum(dtype=np.float64)) - float(before.sum(dtype=np.float64)),
+                float(np.abs(after - before).max()),
+                float(after.max()),
+            )
+        else:
+            self._set_tick_change(0.0, 0.0, float("-inf"))
+        return result
+
+    def _relax_swaps(self) -> bool:
+        return not self._isolated
+
+    def _set_tick_change(self, mass_change: float, max_delta: float, peak: float) -> None:
+        self.tick_change = (
+            mass_change + self._injected_mass,
+            max_delta + self._injected_peak,
+            peak,
+        )
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
+
+    def evaporate(self, rate: float) -> None:
+        factor = max(0.0, 1.0 - rate)
+        self._phi *= factor
+        n = len(self.channels)
+        if n:
+            self._tags[:n] *= factor
+            self._clear_small_tags(n, inclusive=False)
+            self._drop_faint_channels()
+
+    def inject_gaussian(self, pulse: Pulse) -> None:
+        if self.truncate is None:
+            channel = self._channel(pulse.tag)
+            h, w = self.shape
+            cy, cx = pulse.position
+            sigma2 = max(pulse.spread, 1e-3) ** 2
+            dy = (np.arange(h, dtype=np.float64) - cy) ** 2
+            dx = (np.arange(w, dtype=np.float64) - cx) ** 2
+            gauss = pulse.amplitude * np.exp(-(dy[:, None] + dx[None, :]) / (2 * sigma2))
+            self._phi += gauss
+            self._tags[channel] += gauss
+            self._injected_mass += float(gauss.sum())
+            self._injected_peak += abs(pulse.amplitude)
+            return
+        anchor, offset = kernel_anchor(pulse.position)
+        kernel = kernel_array(pulse.spread, offset, self.truncate)
+        window = self._window(anchor, kernel.shape[0] // 2)
+        if window is None:
+            return
+        channel = self._channel(pulse.tag)
+        target, source = window
+        values = pulse.amplitude * kernel[source]
+        self._phi[target] += values
+        self._tags[(channel, *target)] += values
+        self._injected_mass += float(values.sum())
+        self._injected_peak += abs(pulse.amplitude)
+
+    def inject_many(self, pulses: Iterable[Pulse]) -> None:
+        """Injiziere viele Pulse gebündelt.
+
+        Mit ``truncate`` werden die Pulse nach Kernel gruppiert und per
+        Scatter-Add geschrieben. Ohne Abschneiden ist jede Gaußglocke das
+        äußere Produkt zweier Zeilen- und Spaltenprofile; die Pulse einer
+        Gruppe ``(σ, Kanal)`` ergeben so eine einzige Ablagekarte
+        ``Gyᵀ·Gx``, die einmal auf Φ und den Tag-Kanal addiert wird.
+        """
+
+        pulses = list(pulses)
+        if len(pulses) < 2:
+            for pulse in pulses:
+                self.inject_gaussian(pulse)
+            return
+        if self.truncate is None:
+            self._inject_dense(pulses)
+            return
+        groups: dict[tuple, list[tuple[tuple[int, int], float, int]]] = {}
+        for pulse in pulses:
+            anchor, offset = kernel_anchor(pulse.position)
+            radius = kernel_array(pulse.spread, offset, self.truncate).shape[0] // 2
+            if self._window(anchor, radius) is None:
+                continue
+            channel = self._channel(pulse.tag)
+            groups.setdefault((pulse.spread, offset), []).append(
+                (anchor, pulse.amplitude, channel)
+            )
+        h, w = self.shape
+        for (spread, offset), members in groups.items():
+            kernel = kernel_array(spread, offset, self.truncate)
+            radius = kernel.shape[0] // 2
+            span = np.arange(-radius, radius + 1)
+            anchors = np.array([anchor for anchor, _, _ in members], dtype=np.int64)
+            amplitudes = np.array([amplitude for _, amplitude, _ in members])
+            channels = np.array([channel for _, _, channel in members], dtype=np.int64)
+            block = (len(members), *kernel.shape)
+            ys = np.broadcast_to(anchors[:, 0, None, None] + span[None, :, None], block)
+            xs = np.broadcast_to(anchors[:, 1, None, None] + span[None, None, :], block)
+            inside = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+            values = amplitudes[:, None, None] * kernel[None, :, :]
+            ys, xs, values = ys[inside], xs[inside], values[inside]
+            chs = np.broadcast_to(channels[:, None, None], inside.shape)[inside]
+            np.add.at(self._phi, (ys, xs), values.astype(self._phi.dtype, copy=False))
+            np.add.at(self._tags, (chs, ys, xs), values.astype(self._tags.dtype))
+            self._injected_mass += float(values.sum())
+            self._injected_peak += float(np.abs(amplitudes).sum())
+
+    def _inject_dense(self, pulses: list[Pulse]) -> None:
+        groups: dict[tuple[float, int], list[Pulse]] = {}
+        for pulse in pulses:
+            groups.setdefault((pulse.spread, self._channel(pulse.tag)), []).append(pulse)
+        h, w = self.shape
+        rows = np.arange(h, dtype=np.float64)
+        cols = np.arange(w, dtype=np.float64)
+        for (spread, channel), members in groups.items():
+            denom = 2 * max(spread, 1e-3) ** 2
+            centers = np.array([pulse.position for pulse in members], dtype=np.float64)
+            amplitudes = np.array([pulse.amplitude for pulse in members], dtype=np.float64)
+            gy = np.exp(-((rows[None, :] - centers[:, 0, None]) ** 2) / denom) * amplitudes[:, None]
+            gx = np.exp(-((cols[None, :] - centers[:, 1, None]) ** 2) / denom)
+            deposit = gy.T @ gx
+            self._phi += deposit
+            self._tags[channel] += deposit
+            self._injected_mass += float(deposit.sum())
+            self._injected_peak += float(np.abs(amplitudes).sum())
+
+    def hotspots(
+        self,
+        threshold: float = 0.5,
+        *,
+        merge: bool = False,
+        top_n: int | None = None,
+        radius: int = 1,
+        mask: np.ndarray | None = None,
+    ) -> list[Hotspot]:
+        ys, xs = self._hotspot_cells(threshold, merge, radius, mask)
+        if merge:
+            peaks = self._peak_hotspots(ys, xs, threshold, radius)
+            return rank_hotspots(peaks, top_n, always_sort=True)
+        if top_n is not None and ys.size > top_n:
+            values = self._phi[ys, xs]
+            keep = np.sort(np.argsort(-values, kind="stable")[: max(top_n, 0)])
+            ys, xs = ys[keep], xs[keep]
+        tags = self._tags[: len(self.channels), ys, xs]
+        return rank_hotspots(self._build_hotspots(ys, xs, self._phi[ys, xs], tags), top_n)
+
+    def cell_tags(self, y: int, x: int) -> dict[str, float]:
+        column = self._tags[: len(self.channels), y, x]
+        return {tag: float(column[ch]) for tag, ch in self.channels.items() if column[ch] > 0.0}
+
+    def argmax(self) -> tuple[tuple[int, int] | None, float]:
+        if self._phi.size == 0:
+            return None, float("-inf")
+        flat = int(np.argmax(self._phi))
+        y, x = divmod(flat, self.shape[1])
+        return (y, x), float(self._phi[y, x])
+
+    def get_state(self) -> dict:
+        order = sorted(self.channels, key=self.channels.get)
+        return {"phi": self._phi.copy(), "tags": order, "imprint": self.imprint.copy()}
+
+    def set_state(self, state: dict) -> None:
+        tags = list(state["tags"])
+        check_field_state(
+            self.shape, np.shape(state["phi"]), np.shape(state["imprint"]), len(tags)
+        )
+        if len(tags) > self._tags.shape[0]:
+            self.channels = {}
+            self._resize_channels(len(tags))
+        self._phi[...] = state["phi"]
+        self._tags[...] = 0.0
+        self._tags[: len(tags)] = state["imprint"]
+        self.channels = {tag: ch for ch, tag in enumerate(tags)}
+        self.tick_change = None
+        self._injected_mass = 0.0
+        self._injected_peak = 0.0
+
+    def _hotspot_cells(
+        self, threshold: float, merge: bool, radius: int, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if mask is None:
+            mask = self._phi >= threshold
+        if merge:
+            mask = local_maxima(self._phi, mask, radius)
+        return np.nonzero(mask)
+
+    def _peak_hotspots(
+        self, ys: np.ndarray, xs: np.ndarray, threshold: float, radius: int
+    ) -> list[Hotspot]:
+        n = len(self.channels)
+        h, w = self.shape
+        summed = np.zeros((n, ys.size), dtype=np.float64)
+        for i, (y, x) in enumerate(zip(ys.tolist(), xs.tolist())):
+            rows = slice(max(0, y - radius), min(h, y + radius + 1))
+            cols = slice(max(0, x - radius), min(w, x + radius + 1))
+            inside = self._phi[rows, cols] >= threshold
+            summed[:, i] = (self._tags[:n, rows, cols] * inside).sum(axis=(1, 2), dtype=np.float64)
+        return self._build_hotspots(ys, xs, self._phi[ys, xs], summed)
+
+    def _build_hotspots(
+        self, ys: np.ndarray, xs: np.ndarray, values: np.ndarray, tags: np.ndarray
+    ) -> list[Hotspot]:
+        names = sorted(self.channels, key=self.channels.__getitem__)
+        hotspots = []
+        for i, (y, x, value) in enumerate(zip(ys.tolist(), xs.tolist(), values.tolist())):
+            column = tags[:, i]
+            cell = {names[ch]: float(column[ch]) for ch in np.flatnonzero(column > 0.0).tolist()}
+            hotspots.append(Hotspot(position=(y, x), value=value, tags=cell))
+        return hotspots
+
+    def _window(
+        self, anchor: tuple[int, int], radius: int
+    ) -> tuple[tuple[slice, slice], tuple[slice, slice]] | None:
+        h, w = self.shape
+        cy, cx = anchor
+        y0, y1 = max(0, cy - radius), min(h, cy + radius + 1)
+        x0, x1 = max(0, cx - radius), min(w, cx + radius + 1)
+        if y0 >= y1 or x0 >= x1:
+            return None
+        target = (slice(y0, y1), slice(x0, x1))
+        source = (
+            slice(y0 - cy + radius, y1 - cy + radius),
+            slice(x0 - cx + radius, x1 - cx + radius),
+        )
+        return target, source
+
+    def _allocate(self, shape: tuple[int, ...], dtype) -> np.ndarray:
+        return np.zeros(shape, dtype=dtype)
+
+    def _channel(self, tag: str) -> int:
+        channel = self.channels.get(tag)
+        if channel is not None:
+            return channel
+        channel = len(self.channels)
+        if channel == self._tags.shape[0]:
+            self._resize_channels(max(4, 2 * channel))
+        self.channels[tag] = channel
+        return channel
+
+    def _resize_channels(self, capacity: int) -> None:
+        n = len(self.channels)
+        tags = self._allocate((capacity, *self.shape), self._tags.dtype)
+        tags[:n] = self._tags[:n]
+        self._tags = tags
+        self._tag_buffer = self._allocate((capacity, *self.shape), self._tags.dtype)
+
+    def _clear_small_tags(self, n: int, *, inclusive: bool) -> None:
+        active = self._tags[:n]
+        mask = active <= _TAG_EPSILON if inclusive else active < _TAG_EPSILON
+        active[mask] = 0.0
+
+    def _channel_mass(self, n: int) -> np.ndarray:
+        return self._tags[:n].sum(axis=(1, 2), dtype=np.float64)
+
+    def _drop_faint_channels(self) -> None:
+        n = len(self.channels)
+        keep = self._channel_mass(n) >= self.tag_floor
+        if keep.all():
+            return
+        order = sorted(self.channels.items(), key=lambda item: item[1])
+        survivors = [tag for tag, ch in order if keep[ch]]
+        self._tags[: len(survivors)] = self._tags[:n][keep]
+        self._tags[len(survivors) : n] = 0.0
+        self.channels = {tag: ch for ch, tag in enumerate(survivors)}
+
+
+__all__ = [
+    "FIELD_DTYPES",
+    "NumpyField",
+    "kernel_array",
+    "local_maxima",
+    "neighbor_count",
+    "relax_region",
+    "spectral_decay",
+    "spectral_relax",
+]
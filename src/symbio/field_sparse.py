@@ -0,0 +1,236 @@
+"""Block-sparses Φ-Feld für große, überwiegend leere Gitter."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from .field_numpy import NumpyField, kernel_array, local_maxima, relax_region
+from .types import Pulse
+from .utils import kernel_anchor
+
+_TAG_EPSILON = 1e-6
+
+
+class SparseField(NumpyField):
+    """Φ-Feld, das nur aktive Blöcke der Größe ``block_size`` bearbeitet.
+
+    Injektionen aktivieren die berührten Blöcke. ``relax`` rechnet auf den
+    aktiven Blöcken plus einem Block Rand, ``evaporate`` verwirft Blöcke, deren
+    Betragsmaximum in Φ und allen Tag-Kanälen unter ``block_floor`` fällt.
+    Außerhalb der aktiven Menge sind Φ, Tags und beide Rechenpuffer exakt null,
+    daher entspricht das Ergebnis mit ``block_floor=0`` bitgenau
+    :class:`NumpyField`. Hotspot-Suche und ``argmax`` besuchen nur aktive
+    Blöcke; der Aufwand skaliert mit der aktiven Fläche statt der Gittergröße.
+    Ohne ``truncate`` berührt jeder Puls das ganze Feld und aktiviert alle
+    Blöcke; das Backend lohnt sich daher nur mit gesetztem ``kernel_truncate``.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        *,
+        block_size: int = 16,
+        block_floor: float = 1e-6,
+        **kwargs,
+    ) -> None:
+        super().__init__(shape, **kwargs)
+        self.block_size = max(1, block_size)
+        self.block_floor = block_floor
+        self.blocks = (-(-shape[0] // self.block_size), -(-shape[1] // self.block_size))
+        self.active: set[tuple[int, int]] = set()
+
+    @NumpyField.phi.setter
+    def phi(self, value) -> None:
+        self._phi[...] = value
+        self._activate_all()
+        self._drop_empty_blocks()
+
+    def relax(self, alpha: float = 0.1) -> None:
+        if self._isolated or not self.active:
+            return
+        margin = self._dilate(self.active)
+        n = len(self.channels)
+        for block in sorted(margin):
+            rows, cols = self._bounds(block)
+            relax_region(self._phi, self._buffer, alpha, self._count, rows, cols, self.boundary)
+            if n:
+                relax_region(
+                    self._tags[:n],
+                    self._tag_buffer[:n],
+                    alpha,
+                    self._count,
+                    rows,
+                    cols,
+                    self.boundary,
+                )
+        self._phi, self._buffer = self._buffer, self._phi
+        if n:
+            self._tags, self._tag_buffer = self._tag_buffer, self._tags
+        self.active = margin
+        if n:
+            self._clear_small_tags(n, inclusive=True)
+
+    def _relax_swaps(self) -> bool:
+        return not self._isolated and bool(self.active)
+
+    def relax_n(self, alpha: float, n: int, evaporate_rate: float = 0.0) -> None:
+        super().relax_n(alpha, n, evaporate_rate)
+        if n > 0 and self.boundary != "edge":
+            # Der spektrale Pfad schreibt das ganze Gitter.
+            self._activate_all()
+            self._drop_empty_blocks()
+
+    def fused_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        # Der Banddurchlauf über das ganze Gitter würde die aktive Menge umgehen.
+        return self._sequential_tick(alpha, rate, threshold)
+
+    def evaporate(self, rate: float) -> None:
+        factor = max(0.0, 1.0 - rate)
+        n = len(self.channels)
+        for block in self.active:
+            cells = self._slices(block)
+            self._phi[cells] *= factor
+            if n:
+                self._tags[(slice(0, n), *cells)] *= factor
+        if n:
+            self._clear_small_tags(n, inclusive=False)
+        self._drop_empty_blocks()
+        if n:
+            self._drop_faint_channels()
+
+    def inject_gaussian(self, pulse: Pulse) -> None:
+        super().inject_gaussian(pulse)
+        self._touch(pulse)
+
+    def inject_many(self, pulses: Iterable[Pulse]) -> None:
+        pulses = list(pulses)
+        super().inject_many(pulses)
+        for pulse in pulses:
+            self._touch(pulse)
+
+    def argmax(self) -> tuple[tuple[int, int] | None, float]:
+        best_pos, best_val = None, float("-inf")
+        for block in self.active:
+            (y0, _), (x0, _) = self._bounds(block)
+            values = self._phi[self._slices(block)]
+            flat = int(np.argmax(values))
+            dy, dx = divmod(flat, values.shape[1])
+            pos, value = (y0 + dy, x0 + dx), float(values[dy, dx])
+            if value > best_val or (value == best_val and pos < best_pos):
+                best_pos, best_val = pos, value
+        if best_val <= 0.0:
+            # Inaktive Zellen sind null und können gewinnen.
+            return super().argmax()
+        return best_pos, best_val
+
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state["active"] = np.array(sorted(self.active), dtype=np.int64).reshape(-1, 2)
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._buffer[...] = 0.0
+        self._tag_buffer[...] = 0.0
+        self.active = {(int(by), int(bx)) for by, bx in np.asarray(state["active"]).tolist()}
+
+    def _hotspot_cells(
+        self, threshold: float, merge: bool, radius: int, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if threshold <= 0.0 or mask is not None:
+            return super()._hotspot_cells(threshold, merge, radius, mask)
+        h, w = self.shape
+        ys_parts, xs_parts = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for block in self.active:
+            (y0, y1), (x0, x1) = self._bounds(block)
+            if not merge:
+                ys, xs = np.nonzero(self._phi[y0:y1, x0:x1] >= threshold)
+            else:
+                ly, hy = max(0, y0 - radius), min(h, y1 + radius)
+                lx, hx = max(0, x0 - radius), min(w, x1 + radius)
+                slab = self._phi[ly:hy, lx:hx]
+                peaks = local_maxima(slab, slab >= threshold, radius)
+                ys, xs = np.nonzero(peaks[y0 - ly : y1 - ly, x0 - lx : x1 - lx])
+            ys_parts.append(ys + y0)
+            xs_parts.append(xs + x0)
+        ys, xs = np.concatenate(ys_parts), np.concatenate(xs_parts)
+        order = np.lexsort((xs, ys))
+        return ys[order], xs[order]
+
+    def _clear_small_tags(self, n: int, *, inclusive: bool) -> None:
+        for block in self.active:
+            active = self._tags[(slice(0, n), *self._slices(block))]
+            mask = active <= _TAG_EPSILON if inclusive else active < _TAG_EPSILON
+            active[mask] = 0.0
+
+    def _channel_mass(self, n: int) -> np.ndarray:
+        mass = np.zeros(n, dtype=np.float64)
+        for block in self.active:
+            mass += self._tags[(slice(0, n), *self._slices(block))].sum(
+                axis=(1, 2), dtype=np.float64
+            )
+        return mass
+
+    def _drop_empty_blocks(self) -> None:
+        n = len(self.channels)
+        for block in list(self.active):
+            cells = self._slices(block)
+            if np.abs(self._phi[cells]).max() >= self.block_floor:
+                continue
+            tags = self._tags[(slice(0, n), *cells)]
+            if n and tags.max() >= self.block_floor:
+                continue
+            for array in (self._phi, self._buffer):
+                array[cells] = 0.0
+            for array in (self._tags, self._tag_buffer):
+                array[(slice(None), *cells)] = 0.0
+            self.active.discard(block)
+
+    def _touch(self, pulse: Pulse) -> None:
+        if self.truncate is None:
+            self._activate_all()
+            return
+        anchor, offset = kernel_anchor(pulse.position)
+        radius = kernel_array(pulse.spread, offset, self.truncate).shape[0] // 2
+        window = self._window(anchor, radius)
+        if window is None:
+            return
+        rows, cols = window[0]
+        b = self.block_size
+        for by in range(rows.start // b, (rows.stop - 1) // b + 1):
+            for bx in range(cols.start // b, (cols.stop - 1) // b + 1):
+                self.active.add((by, bx))
+
+    def _activate_all(self) -> None:
+        self.active = {(by, bx) for by in range(self.blocks[0]) for bx in range(self.blocks[1])}
+
+    def _dilate(self, blocks: set[tuple[int, int]]) -> set[tuple[int, int]]:
+        nby, nbx = self.blocks
+        wrap = self.boundary == "periodic"
+        grown = set()
+        for by, bx in blocks:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    y, x = by + dy, bx + dx
+                    if wrap:
+                        y, x = y % nby, x % nbx
+                    if 0 <= y < nby and 0 <= x < nbx:
+                        grown.add((y, x))
+        return grown
+
+    def _bounds(self, block: tuple[int, int]) -> tuple[tuple[int, int], tuple[int, int]]:
+        b = self.block_size
+        by, bx = block
+        h, w = self.shape
+        return (by * b, min(h, (by + 1) * b)), (bx * b, min(w, (bx + 1) * b))
+
+    def _slices(self, block: tuple[int, int]) -> tuple[slice, slice]:
+        (y0, y1), (x0, x1) = self._bounds(block)
+        return slice(y0, y1), slice(x0, x1)
+
+
+__all__ = ["SparseField"]
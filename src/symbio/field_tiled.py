@@ -0,0 +1,247 @@
+"""Gekacheltes Φ-Feld mit prozessparalleler Relaxation über Shared Memory."""
+
+from __future__ import annotations
+
+import os
+import weakref
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .field_numpy import NumpyField, local_maxima, neighbor_count, relax_region
+from .utils import worker_context
+
+_ATTACHED: dict[str, SharedMemory] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    """Öffne ein Segment im Worker (zwischengespeichert pro Prozess).
+
+    Der Resource-Tracker wird mit dem Elternprozess geteilt; das Segment ist
+    dort bereits angemeldet und wird von :func:`_free` wieder abgemeldet.
+    """
+
+    shm = _ATTACHED.get(name)
+    if shm is not None:
+        return shm
+    try:
+        shm = SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = SharedMemory(name=name)
+    _ATTACHED[name] = shm
+    return shm
+
+
+def _retain(live: tuple[str, ...]) -> None:
+    """Löse im Worker alle Segmente, die das Feld inzwischen freigegeben hat."""
+
+    for name in [name for name in _ATTACHED if name not in live]:
+        try:
+            _ATTACHED.pop(name).close()
+        except BufferError:  # pragma: no cover - View aus einem laufenden Auftrag
+            pass
+
+
+def _view(name: str, shape: tuple[int, ...], dtype: str) -> np.ndarray:
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attach(name).buf)
+
+
+@lru_cache(maxsize=8)
+def _worker_count(shape: tuple[int, int], boundary: str) -> np.ndarray:
+    return neighbor_count(shape, boundary)
+
+
+def _relax_tile(task: tuple) -> None:
+    """Relaxiere ein Zeilenband von Φ und den aktiven Tag-Kanälen.
+
+    Der Ein-Zellen-Halo der Nachbarkacheln wird direkt aus dem gemeinsamen
+    Quellpuffer gelesen; die Barriere zwischen zwei Schritten ist das Ende
+    von ``Pool.map``.
+    """
+
+    (live, phi_names, phi_dtype, tag_names, tag_dtype, capacity, n_tags, shape, rows, alpha, boundary) = task
+    _retain(live)
+    count = _worker_count(shape, boundary)
+    cols = (0, shape[1])
+    src = _view(phi_names[0], shape, phi_dtype)
+    dst = _view(phi_names[1], shape, phi_dtype)
+    relax_region(src, dst, alpha, count, rows, cols, boundary)
+    if n_tags:
+        tag_shape = (capacity, *shape)
+        src = _view(tag_names[0], tag_shape, tag_dtype)[:n_tags]
+        dst = _view(tag_names[1], tag_shape, tag_dtype)[:n_tags]
+        relax_region(src, dst, alpha, count, rows, cols, boundary)
+
+
+def _tile_candidates(task: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """Hotspot-Kandidaten eines Zeilenbands in globalen Koordinaten."""
+
+    live, name, dtype, shape, rows, threshold, merge, radius = task
+    _retain(live)
+    phi = _view(name, shape, dtype)
+    y0, y1 = rows
+    if not merge:
+        ys, xs = np.nonzero(phi[y0:y1] >= threshold)
+        return ys + y0, xs
+    lo, hi = max(0, y0 - radius), min(shape[0], y1 + radius)
+    slab = phi[lo:hi]
+    peaks = local_maxima(slab, slab >= threshold, radius)[y0 - lo : y1 - lo]
+    ys, xs = np.nonzero(peaks)
+    return ys + y0, xs
+
+
+def _release(resources: dict) -> None:
+    pool = resources.pop("pool", None)
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    segments = resources.get("segments", {})
+    for name in list(segments):
+        _free(segments.pop(name))
+
+
+def _free(shm: SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:  # noch lebende Views; das Mapping stirbt mit ihnen
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:  # pragma: no cover - bereits entfernt
+        pass
+
+
+class TiledField(NumpyField):
+    """Φ-Feld in Zeilenkacheln, deren Relaxation ein Prozess-Pool übernimmt.
+
+    Φ, der Rechenpuffer und die Tag-Kanäle liegen in
+    ``multiprocessing.shared_memory``. Jeder Worker rechnet exakt dieselben
+    Operationen wie :class:`NumpyField` auf seinem Band, daher sind die
+    Ergebnisse bitgleich und unabhängig von der Worker-Zahl. Die Worker
+    starten per ``forkserver``/``spawn`` (:func:`~symbio.utils.worker_context`)
+    und hängen sich über den Segmentnamen an. Die Hotspot-Suche
+    läuft ebenfalls pro Kachel; die Kandidaten werden in Bandreihenfolge
+    zusammengeführt. Der Pool wird beim ersten Bedarf gestartet und mit
+    :meth:`close` (oder beim Aufräumen des Objekts) beendet.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        *,
+        workers: int | None = None,
+        tile_rows: int | None = None,
+        **kwargs,
+    ) -> None:
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.tile_rows = max(1, tile_rows or -(-shape[0] // self.workers))
+        self._resources: dict = {"pool": None, "segments": {}}
+        self._arrays: dict[str, np.ndarray] = {}
+        self._finalizer = weakref.finalize(self, _release, self._resources)
+        super().__init__(shape, **kwargs)
+
+    @property
+    def tiles(self) -> list[tuple[int, int]]:
+        """Zeilenbereiche der Kacheln."""
+
+        h = self.shape[0]
+        return [(y0, min(h, y0 + self.tile_rows)) for y0 in range(0, h, self.tile_rows)]
+
+    def close(self) -> None:
+        """Beende den Pool und gib alle Shared-Memory-Segmente frei."""
+
+        self._finalizer()
+
+    def __enter__(self) -> "TiledField":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def relax(self, alpha: float = 0.1) -> None:
+        if self._isolated:
+            return
+        n = len(self.channels)
+        live = tuple(self._arrays)
+        phi_names = (self._segment(self._phi), self._segment(self._buffer))
+        tag_names = (self._segment(self._tags), self._segment(self._tag_buffer))
+        tasks = [
+            (
+                live,
+                phi_names,
+                self._phi.dtype.str,
+                tag_names,
+                self._tags.dtype.str,
+                self._tags.shape[0],
+                n,
+                self.shape,
+                rows,
+                alpha,
+                self.boundary,
+            )
+            for rows in self.tiles
+        ]
+        self._pool().map(_relax_tile, tasks)
+        self._phi, self._buffer = self._buffer, self._phi
+        if n:
+            self._tags, self._tag_buffer = self._tag_buffer, self._tags
+            self._clear_small_tags(n, inclusive=True)
+
+    def fused_tick(
+        self, alpha: float, rate: float, threshold: float | None = None
+    ) -> tuple[tuple[int, int] | None, float, np.ndarray | None]:
+        # Die Relaxation läuft im Pool; ein lokaler Banddurchlauf wäre seriell.
+        return self._sequential_tick(alpha, rate, threshold)
+
+    def _hotspot_cells(
+        self, threshold: float, merge: bool, radius: int, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if mask is not None:
+            return super()._hotspot_cells(threshold, merge, radius, mask)
+        live, name = tuple(self._arrays), self._segment(self._phi)
+        tasks = [
+            (live, name, self._phi.dtype.str, self.shape, rows, threshold, merge, radius)
+            for rows in self.tiles
+        ]
+        parts = self._pool().map(_tile_candidates, tasks)
+        ys = np.concatenate([part[0] for part in parts])
+        xs = np.concatenate([part[1] for part in parts])
+        return ys, xs
+
+    def _pool(self):
+        pool = self._resources.get("pool")
+        if pool is None:
+            pool = worker_context().Pool(self.workers)
+            self._resources["pool"] = pool
+        return pool
+
+    def _allocate(self, shape: tuple[int, ...], dtype) -> np.ndarray:
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        shm = SharedMemory(create=True, size=max(nbytes, 1))
+        self._resources["segments"][shm.name] = shm
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        array.fill(0)
+        self._arrays[shm.name] = array
+        return array
+
+    def _segment(self, array: np.ndarray) -> str:
+        """Name des Segments hinter einem der vier Feldpuffer.
+
+        Die Zuordnung hält das Array selbst fest; Objekt-IDs freigegebener
+        Puffer können wiederverwendet werden und taugen daher nicht als
+        Schlüssel.
+        """
+
+        return next(name for name, held in self._arrays.items() if held is array)
+
+    def _resize_channels(self, capacity: int) -> None:
+        # Worker lösen die alten Segmente beim nächsten Auftrag über ``live``.
+        stale = [self._segment(self._tags), self._segment(self._tag_buffer)]
+        super()._resize_channels(capacity)
+        for name in stale:
+            del self._arrays[name]
+            _free(self._resources["segments"].pop(name))
+
+
+__all__ = ["TiledField"]
@@ -1,15 +1,21 @@
-"""HPIO-Fassade ohne NumPy."""
+"""HPIO-Fassade über Feld und Schwarm."""
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field as dataclass_field
+from typing import TYPE_CHECKING
 
 from .config import FieldConfig, SwarmConfig
-from .field import Field
-from .swarm import Swarm
+from .field import Field, create_field
+from .swarm import Swarm, create_swarm
 from .types import Pulse
 
+if TYPE_CHECKING:  # pragma: no cover - nur für Typprüfung
+    import numpy as np
+
+    from .swarm_numpy import NumpySwarm
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,32 +26,39 @@ class HPIO:
     field_config: FieldConfig = dataclass_field(default_factory=FieldConfig)
     swarm_config: SwarmConfig = dataclass_field(default_factory=SwarmConfig)
     field: Field = dataclass_field(init=False)
-    swarm: Swarm = dataclass_field(init=False)
+    swarm: Swarm | NumpySwarm = dataclass_field(init=False)
     best_pos: tuple[int, int] | None = None
     best_val: float = float("-inf")
 
     def __post_init__(self) -> None:
-        self.field = Field(self.field_config.shape)
-        self.swarm = Swarm(
-            field=self.field,
-            n_agents=self.swarm_config.n_agents,
-            boundary=self.swarm_config.boundary,
-            seed=self.swarm_config.seed,
-        )
+        self.field = create_field(self.field_config)
+        self.swarm = create_swarm(self.field, self.swarm_config)
 
     def inject_pulses(self, pulses: list[Pulse]) -> None:
-        for pulse in pulses:
-            self.field.inject_gaussian(pulse)
+        self.field.inject_many(pulses)
 
     def step(self) -> dict:
         metrics = self.swarm.step()
-        best_val = float("-inf")
-        best_pos = None
-        for y, row in enumerate(self.field.phi):
-            for x, value in enumerate(row):
-                if value > best_val:
-                    best_val = value
-                    best_pos = (y, x)
+        return self._track_best(metrics, *self.field.argmax())
+
+    def tick(self, threshold: float | None = None) -> tuple[dict, np.ndarray | None]:
+        """``step`` gefolgt von ``relax_and_evaporate`` mit einem Felddurchlauf.
+
+        Returns:
+            Die Metriken wie bei :meth:`step` und die Kandidatenmaske
+            ``Φ >= threshold`` nach dem Schritt (``None``, wenn das Backend
+            sie nicht im selben Durchlauf liefert).
+        """
+
+        metrics = self.swarm.step()
+        best_pos, best_val, mask = self.field.fused_tick(
+            self.field_config.relax_alpha, self.field_config.evaporate_rate, threshold
+        )
+        return self._track_best(metrics, best_pos, best_val), mask
+
+    def _track_best(
+        self, metrics: dict, best_pos: tuple[int, int] | None, best_val: float
+    ) -> dict:
         if best_pos and best_val > self.best_val:
             self.best_pos = best_pos
             self.best_val = best_val
@@ -56,6 +69,33 @@ class HPIO:
         self.field.relax(self.field_config.relax_alpha)
         self.field.evaporate(self.field_config.evaporate_rate)
 
+    def fast_forward(self, n: int) -> None:
+        """Überspringe ``n`` ruhige Ticks aus Relaxation und Verdunstung.
+
+        Gespart wird immer der Schwarm. Das Feld springt nur bei den
+        NumPy-Backends mit ``boundary`` ``reflect`` oder ``periodic``
+        spektral; sonst läuft :meth:`Field.relax_n` Schritt für Schritt.
+        """
+
+        self.field.relax_n(self.field_config.relax_alpha, n, self.field_config.evaporate_rate)
+
+    def get_state(self) -> dict:
+        """Feld, Schwarm und bisheriges Optimum für Checkpoints."""
+
+        return {
+            "field": self.field.get_state(),
+            "swarm": self.swarm.get_state(),
+            "best_pos": [int(v) for v in self.best_pos] if self.best_pos is not None else None,
+            "best_val": float(self.best_val),
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.field.set_state(state["field"])
+        self.swarm.set_state(state["swarm"])
+        best_pos = state["best_pos"]
+        self.best_pos = (int(best_pos[0]), int(best_pos[1])) if best_pos is not None else None
+        self.best_val = float(state["best_val"])
+
     def polish(self, radius: int = 2) -> None:
         if self.best_pos is None:
             return
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import random
 import re
+from functools import partial
 from typing import Callable
 
 _BAD_START = re.compile(r"^(ng|tsc|pfh|q[bcdfghjklmnpqrstvwxyz])", re.I)
@@ -35,18 +36,19 @@ def affix_boost(word: str, rnd: random.Random) -> str:
     return word
 
 
-def morph_wrapper(base_generator: Callable[[random.Random], str]) -> Callable[[random.Random], str]:
-    """Verpacke einen Generator mit weichen Guardrails."""
+def _guarded(base_generator: Callable[[random.Random], str], rnd: random.Random) -> str:
+    for _ in range(10):
+        candidate = base_generator(rnd)
+        candidate = affix_boost(candidate, rnd)
+        if good_shape(candidate):
+            return candidate
+    return base_generator(rnd)
+
 
-    def wrapped(rnd: random.Random) -> str:
-        for _ in range(10):
-            candidate = base_generator(rnd)
-            candidate = affix_boost(candidate, rnd)
-            if good_shape(candidate):
-                return candidate
-        return base_generator(rnd)
+def morph_wrapper(base_generator: Callable[[random.Random], str]) -> Callable[[random.Random], str]:
+    """Verpacke einen Generator mit weichen Guardrails (picklebar, solange ``base_generator`` es ist)."""
 
-    return wrapped
+    return partial(_guarded, base_generator)
 
 
 __all__ = ["affix_boost", "good_shape", "morph_wrapper"]
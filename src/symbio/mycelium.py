@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import random
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, Iterator, List, Sequence
@@ -11,7 +12,15 @@ from .types import Edge
 
 @dataclass(slots=True)
 class MyceliumGraph:
-    """Gerichteter Graph zwischen Token-IDs."""
+    """Gerichteter Graph zwischen Token-IDs.
+
+    Optional begrenzen ``max_out_edges`` (Kanten pro Knoten) und ``max_edges``
+    (globales Budget) den Speicher. Bei Überschreitung werden die Kanten mit
+    der kleinsten Summe aus Gewicht und Pheromon verdrängt.
+
+    Ein Max-Heap über die Pheromone (mit verzögertem Aufräumen veralteter
+    Einträge) liefert die stärkste Kante in amortisiert O(log n).
+    """
 
     weights: dict[tuple[int, int], float] = field(default_factory=dict)
     pheromones: dict[tuple[int, int], float] = field(default_factory=dict)
@@ -19,6 +28,17 @@ class MyceliumGraph:
     a_minus: float = 0.05
     decay: float = 0.01
     rng_seed: int = 7
+    max_out_edges: int | None = None
+    max_edges: int | None = None
+    prune_ratio: float = 0.1
+    evicted_node_cap: int = 0
+    evicted_budget: int = 0
+    _successors: dict[int, dict[int, None]] = field(default_factory=dict, repr=False)
+    _edge_count: int = field(default=0, repr=False)
+    _pher_heap: list[tuple[float, tuple[int, int]]] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        self.rebuild_index()
 
     def update_edge(self, edge: Edge, pre: float, post: float) -> None:
         """Aktualisiere eine Kante basierend auf STDP."""
@@ -27,15 +47,21 @@ class MyceliumGraph:
         key = (edge.a, edge.b)
         self.weights[key] = max(self.weights.get(key, 0.0) + delta, 0.0)
         self.pheromones[key] = max(self.pheromones.get(key, 0.0) + post, 0.0)
+        self._push_pheromone(key)
+        self._admit(key)
 
-    def evaporate(self, rate: float) -> None:
-        """Verdunste Pheromone und Gewichte leicht."""
+    def evaporate(self, rate: float, n: int = 1) -> None:
+        """Verdunste Pheromone und Gewichte leicht; ``n`` fasst Runden geschlossen zusammen."""
 
+        factor = max(0.0, 1.0 - rate) ** n
         for mapping in (self.weights, self.pheromones):
             for key in list(mapping.keys()):
-                mapping[key] *= max(0.0, 1.0 - rate)
+                mapping[key] *= factor
                 if mapping[key] < 1e-6:
                     del mapping[key]
+                    self._discard_if_orphaned(key)
+        # Gleichmäßige Skalierung erhält die Ordnung, aber nicht die gespeicherten Werte.
+        self._rebuild_heap()
 
     def reinforce(self, path: Sequence[int], amount: float = 1.0) -> None:
         """Verstärke einen Pfad proportionale zu amount."""
@@ -44,14 +70,16 @@ class MyceliumGraph:
             key = (a, b)
             self.weights[key] = self.weights.get(key, 0.0) + amount
             self.pheromones[key] = self.pheromones.get(key, 0.0) + amount
+            self._push_pheromone(key)
+            self._admit(key)
 
     def top_k_successors(self, node: int, k: int = 3) -> list[int]:
         """Gibt die Top-K Nachfolger eines Knotens zurück."""
 
         successors = [
             (b, self.weights.get((node, b), 0.0) + self.pheromones.get((node, b), 0.0))
-            for (a, b) in self.weights
-            if a == node
+            for b in self._successors.get(node, ())
+            if (node, b) in self.weights
         ]
         successors.sort(key=lambda item: item[1], reverse=True)
         return [b for b, _ in successors[:k]]
@@ -82,5 +110,151 @@ class MyceliumGraph:
                     break
         return path
 
+    def strongest_edge(self) -> tuple[tuple[int, int], float] | None:
+        """Kante mit dem höchsten Pheromonwert.
+
+        Bei Gleichstand gewinnt die kleinere Kante ``(a, b)``.
+        """
+
+        heap = self._pher_heap
+        while heap:
+            neg_value, key = heap[0]
+            if self.pheromones.get(key) == -neg_value:
+                return key, -neg_value
+            heapq.heappop(heap)
+        return None
+
+    def edge_score(self, key: tuple[int, int]) -> float:
+        """Stärke einer Kante als Summe aus Gewicht und Pheromon."""
+
+        return self.weights.get(key, 0.0) + self.pheromones.get(key, 0.0)
+
+    def rebuild_index(self) -> None:
+        """Baue den Nachfolger-Index nach direkter Zuweisung der Mappings neu auf."""
+
+        self._successors = {}
+        self._edge_count = 0
+        for mapping in (self.weights, self.pheromones):
+            for a, b in mapping:
+                successors = self._successors.setdefault(a, {})
+                if b not in successors:
+                    successors[b] = None
+                    self._edge_count += 1
+        self._rebuild_heap()
+
+    def get_state(self) -> dict:
+        """Kanten als Arrays, Schlüssel und Werte getrennt (für Checkpoints)."""
+
+        import numpy as np
+
+        state: dict = {
+            "evicted": [self.evicted_node_cap, self.evicted_budget],
+            "successors": np.array(
+                [(a, b) for a, succ in self._successors.items() for b in succ], dtype=np.int64
+            ).reshape(-1, 2),
+        }
+        for name in ("weights", "pheromones"):
+            mapping = getattr(self, name)
+            state[f"{name}_keys"] = np.array(list(mapping), dtype=np.int64).reshape(-1, 2)
+            state[f"{name}_values"] = np.array(list(mapping.values()), dtype=np.float64)
+        return state
+
+    def set_state(self, state: dict) -> None:
+        for name in ("weights", "pheromones"):
+            keys = [tuple(key) for key in state[f"{name}_keys"].tolist()]
+            setattr(self, name, dict(zip(keys, state[f"{name}_values"].tolist())))
+        self._successors = {}
+        for a, b in state["successors"].tolist():
+            self._successors.setdefault(a, {})[b] = None
+        self._edge_count = sum(len(succ) for succ in self._successors.values())
+        self.evicted_node_cap, self.evicted_budget = state["evicted"]
+        self._rebuild_heap()
+
+    def enforce_capacity(self) -> int:
+        """Setze beide Kapazitätsgrenzen für den gesamten Graphen durch.
+
+        Returns:
+            Anzahl der verdrängten Kanten.
+        """
+
+        before = self.evicted_node_cap + self.evicted_budget
+        if self.max_out_edges is not None:
+            for node in list(self._successors):
+                self._enforce_node_cap(node)
+        self._enforce_budget()
+        return self.evicted_node_cap + self.evicted_budget - before
+
+    def stats(self) -> dict:
+        """Kennzahlen zu Größe und Verdrängung."""
+
+        return {
+            "edges": self._edge_count,
+            "nodes": len(self._successors),
+            "evicted": self.evicted_node_cap + self.evicted_budget,
+            "evicted_node_cap": self.evicted_node_cap,
+            "evicted_budget": self.evicted_budget,
+        }
+
+    def _push_pheromone(self, key: tuple[int, int]) -> None:
+        heapq.heappush(self._pher_heap, (-self.pheromones[key], key))
+        if len(self._pher_heap) > 2 * len(self.pheromones) + 64:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._pher_heap = [(-value, key) for key, value in self.pheromones.items()]
+        heapq.heapify(self._pher_heap)
+
+    def _admit(self, key: tuple[int, int]) -> None:
+        a, b = key
+        successors = self._successors.setdefault(a, {})
+        if b in successors:
+            return
+        successors[b] = None
+        self._edge_count += 1
+        self._enforce_node_cap(a)
+        self._enforce_budget()
+
+    def _enforce_node_cap(self, node: int) -> None:
+        cap = self.max_out_edges
+        successors = self._successors.get(node)
+        if cap is None or successors is None or len(successors) <= cap:
+            return
+        excess = len(successors) - max(cap, 0)
+        keys = [(node, b) for b in successors]
+        for key in heapq.nsmallest(excess, keys, key=self.edge_score):
+            self._remove(key)
+            self.evicted_node_cap += 1
+
+    def _enforce_budget(self) -> None:
+        budget = self.max_edges
+        if budget is None or self._edge_count <= budget:
+            return
+        # Etwas Luft schaffen, damit nicht jede neue Kante einen vollen Scan auslöst.
+        target = max(0, int(budget * (1.0 - self.prune_ratio)))
+        excess = self._edge_count - target
+        keys = ((a, b) for a, successors in self._successors.items() for b in successors)
+        for key in heapq.nsmallest(excess, keys, key=self.edge_score):
+            self._remove(key)
+            self.evicted_budget += 1
+
+    def _remove(self, key: tuple[int, int]) -> None:
+        self.weights.pop(key, None)
+        self.pheromones.pop(key, None)
+        self._unlink(key)
+
+    def _discard_if_orphaned(self, key: tuple[int, int]) -> None:
+        if key not in self.weights and key not in self.pheromones:
+            self._unlink(key)
+
+    def _unlink(self, key: tuple[int, int]) -> None:
+        a, b = key
+        successors = self._successors.get(a)
+        if successors is None or b not in successors:
+            return
+        del successors[b]
+        self._edge_count -= 1
+        if not successors:
+            del self._successors[a]
+
 
 __all__ = ["MyceliumGraph"]
@@ -28,12 +28,13 @@ class NeuromodulatorState:
         self.serotonin = max(0.1, min(5.0, self.serotonin + value))
         logger.debug("Serotonin updated to %.3f", self.serotonin)
 
-    def decay(self, rate: float = 0.01) -> None:
-        """Langsame Rückkehr zum Baseline."""
+    def decay(self, rate: float = 0.01, n: int = 1) -> None:
+        """Langsame Rückkehr zum Baseline; ``n`` Schritte in geschlossener Form."""
 
+        pull = rate if n == 1 else 1.0 - (1.0 - rate) ** n
         for attr in ("dopamine", "serotonin", "acetylcholine"):
             current = getattr(self, attr)
-            updated = current + (1.0 - current) * rate
+            updated = current + (1.0 - current) * pull
             setattr(self, attr, updated)
         logger.debug("Neuromodulatoren decayed to %s", self)
 
@@ -0,0 +1,34 @@
+"""Zählerbasierte Rauschströme für Schwarm-Agenten."""
+
+from __future__ import annotations
+
+import numpy as np
+
+NOISE_SCALE = 0.05
+_SEED_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def agent_noise(seed: int, step: int, start: int, stop: int) -> np.ndarray:
+    """Gleichverteiltes Rauschen in ``±NOISE_SCALE`` für die Agenten ``[start, stop)``.
+
+    Ein Philox-Generator wird aus ``(seed, step)`` verschlüsselt; Zeile ``i``
+    gehört Agent ``i`` und hängt nur von ``(seed, step, i)`` ab. Teilbereiche
+    lassen sich daher unabhängig (z. B. parallel) erzeugen und stimmen mit dem
+    Gesamtblock überein. Seeds werden wie bei ``random.Random`` beliebig
+    angenommen und auf 64 Bit reduziert, da ``SeedSequence`` keine
+    negativen Werte kennt.
+    """
+
+    count = max(0, stop - start)
+    key = np.random.SeedSequence([seed & _SEED_MASK, step]).generate_state(2, np.uint64)
+    bit_generator = np.random.Philox(key=key)
+    # Ein Philox-Block liefert vier 64-Bit-Werte, also zwei Agenten.
+    bit_generator.advance(start // 2)
+    skip = start % 2
+    values = np.random.Generator(bit_generator).uniform(
+        -NOISE_SCALE, NOISE_SCALE, size=(count + skip, 2)
+    )
+    return values[skip:]
+
+
+__all__ = ["NOISE_SCALE", "agent_noise"]
@@ -2,28 +2,77 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import List, Sequence
 
 from .biocortex import BioCortex
-from .bridge import text_to_pulses
-from .events import make_event
-from .feedback import apply_feedback, detect_hotspots
+from .bridge import text_to_pulses, texts_to_pulses
+from .checkpoint import CheckpointStore
+from .event_log import EventLog
+from .events import EventQueue, make_event
+from .feedback import HOTSPOT_THRESHOLD, apply_feedback, detect_hotspots
 from .hpio import HPIO
-from .autopoiesis import synthesize_thoughts
+from .autopoiesis import SynthesisCache, SynthesisPool, synthesize_thoughts
+from .quiescence import QuiescenceMonitor
 from .types import Event
 
 logger = logging.getLogger(__name__)
 
+DECAY_RATE = 0.05
+DECAY_INTERVAL = 10
+
 
 @dataclass(slots=True)
 class Orchestrator:
-    """Verknüpft BioCortex und HPIO über Events."""
+    """Verknüpft BioCortex und HPIO über Events.
+
+    Mit ``feedback_interval > 1`` werden die ``feedback``-Events der Ticks
+    zurückgestellt und nur alle ``feedback_interval`` Ticks (sowie am Ende
+    der Episode) abgearbeitet; die Warteschlange fasst sie dabei zu einem
+    Event zusammen. Beim Standardwert 1 wirkt jedes Feedback im selben Tick.
+
+    Mit ``quiescence_tol`` werden die restlichen Ticks übersprungen, sobald
+    das Feld ruht (siehe :class:`QuiescenceMonitor` und :meth:`skip_ticks`);
+    ohne Wert läuft jede Episode alle Ticks mit Schwarm.
+
+    Mit ``synthesis_workers >= 1`` hält :meth:`autopoietic_cycle` einen
+    :class:`~symbio.autopoiesis.SynthesisPool` über alle Zyklen offen;
+    :meth:`close` beendet ihn.
+    """
 
     biocortex: BioCortex
     hpio: HPIO
-    event_log: list[Event] = field(default_factory=list)
+    event_log: EventLog = field(default_factory=EventLog)
+    events_processed: int = 0
+    dispatch_seconds: float = 0.0
+    quiescence_tol: float | None = None
+    skipped_ticks: int = 0
+    feedback_interval: int = 1
+    synthesis_workers: int = 0
+    synthesis_cache: SynthesisCache = field(default_factory=SynthesisCache)
+    _synthesis_pool: SynthesisPool | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.feedback_interval < 1:
+            raise ValueError("feedback_interval must be at least 1")
+
+    def close(self) -> None:
+        """Beende den Synthese-Pool, den :meth:`autopoietic_cycle` offen hält."""
+
+        if self._synthesis_pool is not None:
+            self._synthesis_pool.close()
+            self._synthesis_pool = None
+
+    @property
+    def events_per_sec(self) -> float:
+        """Durchsatz aller bisher abgearbeiteten Events."""
+
+        if self.dispatch_seconds <= 0.0:
+            return 0.0
+        return self.events_processed / self.dispatch_seconds
 
     def dispatch(self, event: Event) -> list[Event]:
         """Bearbeitet ein Event via Pattern Matching."""
@@ -35,9 +84,13 @@ class Orchestrator:
                 self.hpio.inject_pulses(pulses)
                 return []
             case Event(kind="tick", payload=payload):
-                metrics = self.hpio.step()
-                self.hpio.relax_and_evaporate()
-                hotspots = detect_hotspots(self.hpio.field)
+                metrics, mask = self.hpio.tick(HOTSPOT_THRESHOLD)
+                hotspots = detect_hotspots(
+                    self.hpio.field,
+                    HOTSPOT_THRESHOLD,
+                    top_n=self.hpio.field_config.hotspot_top_n,
+                    mask=mask,
+                )
                 if hotspots:
                     return [make_event("feedback", {"hotspots": hotspots, "metrics": metrics})]
                 return []
@@ -56,22 +109,164 @@ class Orchestrator:
     def run_episode(self, prompt: str, steps: int = 50) -> dict:
         """Führt eine komplette Episode aus."""
 
+        queue = self.start_episode(prompt)
+        skipped = self._run_ticks(queue, steps)
+        return self.summary(queue, skipped)
+
+    def start_episode(self, prompt: str) -> EventQueue:
+        """Warteschlange mit den Pulsen des Prompts."""
+
         pulses = text_to_pulses(self.biocortex, prompt, self.hpio.field.shape)
-        queue: list[Event] = [make_event("pulse", pulses)]
-        for step in range(steps):
-            queue.append(make_event("tick", {"step": step}))
-            if step % 10 == 0:
-                queue.append(make_event("decay", 0.05))
-            while queue:
-                event = queue.pop(0)
-                new_events = self.dispatch(event)
-                queue.extend(new_events)
+        queue = EventQueue()
+        queue.push(make_event("pulse", pulses))
+        return queue
+
+    def summary(self, queue: EventQueue, skipped: int = 0) -> dict:
         return {
-            "events": len(self.event_log),
+            "events": self.event_log.total,
+            "events_per_sec": self.events_per_sec,
+            "coalesced": queue.coalesced,
+            "skipped_ticks": skipped,
             "best_pos": self.hpio.best_pos,
             "best_val": self.hpio.best_val,
         }
 
+    def drain(self, queue: EventQueue) -> None:
+        """Arbeite die Warteschlange samt Folge-Events vollständig ab."""
+
+        start = time.perf_counter()
+        defer = self.feedback_interval > 1
+        while queue:
+            event = queue.pop()
+            for follow in self.dispatch(event):
+                if defer and follow.kind == "feedback":
+                    queue.defer(follow)
+                else:
+                    queue.push(follow)
+            self.events_processed += 1
+        self.dispatch_seconds += time.perf_counter() - start
+
+    def flush_feedback(self, queue: EventQueue) -> None:
+        """Arbeite zurückgestellte ``feedback``-Events als ein Event ab."""
+
+        if queue.deferred:
+            queue.release()
+            self.drain(queue)
+
+    def _run_ticks(
+        self,
+        queue: EventQueue,
+        steps: int,
+        *,
+        start: int = 0,
+        monitor: QuiescenceMonitor | None = None,
+        checkpoints: CheckpointStore | None = None,
+        checkpoint_every: int = 0,
+        episode: dict | None = None,
+    ) -> int:
+        """Führe die Ticks ``[start, steps)`` aus; liefert die Zahl übersprungener Ticks.
+
+        Mit ``checkpoints`` wird alle ``checkpoint_every`` Ticks der komplette
+        Episodenzustand gesichert (siehe :meth:`get_state`).
+        """
+
+        if monitor is None:
+            monitor = self.new_monitor()
+        for step in range(start, steps):
+            done = step + 1
+            if self.run_tick(queue, step, monitor):
+                self.flush_feedback(queue)
+                return self.skip_ticks(done, steps)
+            if checkpoints is not None and checkpoint_every and done % checkpoint_every == 0:
+                checkpoints.save(self.get_state(queue, monitor, {**(episode or {}), "step": done}))
+        self.flush_feedback(queue)
+        return 0
+
+    def get_state(
+        self, queue: EventQueue, monitor: QuiescenceMonitor | None, episode: dict
+    ) -> dict:
+        """Vollständiger Episodenzustand zwischen zwei Ticks."""
+
+        return {
+            "episode": episode,
+            "hpio": self.hpio.get_state(),
+            "biocortex": self.biocortex.get_state(),
+            "queue": queue.get_state(),
+            "monitor": monitor.get_state() if monitor is not None else None,
+            "counters": {
+                "events": self.event_log.total,
+                "events_processed": self.events_processed,
+                "skipped_ticks": self.skipped_ticks,
+            },
+        }
+
+    def set_state(
+        self, state: dict, queue: EventQueue, monitor: QuiescenceMonitor | None
+    ) -> dict:
+        """Stelle einen Zustand aus :meth:`get_state` wieder her; liefert ``episode``."""
+
+        self.hpio.set_state(state["hpio"])
+        self.biocortex.set_state(state["biocortex"])
+        queue.set_state(state["queue"])
+        if monitor is not None and state["monitor"] is not None:
+            monitor.set_state(state["monitor"])
+        counters = state["counters"]
+        self.event_log.total = counters["events"]
+        self.events_processed = counters["events_processed"]
+        self.skipped_ticks = counters["skipped_ticks"]
+        return state["episode"]
+
+    def _setup(self) -> dict:
+        """Feld- und Schwarmparameter, die ein Checkpoint festschreibt."""
+
+        field_config, swarm_config = self.hpio.field_config, self.hpio.swarm_config
+        return {
+            "shape": [int(n) for n in self.hpio.field.shape],
+            "backend": field_config.backend,
+            "dtype": field_config.dtype,
+            "engine": swarm_config.engine,
+            "n_agents": swarm_config.n_agents,
+            "seed": swarm_config.seed,
+        }
+
+    def new_monitor(self) -> QuiescenceMonitor | None:
+        if self.quiescence_tol is None:
+            return None
+        return QuiescenceMonitor(self.quiescence_tol, ceiling=HOTSPOT_THRESHOLD)
+
+    def run_tick(
+        self, queue: EventQueue, step: int, monitor: QuiescenceMonitor | None = None
+    ) -> bool:
+        """Ein Tick samt fälligem ``decay``; ``True``, wenn das Feld danach ruht."""
+
+        queue.push(make_event("tick", {"step": step}))
+        if step % DECAY_INTERVAL == 0:
+            queue.push(make_event("decay", DECAY_RATE))
+        self.drain(queue)
+        if self.feedback_interval > 1 and (step + 1) % self.feedback_interval == 0:
+            self.flush_feedback(queue)
+        return monitor is not None and monitor.observe(self.hpio.field)
+
+    def skip_ticks(self, start: int, steps: int) -> int:
+        """Überspringe die Ticks ``[start, steps)`` eines ruhenden Felds.
+
+        Das Feld wird per :meth:`HPIO.fast_forward` ohne Schwarm nachgeführt
+        (in geschlossener Form nur für ``reflect``/``periodic``, bei ``edge``
+        schrittweise), die ausstehenden ``decay``-Events werden in
+        geschlossener Form angewendet. Liefert die Zahl übersprungener Ticks.
+        """
+
+        remaining = steps - start
+        self.hpio.fast_forward(remaining)
+        first = -(-start // DECAY_INTERVAL) * DECAY_INTERVAL
+        decays = len(range(first, steps, DECAY_INTERVAL))
+        if decays:
+            self.biocortex.graph.evaporate(DECAY_RATE, n=decays)
+            self.biocortex.neuromod.decay(n=decays)
+        self.skipped_ticks += remaining
+        logger.debug("Feld ruht nach %d Ticks, %d übersprungen", start, remaining)
+        return remaining
+
     def autopoietic_cycle(
         self,
         texts: Sequence[str],
@@ -79,33 +274,71 @@ class Orchestrator:
         steps: int = 100,
         threshold: float = 0.6,
         max_sentences: int = 5,
+        checkpoints: CheckpointStore | None = None,
+        checkpoint_every: int = 0,
+        resume: bool = False,
     ) -> dict:
-        """Überführt Texte in Feldreaktionen und erzeugt neue Sätze daraus."""
-
-        queue: list[Event] = []
-        for text in texts:
-            if not text.strip():
-                continue
-            pulses = text_to_pulses(self.biocortex, text, self.hpio.field.shape)
-            queue.append(make_event("pulse", pulses))
-        for step in range(steps):
-            queue.append(make_event("tick", {"step": step}))
-            if step % 10 == 0:
-                queue.append(make_event("decay", 0.05))
-            while queue:
-                event = queue.pop(0)
-                new_events = self.dispatch(event)
-                queue.extend(new_events)
-        hotspots = detect_hotspots(self.hpio.field, threshold)
+        """Überführt Texte in Feldreaktionen und erzeugt neue Sätze daraus.
+
+        Mit ``checkpoints`` wird der Episodenzustand alle ``checkpoint_every``
+        Ticks gesichert; ``resume=True`` setzt beim letzten Checkpoint fort,
+        sofern er zu denselben Texten, ``steps`` und demselben Feld- und
+        Schwarm-Aufbau gehört (siehe :meth:`_setup`).
+        """
+
+        texts = [text for text in texts if text.strip()]
+        queue = EventQueue()
+        monitor = self.new_monitor()
+        episode = {"texts": _fingerprint(texts), "steps": steps, **self._setup()}
+        start = 0
+        state = checkpoints.load() if checkpoints is not None and resume else None
+        if state is not None:
+            saved = state["episode"]
+            mismatched = sorted(key for key in episode if saved.get(key) != episode[key])
+            if mismatched:
+                raise ValueError(
+                    f"checkpoint belongs to a different episode ({', '.join(mismatched)} differ)"
+                )
+            start = self.set_state(state, queue, monitor)["step"]
+            logger.info("Setze Episode bei Tick %d fort", start)
+        elif texts:
+            pulses = texts_to_pulses(self.biocortex, texts, self.hpio.field.shape)
+            queue.push(make_event("pulse", pulses))
+        skipped = self._run_ticks(
+            queue,
+            steps,
+            start=start,
+            monitor=monitor,
+            checkpoints=checkpoints,
+            checkpoint_every=checkpoint_every,
+            episode=episode,
+        )
+        hotspots = detect_hotspots(
+            self.hpio.field, threshold, top_n=self.hpio.field_config.hotspot_top_n
+        )
+        if self.synthesis_workers >= 1 and self._synthesis_pool is None:
+            self._synthesis_pool = SynthesisPool(self.synthesis_workers)
         sentences = synthesize_thoughts(
             self.biocortex,
             hotspots,
             max_sentences=max_sentences,
+            workers=self.synthesis_workers,
+            cache=self.synthesis_cache,
+            pool=self._synthesis_pool,
         )
         return {
             "sentences": sentences,
             "hotspots": [hotspot.to_dict(top_k=5) for hotspot in hotspots],
+            "skipped_ticks": skipped,
         }
 
 
+def _fingerprint(texts: Sequence[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 __all__ = ["Orchestrator"]
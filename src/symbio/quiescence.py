@@ -0,0 +1,72 @@
+"""Erkennung eines ruhenden Φ-Felds."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .field import Field
+
+
+@dataclass(slots=True)
+class QuiescenceMonitor:
+    """Beobachtet Gesamtmasse und größte Zelländerung von Φ je Tick.
+
+    Das Feld gilt als ruhend, sobald sich Masse und jede einzelne Zelle
+    gegenüber dem vorigen Tick um höchstens ``tolerance`` ändern und kein
+    Wert mehr ``ceiling`` erreicht. Da Relaxation und Verdunstung Φ nicht
+    anheben, entstehen danach ohne neue Pulse keine Hotspots mehr.
+    """
+
+    tolerance: float = 1e-4
+    ceiling: float = float("inf")
+    mass: float | None = None
+    max_change: float | None = None
+    _previous: np.ndarray | None = field(default=None, repr=False)
+
+    def observe(self, phi: Field | np.ndarray) -> bool:
+        """Nimm den Zustand nach einem Tick auf; ``True``, wenn das Feld ruht.
+
+        Meldet das Feld seine Änderung selbst (``Field.tick_change``, von
+        allen Backends in ``fused_tick`` gefüllt), wird sie direkt
+        übernommen; sonst vergleicht der Monitor mit einer Kopie des vorigen
+        Zustands.
+        """
+
+        change = phi.tick_change if isinstance(phi, Field) else None
+        if change is not None:
+            mass_change, self.max_change, peak = change
+            return (
+                abs(mass_change) <= self.tolerance
+                and self.max_change <= self.tolerance
+                and peak < self.ceiling
+            )
+        values = np.array(phi.phi if isinstance(phi, Field) else phi, dtype=np.float64)
+        previous, self._previous = self._previous, values
+        mass = float(values.sum())
+        last_mass, self.mass = self.mass, mass
+        if previous is None or last_mass is None:
+            return False
+        self.max_change = float(np.abs(values - previous).max(initial=0.0))
+        return (
+            abs(mass - last_mass) <= self.tolerance
+            and self.max_change <= self.tolerance
+            and float(values.max(initial=0.0)) < self.ceiling
+        )
+
+    def get_state(self) -> dict:
+        return {"previous": self._previous, "mass": self.mass, "max_change": self.max_change}
+
+    def set_state(self, state: dict) -> None:
+        self._previous = state["previous"]
+        self.mass = state["mass"]
+        self.max_change = state["max_change"]
+
+    def reset(self) -> None:
+        self._previous = None
+        self.mass = None
+        self.max_change = None
+
+
+__all__ = ["QuiescenceMonitor"]
@@ -0,0 +1,94 @@
+"""Uniformes Zellgitter für Nachbarschaftsabfragen ohne NumPy."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+
+def grid_cells(shape: tuple[int, int], cell_size: float, periodic: bool) -> tuple[int, int]:
+    """Anzahl der Zellen je Achse.
+
+    Periodische Gitter teilen jede Achse in gleich große Zellen von mindestens
+    ``cell_size``, damit die Nachbarschaft über die Naht hinweg stimmt.
+    """
+
+    h, w = shape
+    if periodic:
+        return max(1, int(h // cell_size)), max(1, int(w // cell_size))
+    return max(1, math.ceil(h / cell_size)), max(1, math.ceil(w / cell_size))
+
+
+def minimum_image(delta: float, length: int) -> float:
+    """Kürzester Abstand entlang einer periodischen Achse."""
+
+    return delta - length * math.floor(delta / length + 0.5)
+
+
+@dataclass(slots=True)
+class SpatialHash:
+    """Zellliste mit Kantenlänge ``cell_size`` für Abfragen im Radius ``cell_size``.
+
+    Nachbarn eines Punkts liegen in den 3×3 umgebenden Zellen. Mit
+    ``periodic=True`` werden die Zellindizes um die Feldränder gewickelt.
+    """
+
+    shape: tuple[int, int]
+    cell_size: float = 2.0
+    periodic: bool = False
+    counts: tuple[int, int] = field(init=False)
+    _cells: dict[tuple[int, int], set[int]] = field(default_factory=dict, init=False, repr=False)
+    _where: dict[int, tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.counts = grid_cells(self.shape, self.cell_size, self.periodic)
+
+    def cell(self, position: tuple[float, float]) -> tuple[int, int]:
+        y, x = position
+        if self.periodic:
+            (h, w), (ny, nx) = self.shape, self.counts
+            return math.floor(y * ny / h) % ny, math.floor(x * nx / w) % nx
+        return math.floor(y / self.cell_size), math.floor(x / self.cell_size)
+
+    def rebuild(self, positions: list[tuple[float, float]]) -> None:
+        self._cells = {}
+        self._where = {}
+        for idx, position in enumerate(positions):
+            self.insert(idx, position)
+
+    def insert(self, idx: int, position: tuple[float, float]) -> None:
+        key = self.cell(position)
+        self._cells.setdefault(key, set()).add(idx)
+        self._where[idx] = key
+
+    def move(self, idx: int, position: tuple[float, float]) -> None:
+        """Aktualisiere die Zelle eines Punkts nach einer Bewegung."""
+
+        key = self.cell(position)
+        old = self._where.get(idx)
+        if key == old:
+            return
+        if old is not None:
+            members = self._cells[old]
+            members.discard(idx)
+            if not members:
+                del self._cells[old]
+        self._cells.setdefault(key, set()).add(idx)
+        self._where[idx] = key
+
+    def near(self, position: tuple[float, float]) -> list[int]:
+        """Aufsteigend sortierte Kandidaten aus den umgebenden Zellen."""
+
+        cy, cx = self.cell(position)
+        keys = {(cy + dy, cx + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)}
+        if self.periodic:
+            ny, nx = self.counts
+            keys = {(y % ny, x % nx) for y, x in keys}
+        found: list[int] = []
+        for key in keys:
+            found.extend(self._cells.get(key, ()))
+        found.sort()
+        return found
+
+
+__all__ = ["SpatialHash", "grid_cells", "minimum_image"]
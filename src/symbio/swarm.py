@@ -6,13 +6,23 @@ import logging
 import math
 import random
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from .agent import Agent, DEFAULT_ROLE_PARAMS
 from .field import Field
+from .noise import agent_noise
+from .spatial import SpatialHash, minimum_image
 from .types import Pulse
 
+if TYPE_CHECKING:  # pragma: no cover - nur für Typprüfung
+    from .config import SwarmConfig
+    from .swarm_numpy import NumpySwarm
+
 logger = logging.getLogger(__name__)
 
+SWARM_ENGINES = ("python", "numpy")
+AVOIDANCE_RADIUS = 2.0
+
 
 def vec_add(a: tuple[float, float], b: tuple[float, float]) -> tuple[float, float]:
     return (a[0] + b[0], a[1] + b[1])
@@ -32,15 +42,32 @@ def vec_length_squared(a: tuple[float, float]) -> float:
 
 @dataclass(slots=True)
 class Swarm:
-    """Steuert Agenten auf dem Φ-Feld."""
+    """Steuert Agenten auf dem Φ-Feld.
+
+    Ausweichkräfte werden über ein Zellgitter (:class:`SpatialHash`) nur
+    zwischen Agenten in benachbarten Zellen ausgewertet; bei ``periodic``
+    gilt der kürzeste Abstand über die Feldränder. Standardmäßig
+    (``synchronous=True``) rechnen alle Agenten mit Feld und Positionen vom
+    Beginn des Schritts, und die Spuren werden nach den Bewegungen gesammelt
+    mit ``Field.inject_many`` abgelegt; das ist auch die Reihenfolge von
+    :class:`~symbio.swarm_numpy.NumpySwarm`. Mit ``synchronous=False`` legt
+    jeder Agent seine Spur direkt nach seiner Bewegung ab, spätere Agenten
+    sehen sie und die bereits bewegten Agenten also schon im selben Schritt.
+    Das Rauschen stammt aus :func:`agent_noise` und ist durch ``seed``,
+    Schrittzähler ``steps`` und Agentenindex festgelegt.
+    """
 
     field: Field
     n_agents: int
     boundary: str = "reflect"
     seed: int = 0
+    synchronous: bool = True
     agents: list[Agent] = field(init=False)
+    steps: int = 0
+    _grid: SpatialHash = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        self._grid = SpatialHash(self.field.shape, AVOIDANCE_RADIUS, self.boundary == "periodic")
         rng = random.Random(self.seed)
         roles = list(DEFAULT_ROLE_PARAMS)
         h, w = self.field.shape
@@ -51,6 +78,29 @@ class Swarm:
             role = roles[i % len(roles)]
             self.agents.append(Agent(position=position, velocity=velocity, role=role, battery=1.0))
 
+    def get_state(self) -> dict:
+        """Positionen, Geschwindigkeiten, Batterien und Schrittzähler."""
+
+        import numpy as np
+
+        return {
+            "positions": np.array([agent.position for agent in self.agents], dtype=np.float64),
+            "velocities": np.array([agent.velocity for agent in self.agents], dtype=np.float64),
+            "batteries": np.array([agent.battery for agent in self.agents], dtype=np.float64),
+            "steps": self.steps,
+        }
+
+    def set_state(self, state: dict) -> None:
+        check_swarm_state(state, len(self.agents))
+        rows = zip(
+            state["positions"].tolist(), state["velocities"].tolist(), state["batteries"].tolist()
+        )
+        for agent, (position, velocity, battery) in zip(self.agents, rows, strict=True):
+            agent.position = tuple(position)
+            agent.velocity = tuple(velocity)
+            agent.battery = battery
+        self.steps = int(state["steps"])
+
     def _bilinear_sample(self, position: tuple[float, float]) -> float:
         y, x = position
         h, w = self.field.shape
@@ -94,34 +144,48 @@ class Swarm:
             x = max(0.0, min(x, w - 1))
         return (y, x)
 
+    def _offset(self, a: tuple[float, float], b: tuple[float, float]) -> tuple[float, float]:
+        delta = vec_sub(a, b)
+        if self.boundary != "periodic":
+            return delta
+        h, w = self.field.shape
+        return (minimum_image(delta[0], h), minimum_image(delta[1], w))
+
     def step(self, dt: float = 1.0) -> dict:
         trails: list[tuple[tuple[float, float], str]] = []
+        deposits: list[Pulse] = []
         if not self.agents:
             return {"trails": [], "center": (0.0, 0.0), "mean_battery": 0.0}
         center_y = sum(agent.position[0] for agent in self.agents) / len(self.agents)
         center_x = sum(agent.position[1] for agent in self.agents) / len(self.agents)
         center = (center_y, center_x)
+        start = [agent.position for agent in self.agents]
+        self._grid.rebuild(start)
+        noises = agent_noise(self.seed, self.steps, 0, len(self.agents)).tolist()
+        self.steps += 1
         for idx, agent in enumerate(self.agents):
             grad = self._gradient(agent.position)
             curiosity = vec_scale(grad, agent.params["curiosity"])
             cohesion = vec_scale(vec_sub(center, agent.position), agent.params["cohesion"])
             avoidance = (0.0, 0.0)
-            for other in self.agents:
-                if other is agent:
+            for other_idx in self._grid.near(agent.position):
+                if other_idx == idx:
                     continue
-                delta = vec_sub(agent.position, other.position)
+                other = start[other_idx] if self.synchronous else self.agents[other_idx].position
+                delta = self._offset(agent.position, other)
                 dist2 = vec_length_squared(delta)
-                if dist2 < 4.0:
+                if dist2 < AVOIDANCE_RADIUS**2:
                     scale = agent.params["avoidance"] / max(dist2, 1e-3)
                     avoidance = vec_add(avoidance, vec_scale(delta, scale))
-            rng = random.Random(self.seed + idx)
-            noise = (rng.uniform(-0.05, 0.05), rng.uniform(-0.05, 0.05))
+            noise = noises[idx]
             velocity = vec_add(vec_scale(agent.velocity, 0.5), curiosity)
             velocity = vec_add(velocity, cohesion)
             velocity = vec_add(velocity, avoidance)
             velocity = vec_add(velocity, noise)
             agent.velocity = velocity
             agent.position = self._wrap_position(vec_add(agent.position, vec_scale(agent.velocity, dt)))
+            if not self.synchronous:
+                self._grid.move(idx, agent.position)
             agent.step_battery()
             sigma = agent.params["deposit_sigma"]
             pulse = Pulse(
@@ -130,10 +194,49 @@ class Swarm:
                 spread=sigma,
                 tag=f"agent:{agent.role}",
             )
-            self.field.inject_gaussian(pulse)
+            if self.synchronous:
+                deposits.append(pulse)
+            else:
+                self.field.inject_gaussian(pulse)
             trails.append(((agent.position[0], agent.position[1]), agent.role))
+        if deposits:
+            self.field.inject_many(deposits)
         mean_battery = sum(agent.battery for agent in self.agents) / len(self.agents)
         return {"trails": trails, "center": center, "mean_battery": mean_battery}
 
 
-__all__ = ["Swarm"]
+def check_swarm_state(state: dict, n_agents: int) -> None:
+    """Prüfe, ob ein gesicherter Schwarmzustand ``n_agents`` Agenten beschreibt."""
+
+    expected = {"positions": (n_agents, 2), "velocities": (n_agents, 2), "batteries": (n_agents,)}
+    for key, shape in expected.items():
+        actual = tuple(getattr(state[key], "shape", ()))
+        if actual != shape:
+            raise ValueError(f"swarm state {key!r} has shape {actual}, expected {shape}")
+
+
+def create_swarm(field: Field, config: "SwarmConfig") -> "Swarm | NumpySwarm":
+    """Erzeuge einen Schwarm mit der in ``config.engine`` gewählten Engine."""
+
+    match config.engine:
+        case "python":
+            return Swarm(
+                field=field,
+                n_agents=config.n_agents,
+                boundary=config.boundary,
+                seed=config.seed,
+                synchronous=config.synchronous,
+            )
+        case "numpy":
+            from .swarm_numpy import NumpySwarm
+
+            return NumpySwarm(
+                field=field, n_agents=config.n_agents, boundary=config.boundary, seed=config.seed
+            )
+        case _:
+            raise ValueError(
+                f"unknown swarm engine {config.engine!r}, expected one of {SWARM_ENGINES}"
+            )
+
+
+__all__ = ["AVOIDANCE_RADIUS", "SWARM_ENGINES", "Swarm", "check_swarm_state", "create_swarm"]
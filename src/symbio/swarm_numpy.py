@@ -0,0 +1,284 @@
+"""Vektorisierter Schwarm im Structure-of-Arrays-Layout."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .agent import DEFAULT_ROLE_PARAMS
+from .field import Field
+from .noise import agent_noise
+from .spatial import grid_cells
+from .swarm import AVOIDANCE_RADIUS, check_swarm_state
+from .types import Pulse
+
+
+def spawn_agents(shape: tuple[int, int], n_agents: int, seed: int) -> tuple[np.ndarray, list[str]]:
+    """Startpositionen und Rollen wie in :class:`Swarm`."""
+
+    rng = random.Random(seed)
+    names = list(DEFAULT_ROLE_PARAMS)
+    h, w = shape
+    coords = [(rng.random() * (h - 1), rng.random() * (w - 1)) for _ in range(n_agents)]
+    positions = np.array(coords, dtype=np.float64).reshape(n_agents, 2)
+    return positions, [names[i % len(names)] for i in range(n_agents)]
+
+
+def role_params(roles: list[str]) -> dict[str, np.ndarray]:
+    """Rollenparameter als Arrays je Agent."""
+
+    return {
+        key: np.array([DEFAULT_ROLE_PARAMS[role][key] for role in roles], dtype=np.float64)
+        for key in ("curiosity", "cohesion", "avoidance", "deposit_sigma")
+    }
+
+
+def wrap_positions(positions: np.ndarray, shape: tuple[int, int], boundary: str) -> np.ndarray:
+    """Randbehandlung wie ``Swarm._wrap_position`` für ein ``(N, 2)``-Array."""
+
+    h, w = shape
+    y, x = positions[:, 0], positions[:, 1]
+    if boundary == "reflect":
+        y = np.where(y < 0, -y, y)
+        x = np.where(x < 0, -x, x)
+        y = np.where(y >= h, 2 * (h - 1) - y, y)
+        x = np.where(x >= w, 2 * (w - 1) - x, x)
+    elif boundary == "periodic":
+        y = np.mod(y, h)
+        x = np.mod(x, w)
+    else:
+        y = np.clip(y, 0.0, h - 1)
+        x = np.clip(x, 0.0, w - 1)
+    return np.stack((y, x), axis=1)
+
+
+def bilinear_sample(
+    phi: np.ndarray, positions: np.ndarray, owners: np.ndarray | None = None
+) -> np.ndarray:
+    """Bilineare Abtastung von Φ; ``owners`` wählt bei ``(B, H, W)`` die Instanz."""
+
+    h, w = phi.shape[-2:]
+    y, x = positions[:, 0], positions[:, 1]
+    y0 = np.clip(np.floor(y).astype(np.int64), 0, h - 1)
+    x0 = np.clip(np.floor(x).astype(np.int64), 0, w - 1)
+    y1 = np.minimum(y0 + 1, h - 1)
+    x1 = np.minimum(x0 + 1, w - 1)
+    dy = y - y0
+    dx = x - x0
+    lead = () if owners is None else (owners,)
+    return (
+        phi[(*lead, y0, x0)] * (1 - dy) * (1 - dx)
+        + phi[(*lead, y1, x0)] * dy * (1 - dx)
+        + phi[(*lead, y0, x1)] * (1 - dy) * dx
+        + phi[(*lead, y1, x1)] * dy * dx
+    )
+
+
+def sample_gradient(
+    phi: np.ndarray,
+    positions: np.ndarray,
+    boundary: str,
+    owners: np.ndarray | None = None,
+    epsilon: float = 1.0,
+) -> np.ndarray:
+    """Vorwärtsdifferenzen von Φ an allen Positionen."""
+
+    shape = phi.shape[-2:]
+    base = bilinear_sample(phi, positions, owners)
+    grad = np.empty_like(positions)
+    for axis in (0, 1):
+        shifted = positions.copy()
+        shifted[:, axis] += epsilon
+        shifted = wrap_positions(shifted, shape, boundary)
+        grad[:, axis] = (bilinear_sample(phi, shifted, owners) - base) / epsilon
+    return grad
+
+
+def neighbor_pairs(
+    positions: np.ndarray,
+    shape: tuple[int, int],
+    cell_size: float,
+    periodic: bool,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Indexpaare ``(i, j)``, ``i != j``, aus benachbarten Zellen einer Zellliste.
+
+    Alle Paare mit Abstand unter ``cell_size`` sind enthalten; die Kosten
+    wachsen mit ``N·k`` statt ``N²``. Mit ``groups`` werden nur Paare
+    innerhalb derselben Gruppe gebildet.
+    """
+
+    n = positions.shape[0]
+    h, w = shape
+    ny, nx = grid_cells(shape, cell_size, periodic)
+    if groups is None:
+        groups = np.zeros(n, dtype=np.int64)
+    n_groups = int(groups.max()) + 1 if n else 1
+    y, x = positions[:, 0], positions[:, 1]
+    if periodic:
+        cy = np.floor(y * ny / h).astype(np.int64) % ny
+        cx = np.floor(x * nx / w).astype(np.int64) % nx
+        offsets_y = sorted({d % ny for d in (-1, 0, 1)})
+        offsets_x = sorted({d % nx for d in (-1, 0, 1)})
+    else:
+        cy = np.clip(np.floor(y / cell_size).astype(np.int64), 0, ny - 1)
+        cx = np.clip(np.floor(x / cell_size).astype(np.int64), 0, nx - 1)
+        offsets_y = offsets_x = (-1, 0, 1)
+    keys = (groups * ny + cy) * nx + cx
+    order = np.argsort(keys, kind="stable")
+    counts = np.bincount(keys, minlength=n_groups * ny * nx)
+    starts = np.cumsum(counts) - counts
+    agents = np.arange(n)
+    rows, cols = [], []
+    for dy in offsets_y:
+        for dx in offsets_x:
+            ty, tx = cy + dy, cx + dx
+            if periodic:
+                ty, tx, valid = ty % ny, tx % nx, agents
+            else:
+                valid = np.flatnonzero((ty >= 0) & (ty < ny) & (tx >= 0) & (tx < nx))
+                ty, tx = ty[valid], tx[valid]
+            target = (groups[valid] * ny + ty) * nx + tx
+            sizes = counts[target]
+            total = int(sizes.sum())
+            if not total:
+                continue
+            first = np.repeat(starts[target], sizes)
+            within = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            rows.append(np.repeat(valid, sizes))
+            cols.append(order[first + within])
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    i, j = np.concatenate(rows), np.concatenate(cols)
+    distinct = i != j
+    return i[distinct], j[distinct]
+
+
+def avoidance_forces(
+    positions: np.ndarray,
+    weights: np.ndarray,
+    shape: tuple[int, int],
+    boundary: str,
+    groups: np.ndarray | None = None,
+) -> np.ndarray:
+    """Summierte Ausweichkräfte aller Nachbarn im Radius ``AVOIDANCE_RADIUS``."""
+
+    periodic = boundary == "periodic"
+    i, j = neighbor_pairs(positions, shape, AVOIDANCE_RADIUS, periodic, groups)
+    delta = positions[i] - positions[j]
+    if periodic:
+        lengths = np.array(shape, dtype=np.float64)
+        delta -= lengths * np.floor(delta / lengths + 0.5)
+    dist2 = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]
+    near = dist2 < AVOIDANCE_RADIUS**2
+    i, delta, dist2 = i[near], delta[near], dist2[near]
+    push = delta * (weights[i] / np.maximum(dist2, 1e-3))[:, None]
+    n = positions.shape[0]
+    return np.stack(
+        (np.bincount(i, push[:, 0], minlength=n), np.bincount(i, push[:, 1], minlength=n)),
+        axis=1,
+    )
+
+
+@dataclass(slots=True)
+class NumpySwarm:
+    """Schwarm, dessen Zustand in NumPy-Arrays liegt.
+
+    Positionen, Geschwindigkeiten, Batterien und Rollenparameter werden für
+    alle Agenten gleichzeitig aktualisiert; alle Agenten sehen das Feld und
+    die Positionen vom Beginn des Schritts. Das entspricht
+    dem Standard-:class:`Swarm` (``synchronous=True``): Spuren, Zentrum und
+    mittlere Batterie stimmen bis auf Rundungsfehler aus der
+    Summationsreihenfolge überein. Die Spuren landen gebündelt per
+    ``inject_many`` im Feld, das sie je Rolle bzw. σ in einem Durchgang
+    schreibt.
+    """
+
+    field: Field
+    n_agents: int
+    boundary: str = "reflect"
+    seed: int = 0
+    positions: np.ndarray = field(init=False)
+    velocities: np.ndarray = field(init=False)
+    batteries: np.ndarray = field(init=False)
+    roles: list[str] = field(init=False)
+    params: dict[str, np.ndarray] = field(init=False)
+    steps: int = 0
+    _tags: list[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.positions, self.roles = spawn_agents(self.field.shape, self.n_agents, self.seed)
+        self.velocities = np.zeros((self.n_agents, 2), dtype=np.float64)
+        self.batteries = np.ones(self.n_agents, dtype=np.float64)
+        self._tags = [f"agent:{role}" for role in self.roles]
+        self.params = role_params(self.roles)
+
+    def get_state(self) -> dict:
+        return {
+            "positions": self.positions.copy(),
+            "velocities": self.velocities.copy(),
+            "batteries": self.batteries.copy(),
+            "steps": self.steps,
+        }
+
+    def set_state(self, state: dict) -> None:
+        check_swarm_state(state, self.n_agents)
+        self.positions = np.array(state["positions"], dtype=np.float64).reshape(-1, 2)
+        self.velocities = np.array(state["velocities"], dtype=np.float64).reshape(-1, 2)
+        self.batteries = np.array(state["batteries"], dtype=np.float64)
+        self.steps = int(state["steps"])
+
+    def _deposit(self) -> None:
+        """Lege die Spuren aller Agenten in einem gebündelten Aufruf ab."""
+
+        cells = np.trunc(self.positions).astype(np.int64).tolist()
+        sigmas = self.params["deposit_sigma"].tolist()
+        pulses = [
+            Pulse(position=(y, x), amplitude=battery, spread=sigma, tag=tag)
+            for (y, x), battery, sigma, tag in zip(
+                cells, self.batteries.tolist(), sigmas, self._tags
+            )
+        ]
+        self.field.inject_many(pulses)
+
+    def step(self, dt: float = 1.0) -> dict:
+        if not self.n_agents:
+            return {"trails": [], "center": (0.0, 0.0), "mean_battery": 0.0}
+        phi = np.asarray(self.field.phi)
+        center = self.positions.mean(axis=0)
+        curiosity = sample_gradient(phi, self.positions, self.boundary)
+        curiosity = curiosity * self.params["curiosity"][:, None]
+        cohesion = (center[None, :] - self.positions) * self.params["cohesion"][:, None]
+        velocity = self.velocities * 0.5 + curiosity
+        velocity = velocity + cohesion
+        velocity = velocity + avoidance_forces(
+            self.positions, self.params["avoidance"], self.field.shape, self.boundary
+        )
+        velocity = velocity + agent_noise(self.seed, self.steps, 0, self.n_agents)
+        self.steps += 1
+        self.velocities = velocity
+        self.positions = wrap_positions(self.positions + velocity * dt, self.field.shape, self.boundary)
+        self.batteries = np.maximum(0.0, self.batteries - 0.01)
+        coords = self.positions.tolist()
+        self._deposit()
+        trails = [((y, x), role) for (y, x), role in zip(coords, self.roles)]
+        mean_battery = float(self.batteries.mean())
+        return {
+            "trails": trails,
+            "center": (float(center[0]), float(center[1])),
+            "mean_battery": mean_battery,
+        }
+
+
+__all__ = [
+    "NumpySwarm",
+    "avoidance_forces",
+    "bilinear_sample",
+    "neighbor_pairs",
+    "role_params",
+    "sample_gradient",
+    "spawn_agents",
+    "wrap_positions",
+]
@@ -62,13 +62,30 @@ class BioBPETokenizer:
     def encode(self, text: str) -> list[int]:
         """Kodiert Text in Token-IDs."""
 
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts: Sequence[str]) -> list[list[int]]:
+        """Kodiert viele Texte; gleiche normalisierte Texte nur einmal.
+
+        Jede Merge-Regel wird in einem Durchgang auf alle noch offenen
+        Sequenzen angewendet; Sequenzen, die eines der beiden Symbole nicht
+        enthalten, werden dabei übersprungen.
+        """
+
         if not self.vocab:
             raise RuntimeError("Tokenizer is not fitted")
-        seq = list(normalize_text(text))
+        normalized = [normalize_text(text) for text in texts]
+        unique = list(dict.fromkeys(normalized))
+        sequences = [list(text) for text in unique]
         for pair in self.merges:
             new_token = self._merge_name(pair)
-            seq = self._merge_sequence(seq, pair, new_token)
-        return [self.vocab[token] for token in seq]
+            for idx, seq in enumerate(sequences):
+                if pair[0] in seq and pair[1] in seq:
+                    sequences[idx] = self._merge_sequence(seq, pair, new_token)
+        encoded = {
+            text: [self.vocab[token] for token in seq] for text, seq in zip(unique, sequences)
+        }
+        return [list(encoded[text]) for text in normalized]
 
     def decode(self, ids: Iterable[int]) -> str:
         """Dekodiere IDs in Text."""
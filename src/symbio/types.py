@@ -62,6 +62,13 @@ class Hotspot:
             "tags": [{"name": name, "strength": strength} for name, strength in tags],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Hotspot":
+        """Gegenstück zu :meth:`to_dict`."""
+
+        tags = {tag["name"]: float(tag["strength"]) for tag in data.get("tags", [])}
+        return cls(position=tuple(data["position"]), value=float(data["value"]), tags=tags)
+
 
 class Event(NamedTuple):
     """Ein Event im symbiotischen Zyklus."""
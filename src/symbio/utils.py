@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+import multiprocessing
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Sequence
 
@@ -30,6 +33,13 @@ def normalize_text(text: str) -> str:
     return " ".join(text.lower().strip().split())
 
 
+def stable_hash(text: str) -> int:
+    """64-Bit-BLAKE2-Hash, anders als ``hash`` in jedem Prozess gleich."""
+
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
 def deterministic_choice(options: Sequence[int], probs: Sequence[float], seed: int | None = None) -> int:
     rng = random.Random(seed)
     threshold = rng.random()
@@ -57,6 +67,47 @@ def gaussian_2d(shape: tuple[int, int], center: tuple[float, float], sigma: floa
     return field
 
 
+SUBCELL_STEPS = 8
+
+
+def kernel_anchor(center: tuple[float, float]) -> tuple[tuple[int, int], tuple[float, float]]:
+    """Zerlege ein Zentrum in Basiszelle und auf 1/SUBCELL_STEPS gerundeten Versatz."""
+
+    anchor = []
+    offset = []
+    for value in center:
+        base = math.floor(value)
+        frac = round((value - base) * SUBCELL_STEPS) / SUBCELL_STEPS
+        if frac >= 1.0:
+            base += 1
+            frac = 0.0
+        anchor.append(int(base))
+        offset.append(frac)
+    return (anchor[0], anchor[1]), (offset[0], offset[1])
+
+
+@lru_cache(maxsize=256)
+def gaussian_kernel(
+    sigma: float, offset: tuple[float, float] = (0.0, 0.0), truncate: float = 4.0
+) -> tuple[tuple[float, ...], ...]:
+    """Gauß-Kernel mit Amplitude 1 im Fenster ``±ceil(truncate·σ)`` um die Basiszelle."""
+
+    sigma = max(sigma, 1e-3)
+    sigma2 = sigma**2
+    radius = max(0, math.ceil(truncate * sigma))
+    oy, ox = offset
+    kernel = []
+    for ky in range(-radius, radius + 1):
+        dy = ky - oy
+        row = []
+        for kx in range(-radius, radius + 1):
+            dx = kx - ox
+            dist2 = (dy * dy + dx * dx) / (2 * sigma2)
+            row.append(math.exp(-dist2))
+        kernel.append(tuple(row))
+    return tuple(kernel)
+
+
 def write_json(path: Path | str, data: dict) -> None:
     Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
@@ -78,13 +129,29 @@ def moving_average(values: Iterable[float], window: int) -> list[float]:
     return result
 
 
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Startkontext für Prozesspools: ``forkserver``, sonst ``spawn``.
+
+    Kein ``fork``, da der Elternprozess Threads haben kann (Event-Log-Writer,
+    Executor des asynchronen Orchestrators).
+    """
+
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
 __all__ = [
     "ensure_dir",
     "softmax",
     "normalize_text",
+    "stable_hash",
     "deterministic_choice",
     "gaussian_2d",
+    "SUBCELL_STEPS",
+    "kernel_anchor",
+    "gaussian_kernel",
     "write_json",
     "read_json",
     "moving_average",
+    "worker_context",
 ]
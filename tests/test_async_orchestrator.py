@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from symbio.async_orchestrator import AsyncOrchestrator
+from symbio.batch import episode_cortex
+from symbio.biocortex import BioCortex
+from symbio.config import BioConfig, FieldConfig, SwarmConfig
+from symbio.hpio import HPIO
+from symbio.orchestrator import Orchestrator
+
+FIELD = FieldConfig(shape=(10, 10), relax_alpha=0.1, evaporate_rate=0.05)
+SWARM = SwarmConfig(n_agents=3, boundary="periodic", seed=2)
+
+
+def _cortex() -> BioCortex:
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8, concept_top_k=4))
+    cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse mit Feldern"])
+    return cortex
+
+
+def _strip(summary: dict) -> dict:
+    return {key: value for key, value in summary.items() if key != "events_per_sec"}
+
+
+def test_async_episodes_match_sync_and_leave_cortex_untouched():
+    cortex = _cortex()
+    weights = dict(cortex.graph.weights)
+    assert not cortex.placements
+    prompts = ["Die Architektur des Denkens", "Pulse mit Feldern", "Denkens verbindet"]
+
+    async def main():
+        async with AsyncOrchestrator(
+            cortex, FIELD, SWARM, max_workers=2, max_episodes=2
+        ) as runner:
+            return await runner.run_episodes(prompts, steps=8)
+
+    results = asyncio.run(main())
+    for prompt, summary in zip(prompts, results):
+        hpio = HPIO(field_config=FIELD, swarm_config=SWARM)
+        expected = Orchestrator(episode_cortex(cortex), hpio).run_episode(prompt, steps=8)
+        assert _strip(summary) == _strip(expected)
+    assert cortex.graph.weights == weights
+    assert not cortex.placements
+
+
+def test_async_episode_can_be_cancelled():
+    async def main():
+        async with AsyncOrchestrator(_cortex(), FIELD, SWARM, max_episodes=1) as runner:
+            slow = asyncio.create_task(runner.run_episode("Die Architektur", steps=10_000))
+            while runner.active == 0:
+                await asyncio.sleep(0)
+            slow.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await slow
+            assert runner.active == 0
+            # Der freigegebene Platz steht sofort der nächsten Episode zur Verfügung.
+            summary = await runner.run_episode("Pulse mit Feldern", steps=3)
+            assert summary["events"] > 0
+
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from symbio.apps.cli import main
+from symbio.batch import read_prompts, run_batch
+from symbio.biocortex import BioCortex
+from symbio.config import BioConfig, FieldConfig, SwarmConfig, SymbioConfig
+
+
+def _records(output: str) -> list[dict]:
+    records = [json.loads(line) for line in output.splitlines()]
+    for record in records:
+        assert "events_per_sec" not in record
+    return records
+
+
+def test_batch_preserves_order_and_is_deterministic(tmp_path):
+    config = SymbioConfig(
+        bio=BioConfig(ngram_order=2, replay_capacity=8, concept_top_k=4),
+        field=FieldConfig(shape=(10, 10), relax_alpha=0.1, evaporate_rate=0.05),
+        swarm=SwarmConfig(n_agents=3, boundary="periodic", seed=2),
+    )
+    cortex = BioCortex(config=config.bio)
+    cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse mit Feldern"])
+    cortex.save(tmp_path / "model")
+    prompts = tmp_path / "prompts.jsonl"
+    lines = [
+        {"id": "a", "prompt": "Die Architektur des Denkens"},
+        "Pulse mit Feldern",
+        {"id": "c", "prompt": "Die Architektur des Denkens", "seed": 9, "steps": 4},
+        {"prompt": "Denkens verbindet Pulse"},
+        {"id": "e", "prompt": "Die Architektur des Denkens"},
+    ]
+    prompts.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+
+    outputs = []
+    for workers in (1, 2):
+        handle = io.StringIO()
+        jobs = read_prompts(prompts, seed=config.swarm.seed, steps=8)
+        count = run_batch(tmp_path / "model", jobs, handle, config=config, workers=workers)
+        assert count == len(lines)
+        outputs.append(_records(handle.getvalue()))
+
+    serial, pooled = outputs
+    assert serial == pooled
+    assert [record["id"] for record in serial] == ["a", None, "c", None, "e"]
+    assert [record["seed"] for record in serial] == [2, 2, 9, 2, 2]
+    # Episoden teilen keinen Zustand: eine Wiederholung liefert dasselbe Ergebnis.
+    assert dict(serial[4], id="a") == serial[0]
+
+
+@pytest.mark.parametrize("flag", ["--save-run", "--event-log"])
+def test_batch_run_rejects_single_episode_outputs(tmp_path, flag):
+    with pytest.raises(SystemExit, match=flag):
+        main(["run", "--prompts", str(tmp_path / "prompts.jsonl"), flag, str(tmp_path / "out")])
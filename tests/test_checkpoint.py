@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from symbio.biocortex import BioCortex
+from symbio.checkpoint import CheckpointStore
+from symbio.config import BioConfig, FieldConfig, SwarmConfig
+from symbio.events import EventQueue, make_event
+from symbio.hpio import HPIO
+from symbio.orchestrator import Orchestrator
+from symbio.types import Hotspot, Pulse
+
+TEXTS = ["Bioinspirierte Architektur", "Feldreaktionen erzeugen neue Gedanken"]
+
+
+class TracingOrchestrator(Orchestrator):
+    crash_at: int | None = None
+
+    def run_tick(self, queue, step, monitor=None):
+        if step == self.crash_at:
+            raise RuntimeError("crash")
+        self.ticks = [*getattr(self, "ticks", []), step]
+        return Orchestrator.run_tick(self, queue, step, monitor)
+
+
+def _orchestrator(
+    backend: str, engine: str, cls=Orchestrator, shape: tuple[int, int] = (10, 10)
+) -> Orchestrator:
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=16, concept_top_k=4))
+    cortex.partial_fit(TEXTS)
+    hpio = HPIO(
+        field_config=FieldConfig(shape=shape, evaporate_rate=0.05, backend=backend),
+        swarm_config=SwarmConfig(n_agents=3, boundary="periodic", seed=3, engine=engine),
+    )
+    return cls(cortex, hpio)
+
+
+@pytest.mark.parametrize(("backend", "engine"), [("python", "python"), ("sparse", "numpy")])
+def test_resume_continues_exactly_from_last_checkpoint(tmp_path, backend, engine):
+    store = CheckpointStore(tmp_path / "ckpt")
+    reference = _orchestrator(backend, engine)
+    expected = reference.autopoietic_cycle(TEXTS, steps=20, threshold=0.3)
+
+    crashing = _orchestrator(backend, engine, TracingOrchestrator)
+    crashing.crash_at = 13
+    with pytest.raises(RuntimeError):
+        crashing.autopoietic_cycle(
+            TEXTS, steps=20, threshold=0.3, checkpoints=store, checkpoint_every=5
+        )
+    assert store.load()["episode"]["step"] == 10
+
+    resumed = _orchestrator(backend, engine, TracingOrchestrator)
+    result = resumed.autopoietic_cycle(
+        TEXTS, steps=20, threshold=0.3, checkpoints=store, checkpoint_every=5, resume=True
+    )
+    assert resumed.ticks == list(range(10, 20))
+    assert result == expected
+    np.testing.assert_array_equal(
+        np.asarray(resumed.hpio.field.phi), np.asarray(reference.hpio.field.phi)
+    )
+    assert resumed.biocortex.graph.weights == reference.biocortex.graph.weights
+    assert resumed.hpio.swarm.steps == reference.hpio.swarm.steps
+    assert resumed.event_log.total == reference.event_log.total
+
+
+def test_resume_rejects_other_texts(tmp_path):
+    store = CheckpointStore(tmp_path / "ckpt")
+    _orchestrator("python", "python").autopoietic_cycle(
+        TEXTS, steps=4, checkpoints=store, checkpoint_every=2
+    )
+    with pytest.raises(ValueError):
+        _orchestrator("python", "python").autopoietic_cycle(
+            TEXTS[:1], steps=4, checkpoints=store, resume=True
+        )
+
+
+def test_resume_rejects_other_field_shape(tmp_path):
+    store = CheckpointStore(tmp_path / "ckpt")
+    original = _orchestrator("python", "python")
+    original.autopoietic_cycle(TEXTS, steps=4, checkpoints=store, checkpoint_every=2)
+    with pytest.raises(ValueError, match="shape"):
+        _orchestrator("python", "python", shape=(14, 14)).autopoietic_cycle(
+            TEXTS, steps=4, checkpoints=store, resume=True
+        )
+    state = store.load()["hpio"]
+    with pytest.raises(ValueError, match="expected"):
+        _orchestrator("numpy", "numpy", shape=(14, 14)).hpio.field.set_state(state["field"])
+
+
+def test_checkpoint_store_only_writes_changed_chunks(tmp_path):
+    store = CheckpointStore(tmp_path, chunk_bytes=64)
+    phi = np.arange(64, dtype=np.float64).reshape(8, 8)
+    store.save({"phi": phi, "meta": {"step": 1}, "blob": b"abc"})
+    first = store.written
+    assert first == 8 + 1
+    phi[7, 7] = -1.0
+    store.save({"phi": phi, "meta": {"step": 2}, "blob": b"abc"})
+    assert store.written - first == 1
+    restored = store.load()
+    np.testing.assert_array_equal(restored["phi"], phi)
+    assert restored["meta"] == {"step": 2} and restored["blob"] == b"abc"
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 9
+
+
+def test_event_queue_state_is_plain_json(tmp_path):
+    queue = EventQueue()
+    queue.push(make_event("pulse", [Pulse(position=(1, 2), amplitude=0.5, spread=1.5, tag="a")]))
+    hotspot = Hotspot(position=(3, 4), value=0.9, tags={"a": 0.7, "b": 0.2})
+    queue.push(make_event("feedback", {"hotspots": [hotspot], "metrics": {"step": 3}}))
+    store = CheckpointStore(tmp_path)
+    store.save({"queue": queue.get_state()})
+    restored = EventQueue()
+    restored.set_state(store.load()["queue"])
+    assert list(restored.events) == list(queue.events)
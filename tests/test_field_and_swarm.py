@@ -1,5 +1,15 @@
+import numpy as np
+import pytest
+
+from symbio.agent import DEFAULT_ROLE_PARAMS
+from symbio.config import FieldConfig, SwarmConfig
 from symbio.field import Field
-from symbio.swarm import Swarm
+from symbio.field_numpy import NumpyField
+from symbio.hpio import HPIO
+from symbio.noise import agent_noise
+from symbio.spatial import SpatialHash, minimum_image
+from symbio.swarm import Swarm, create_swarm
+from symbio.swarm_numpy import NumpySwarm, neighbor_pairs
 from symbio.types import Pulse
 
 
@@ -27,3 +37,117 @@ def test_swarm_step_metrics():
     metrics = swarm.step()
     assert "trails" in metrics and metrics["trails"]
     assert 0.0 <= metrics["mean_battery"] <= 1.0
+
+
+@pytest.mark.parametrize("boundary", ["reflect", "periodic", "clamp"])
+def test_numpy_swarm_matches_python_swarm_for_single_agent(boundary):
+    reference = Swarm(field=Field((12, 12)), n_agents=1, boundary=boundary, seed=5)
+    vectorized = NumpySwarm(field=Field((12, 12)), n_agents=1, boundary=boundary, seed=5)
+    for _ in range(4):
+        assert vectorized.step() == reference.step()
+    assert vectorized.field.phi == reference.field.phi
+
+
+@pytest.mark.parametrize("boundary", ["reflect", "periodic", "clamp"])
+def test_numpy_swarm_matches_synchronous_python_swarm(boundary):
+    reference = Swarm(field=Field((12, 12)), n_agents=12, boundary=boundary, seed=5)
+    vectorized = NumpySwarm(field=Field((12, 12)), n_agents=12, boundary=boundary, seed=5)
+    for _ in range(6):
+        expected, actual = reference.step(), vectorized.step()
+        assert actual["center"] == pytest.approx(expected["center"], abs=1e-9)
+        assert actual["mean_battery"] == pytest.approx(expected["mean_battery"], abs=1e-12)
+        assert [role for _, role in actual["trails"]] == [role for _, role in expected["trails"]]
+        np.testing.assert_allclose(
+            [pos for pos, _ in actual["trails"]], [pos for pos, _ in expected["trails"]], atol=1e-9
+        )
+    np.testing.assert_allclose(vectorized.field.phi, reference.field.phi, atol=1e-9)
+
+
+def test_synchronous_swarm_deposits_after_all_moves():
+    sequential = Swarm(field=Field((12, 12)), n_agents=6, seed=2, synchronous=False)
+    synchronous = Swarm(field=Field((12, 12)), n_agents=6, seed=2, synchronous=True)
+    for _ in range(2):
+        first, second = sequential.step(), synchronous.step()
+    assert first["trails"] != second["trails"]
+
+    reference = Swarm(field=Field((12, 12)), n_agents=6, seed=2, synchronous=False)
+    lone = Swarm(field=Field((12, 12)), n_agents=6, seed=2, synchronous=True)
+    assert reference.step()["trails"][0] == lone.step()["trails"][0]
+    sigmas = {role: params["deposit_sigma"] for role, params in DEFAULT_ROLE_PARAMS.items()}
+    expected = Field((12, 12))
+    expected.inject_many(
+        Pulse(position=(int(y), int(x)), amplitude=0.99, spread=sigmas[role], tag=f"agent:{role}")
+        for (y, x), role in [(agent.position, agent.role) for agent in lone.agents]
+    )
+    assert lone.field.phi == expected.phi
+
+
+def test_numpy_swarm_runs_many_agents():
+    hpio = HPIO(
+        field_config=FieldConfig(shape=(32, 32), backend="numpy"),
+        swarm_config=SwarmConfig(n_agents=500, engine="numpy"),
+    )
+    metrics = hpio.step()
+    assert len(metrics["trails"]) == 500
+    assert {role for _, role in metrics["trails"]} == set(DEFAULT_ROLE_PARAMS)
+    assert metrics["mean_battery"] == pytest.approx(0.99)
+    for y, x in (pos for pos, _ in metrics["trails"]):
+        assert 0.0 <= y <= 31.0 and 0.0 <= x <= 31.0
+    with pytest.raises(ValueError):
+        create_swarm(hpio.field, SwarmConfig(engine="gpu"))
+
+
+@pytest.mark.parametrize(("shape", "periodic"), [((13, 9), True), ((13, 9), False), ((5, 3), True)])
+def test_cell_lists_find_all_close_pairs(shape, periodic):
+    rng = np.random.default_rng(3)
+    positions = rng.random((150, 2)) * (np.array(shape) - (0 if periodic else 1))
+    h, w = shape
+
+    def close(a, b):
+        dy, dx = a[0] - b[0], a[1] - b[1]
+        if periodic:
+            dy, dx = minimum_image(dy, h), minimum_image(dx, w)
+        return dy * dy + dx * dx < 4.0
+
+    expected = {
+        (i, j)
+        for i in range(len(positions))
+        for j in range(len(positions))
+        if i != j and close(positions[i], positions[j])
+    }
+    rows, cols = neighbor_pairs(positions, shape, 2.0, periodic)
+    found = set(zip(rows.tolist(), cols.tolist()))
+    assert len(found) == len(rows)
+    assert expected <= found
+    grid = SpatialHash(shape, 2.0, periodic)
+    grid.rebuild([tuple(p) for p in positions.tolist()])
+    for i, position in enumerate(positions.tolist()):
+        assert {j for a, j in expected if a == i} <= set(grid.near(tuple(position)))
+
+
+@pytest.mark.parametrize("truncate", [None, 4.0])
+def test_batched_deposits_match_sequential_injection(truncate):
+    swarm = NumpySwarm(field=NumpyField((24, 24), truncate=truncate), n_agents=40, boundary="reflect", seed=4)
+    metrics = swarm.step()
+    reference = NumpyField((24, 24), truncate=truncate)
+    sigmas = {role: params["deposit_sigma"] for role, params in DEFAULT_ROLE_PARAMS.items()}
+    for (y, x), role in metrics["trails"]:
+        reference.inject_gaussian(
+            Pulse(position=(int(y), int(x)), amplitude=0.99, spread=sigmas[role], tag=f"agent:{role}")
+        )
+    np.testing.assert_allclose(swarm.field.phi, reference.phi, rtol=1e-12)
+    np.testing.assert_allclose(swarm.field.imprint.sum(axis=0), reference.imprint.sum(axis=0), rtol=1e-5)
+
+
+def test_agent_noise_is_keyed_by_seed_step_and_agent():
+    full = agent_noise(seed=9, step=3, start=0, stop=7)
+    assert full.shape == (7, 2)
+    assert np.all(np.abs(full) <= 0.05)
+    np.testing.assert_array_equal(agent_noise(9, 3, 0, 7), full)
+    for start, stop in ((1, 4), (3, 7), (6, 7)):
+        np.testing.assert_array_equal(agent_noise(9, 3, start, stop), full[start:stop])
+    assert not np.array_equal(agent_noise(9, 4, 0, 7), full)
+    assert not np.array_equal(agent_noise(10, 3, 0, 7), full)
+    negative = agent_noise(-9, 3, 0, 7)
+    assert negative.shape == (7, 2) and not np.array_equal(negative, full)
+    np.testing.assert_array_equal(agent_noise(-9, 3, 2, 5), negative[2:5])
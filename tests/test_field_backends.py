@@ -0,0 +1,317 @@
+import numpy as np
+import pytest
+
+from symbio.config import FieldConfig, SwarmConfig
+from symbio.field import Field, create_field
+from symbio.field_numpy import NumpyField
+from symbio.hpio import HPIO
+from symbio.types import Pulse
+
+
+def _drive(field: Field, steps: int = 6) -> None:
+    field.inject_gaussian(Pulse(position=(3, 4), amplitude=1.2, spread=1.5, tag="alpha"))
+    field.inject_gaussian(Pulse(position=(9, 1), amplitude=0.8, spread=2.0, tag="beta"))
+    for _ in range(steps):
+        field.relax(alpha=0.2)
+        field.evaporate(0.05)
+
+
+def test_numpy_backend_matches_list_backend():
+    reference = Field((12, 10))
+    vectorized = NumpyField((12, 10))
+    _drive(reference)
+    _drive(vectorized)
+    np.testing.assert_allclose(vectorized.phi, np.asarray(reference.phi), rtol=1e-12, atol=1e-12)
+    assert reference.argmax()[0] == vectorized.argmax()[0]
+    ref_spots = reference.hotspots(threshold=0.2)
+    vec_spots = vectorized.hotspots(threshold=0.2)
+    assert [spot.position for spot in ref_spots] == [spot.position for spot in vec_spots]
+    for ref, vec in zip(ref_spots, vec_spots):
+        assert set(ref.tags) == set(vec.tags)
+        for tag, value in ref.tags.items():
+            assert vec.tags[tag] == pytest.approx(value, rel=1e-5, abs=1e-6)
+
+
+def test_tag_tensor_drops_faint_channels():
+    field = NumpyField((8, 8), tag_floor=0.5)
+    field.inject_gaussian(Pulse(position=(2, 2), amplitude=1.0, spread=1.0, tag="strong"))
+    field.inject_gaussian(Pulse(position=(5, 5), amplitude=0.01, spread=1.0, tag="faint"))
+    assert field.imprint.shape == (2, 8, 8)
+    assert field.imprint.dtype == np.float32
+    field.relax(alpha=0.1)
+    field.evaporate(0.1)
+    assert list(field.channels) == ["strong"]
+    assert field.imprint.shape == (1, 8, 8)
+    assert "faint" not in field.cell_tags(5, 5)
+    assert field.cell_tags(2, 2)["strong"] > 0.0
+
+
+def test_create_field_rejects_unknown_backend():
+    assert isinstance(create_field(FieldConfig(shape=(4, 4), backend="numpy")), NumpyField)
+    with pytest.raises(ValueError):
+        create_field(FieldConfig(shape=(4, 4), backend="gpu"))
+
+
+def test_hpio_runs_on_numpy_backend():
+    hpio = HPIO(
+        field_config=FieldConfig(shape=(12, 12), backend="numpy"),
+        swarm_config=SwarmConfig(n_agents=3, boundary="periodic", seed=2),
+    )
+    hpio.inject_pulses([Pulse(position=(6, 6), amplitude=1.0, spread=2.0, tag="x")])
+    metrics = hpio.step()
+    hpio.relax_and_evaporate()
+    hpio.polish()
+    assert metrics["best_pos"] is not None
+    assert hpio.best_val > 0.0
+
+
+def test_windowed_injection_matches_full_grid_near_center():
+    exact = Field((24, 24), truncate=None)
+    windowed = Field((24, 24), truncate=4.0)
+    pulse = Pulse(position=(12, 3), amplitude=1.0, spread=2.0, tag="p")
+    exact.inject_gaussian(pulse)
+    windowed.inject_gaussian(pulse)
+    np.testing.assert_allclose(np.asarray(windowed.phi), np.asarray(exact.phi), atol=5e-4)
+    assert windowed.phi[12][3] == exact.phi[12][3]
+    assert windowed.phi[0][23] == 0.0
+
+
+def test_pulse_outside_window_allocates_no_tag_channel():
+    field = NumpyField((16, 16), truncate=4.0)
+    outside = Pulse(position=(-40, -40), amplitude=1.0, spread=1.0, tag="fern")
+    field.inject_gaussian(outside)
+    field.inject_many([outside, Pulse(position=(40, 40), amplitude=1.0, spread=1.0, tag="weit")])
+    assert field.channels == {}
+    assert not field.phi.any()
+
+
+def test_inject_many_matches_sequential_injection():
+    pulses = [
+        Pulse(position=(1, 1), amplitude=0.7, spread=1.5, tag="a"),
+        Pulse(position=(6, 7), amplitude=0.4, spread=2.5, tag="b"),
+        Pulse(position=(2, 1), amplitude=0.9, spread=1.5, tag="a"),
+        Pulse(position=(9, 0), amplitude=0.3, spread=1.5, tag="c"),
+    ]
+    sequential = NumpyField((10, 10))
+    batched = NumpyField((10, 10))
+    for pulse in pulses:
+        sequential.inject_gaussian(pulse)
+    batched.inject_many(pulses)
+    np.testing.assert_allclose(batched.phi, sequential.phi, rtol=1e-12)
+    np.testing.assert_allclose(batched.imprint, sequential.imprint, rtol=1e-6)
+    assert batched.channels == sequential.channels
+
+
+def _two_blobs(field: Field) -> None:
+    field.inject_gaussian(Pulse(position=(3, 3), amplitude=1.0, spread=1.5, tag="links"))
+    field.inject_gaussian(Pulse(position=(3, 12), amplitude=0.8, spread=1.5, tag="rechts"))
+
+
+def test_merged_hotspots_one_per_region():
+    reference = Field((8, 16))
+    vectorized = NumpyField((8, 16))
+    _two_blobs(reference)
+    _two_blobs(vectorized)
+    assert len(reference.hotspots(threshold=0.2)) > 2
+    for field in (reference, vectorized):
+        merged = field.hotspots(threshold=0.2, merge=True)
+        assert [spot.position for spot in merged] == [(3, 3), (3, 12)]
+        assert max(merged[0].tags, key=merged[0].tags.get) == "links"
+        assert max(merged[1].tags, key=merged[1].tags.get) == "rechts"
+        assert field.hotspots(threshold=0.2, merge=True, top_n=1)[0].position == (3, 3)
+    ref_merged = reference.hotspots(threshold=0.2, merge=True)
+    vec_merged = vectorized.hotspots(threshold=0.2, merge=True)
+    for ref, vec in zip(ref_merged, vec_merged):
+        assert vec.value == pytest.approx(ref.value)
+        for tag, value in ref.tags.items():
+            assert vec.tags[tag] == pytest.approx(value, rel=1e-5)
+
+
+def test_top_n_keeps_strongest_cells():
+    field = NumpyField((8, 16))
+    _two_blobs(field)
+    top = field.hotspots(threshold=0.2, top_n=3)
+    assert len(top) == 3
+    assert top[0].position == (3, 3)
+    assert top[0].value >= top[1].value >= top[2].value
+
+
+@pytest.mark.parametrize("boundary", ["reflect", "periodic"])
+def test_boundaries_match_between_backends(boundary):
+    reference = Field((9, 7), boundary=boundary)
+    vectorized = NumpyField((9, 7), boundary=boundary)
+    for field in (reference, vectorized):
+        field.inject_gaussian(Pulse(position=(0, 6), amplitude=1.0, spread=1.5, tag="rand"))
+        for _ in range(4):
+            field.relax(alpha=0.3)
+    np.testing.assert_allclose(vectorized.phi, np.asarray(reference.phi), rtol=1e-12, atol=1e-15)
+    assert sum(map(sum, reference.phi)) == pytest.approx(float(vectorized.phi.sum()))
+
+
+@pytest.mark.parametrize("boundary", ["reflect", "periodic", "edge"])
+def test_relax_n_matches_repeated_steps(boundary):
+    stepped = NumpyField((12, 10), boundary=boundary)
+    spectral = NumpyField((12, 10), boundary=boundary)
+    for field in (stepped, spectral):
+        _two_blobs_small(field)
+    for _ in range(25):
+        stepped.relax(alpha=0.15)
+        stepped.evaporate(0.02)
+    spectral.relax_n(0.15, 25, evaporate_rate=0.02)
+    np.testing.assert_allclose(spectral.phi, stepped.phi, atol=1e-10)
+    np.testing.assert_allclose(spectral.imprint, stepped.imprint, atol=1e-5)
+    assert spectral.channels == stepped.channels
+
+
+def _two_blobs_small(field: Field) -> None:
+    field.inject_gaussian(Pulse(position=(2, 2), amplitude=1.0, spread=1.5, tag="a"))
+    field.inject_gaussian(Pulse(position=(9, 8), amplitude=0.6, spread=2.0, tag="b"))
+
+
+@pytest.mark.parametrize("boundary", ["edge", "periodic"])
+def test_tiled_field_is_bitwise_equal_to_numpy(boundary):
+    from symbio.field_tiled import TiledField
+
+    reference = NumpyField((13, 10), boundary=boundary)
+    _drive(reference)
+    for workers, tile_rows in ((2, None), (3, 4)):
+        with TiledField((13, 10), workers=workers, tile_rows=tile_rows, boundary=boundary) as tiled:
+            _drive(tiled)
+            np.testing.assert_array_equal(tiled.phi, reference.phi)
+            np.testing.assert_array_equal(tiled.imprint, reference.imprint)
+            for merge in (False, True):
+                expected = reference.hotspots(threshold=0.05, merge=merge)
+                assert tiled.hotspots(threshold=0.05, merge=merge) == expected
+
+
+def _attached_segments() -> list[str]:
+    from symbio.field_tiled import _ATTACHED
+
+    return sorted(_ATTACHED)
+
+
+def test_tiled_workers_detach_freed_channel_segments():
+    from symbio.field_tiled import TiledField
+
+    reference = NumpyField((8, 8))
+    with TiledField((8, 8), workers=1) as tiled:
+        for tags in (["t0"], [f"t{i}" for i in range(6)]):
+            for field in (reference, tiled):
+                for tag in tags:
+                    field.inject_gaussian(Pulse(position=(4, 4), amplitude=1.0, spread=1.0, tag=tag))
+                field.relax(alpha=0.2)
+        np.testing.assert_array_equal(tiled.imprint, reference.imprint)
+        assert tiled._pool().apply(_attached_segments) == sorted(tiled._arrays)
+
+
+@pytest.mark.parametrize("boundary", ["edge", "reflect", "periodic"])
+def test_sparse_field_matches_numpy_without_floor(boundary):
+    from symbio.field_sparse import SparseField
+
+    reference = NumpyField((20, 18), boundary=boundary)
+    sparse = SparseField((20, 18), block_size=4, block_floor=0.0, boundary=boundary)
+    for field in (reference, sparse):
+        _drive(field, steps=10)
+    np.testing.assert_array_equal(sparse.phi, reference.phi)
+    np.testing.assert_array_equal(sparse.imprint, reference.imprint)
+    assert sparse.argmax() == reference.argmax()
+    for merge in (False, True):
+        expected = reference.hotspots(threshold=0.05, merge=merge)
+        assert sparse.hotspots(threshold=0.05, merge=merge) == expected
+
+
+def test_sparse_field_drops_decayed_blocks():
+    from symbio.field_sparse import SparseField
+
+    field = SparseField((64, 64), block_size=8, block_floor=1e-3, truncate=4.0)
+    field.inject_gaussian(Pulse(position=(5, 5), amplitude=1.0, spread=1.0, tag="a"))
+    assert field.active == {(0, 0), (0, 1), (1, 0), (1, 1)}
+    field.relax(alpha=0.2)
+    assert len(field.active) == 9
+    for _ in range(40):
+        field.relax(alpha=0.2)
+        field.evaporate(0.3)
+    assert not field.active
+    assert not field.phi.any()
+    assert field.hotspots(threshold=0.01) == []
+
+
+@pytest.mark.parametrize(("dtype", "rtol"), [("float32", 1e-5), ("float16", 2e-2)])
+def test_reduced_precision_keeps_hotspots(dtype, rtol):
+    # Drift gegenüber float64: float32 ~1e-6 relativ, float16 ~1e-3 relativ.
+    reference = create_field(FieldConfig(shape=(24, 24), backend="numpy"))
+    reduced = create_field(FieldConfig(shape=(24, 24), backend="numpy", dtype=dtype))
+    for field in (reference, reduced):
+        _two_blobs(field)
+        field.relax_n(0.2, 5, 0.02)
+    assert reduced.phi.dtype == np.dtype(dtype)
+    assert reduced.imprint.itemsize <= 4
+    np.testing.assert_allclose(reduced.phi, reference.phi, rtol=rtol, atol=rtol * 1e-2)
+    expected = reference.hotspots(threshold=0.1, merge=True)
+    actual = reduced.hotspots(threshold=0.1, merge=True)
+    assert [spot.position for spot in actual] == [spot.position for spot in expected]
+    for ref, red in zip(expected, actual):
+        assert red.value == pytest.approx(ref.value, rel=rtol)
+        assert set(red.tags) == set(ref.tags)
+
+
+def test_python_backend_rejects_reduced_precision():
+    with pytest.raises(ValueError):
+        create_field(FieldConfig(shape=(4, 4), dtype="float32"))
+
+
+@pytest.mark.parametrize("boundary", ["edge", "periodic"])
+def test_fused_tick_matches_separate_passes(boundary, monkeypatch):
+    monkeypatch.setattr("symbio.field_numpy.TICK_CHUNK_ROWS", 5)
+    fused = NumpyField((23, 11), boundary=boundary)
+    separate = NumpyField((23, 11), boundary=boundary)
+    for field in (fused, separate):
+        _drive(field, steps=2)
+    for _ in range(4):
+        best_pos, best_val, mask = fused.fused_tick(0.2, 0.05, threshold=0.05)
+        assert (best_pos, best_val) == separate.argmax()
+        separate.relax(0.2)
+        separate.evaporate(0.05)
+        np.testing.assert_array_equal(fused.phi, separate.phi)
+        np.testing.assert_array_equal(fused.imprint, separate.imprint)
+        np.testing.assert_array_equal(mask, separate.phi >= 0.05)
+    assert fused.hotspots(0.05, merge=True, mask=mask) == separate.hotspots(0.05, merge=True)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_hpio_tick_matches_step_and_relax(backend):
+    configs = dict(
+        field_config=FieldConfig(shape=(12, 12), backend=backend),
+        swarm_config=SwarmConfig(n_agents=3, seed=2),
+    )
+    fused, separate = HPIO(**configs), HPIO(**configs)
+    for hpio in (fused, separate):
+        hpio.inject_pulses([Pulse(position=(6, 6), amplitude=1.0, spread=2.0, tag="x")])
+    for _ in range(3):
+        metrics, mask = fused.tick(0.3)
+        assert metrics == separate.step()
+        separate.relax_and_evaporate()
+    np.testing.assert_array_equal(np.asarray(fused.field.phi), np.asarray(separate.field.phi))
+    if backend == "numpy":
+        np.testing.assert_array_equal(mask, separate.field.phi >= 0.3)
+    else:
+        assert mask is None
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy", "tiled", "sparse"])
+def test_tick_change_bounds_the_observed_change(backend):
+    field = create_field(FieldConfig(shape=(10, 10), backend=backend, kernel_truncate=4.0, workers=2))
+    field.inject_gaussian(Pulse(position=(4, 5), amplitude=1.0, spread=1.5, tag="a"))
+    previous = np.zeros((10, 10))
+    for step in range(6):
+        if step == 3:
+            field.inject_gaussian(Pulse(position=(2, 2), amplitude=0.5, spread=1.0, tag="b"))
+        field.fused_tick(0.2, 0.1)
+        current = np.array(field.phi)
+        mass_change, max_change, peak = field.tick_change
+        assert mass_change == pytest.approx(current.sum() - previous.sum())
+        assert max_change >= np.abs(current - previous).max() - 1e-12
+        assert peak == current.max()
+        previous = current
+    if hasattr(field, "close"):
+        field.close()
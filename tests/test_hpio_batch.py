@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from symbio.config import FieldConfig, SwarmConfig
+from symbio.hpio import HPIO
+from symbio.hpio_batch import HPIOBatch
+from symbio.types import Pulse
+
+
+def _configs():
+    fields = [
+        FieldConfig(
+            shape=(16, 16),
+            backend="numpy",
+            relax_alpha=alpha,
+            evaporate_rate=rate,
+            kernel_truncate=4.0,
+        )
+        for alpha, rate in ((0.1, 0.01), (0.2, 0.05), (0.3, 0.0))
+    ]
+    swarms = [SwarmConfig(n_agents=n, seed=seed, engine="numpy") for n, seed in ((4, 1), (7, 2), (1, 3))]
+    return fields, swarms
+
+
+def test_batch_matches_individual_instances():
+    fields, swarms = _configs()
+    batch = HPIOBatch(fields, swarms)
+    singles = [HPIO(field_config=f, swarm_config=s) for f, s in zip(fields, swarms)]
+    pulse = Pulse(position=(8.3, 5.6), amplitude=1.0, spread=2.0, tag="x")
+    batch.inject_pulses([pulse])
+    for hpio in singles:
+        hpio.inject_pulses([pulse])
+    for _ in range(5):
+        batched = batch.step()
+        batch.relax_and_evaporate()
+        for idx, hpio in enumerate(singles):
+            expected = hpio.step()
+            hpio.relax_and_evaporate()
+            got = batched[idx]
+            assert got["best_pos"] == expected["best_pos"]
+            assert got["best_val"] == pytest.approx(expected["best_val"])
+            assert got["mean_battery"] == pytest.approx(expected["mean_battery"])
+            assert got["center"] == pytest.approx(expected["center"])
+            assert [role for _, role in got["trails"]] == [role for _, role in expected["trails"]]
+            np.testing.assert_allclose(
+                [pos for pos, _ in got["trails"]], [pos for pos, _ in expected["trails"]], atol=1e-9
+            )
+    for idx, hpio in enumerate(singles):
+        np.testing.assert_allclose(batch.phi[idx], hpio.field.phi, atol=1e-12)
+
+
+def test_batch_rejects_mismatched_fields():
+    with pytest.raises(ValueError):
+        HPIOBatch([FieldConfig(shape=(8, 8)), FieldConfig(shape=(9, 9))], [SwarmConfig()] * 2)
@@ -12,3 +12,39 @@ def test_reinforce_increases_weight():
     assert after > before
     graph.evaporate(0.1)
     assert (1, 2) in graph.weights
+
+
+def test_node_cap_evicts_weakest_edges():
+    graph = MyceliumGraph(max_out_edges=2)
+    graph.reinforce([1, 2], amount=3.0)
+    graph.reinforce([1, 3], amount=2.0)
+    graph.reinforce([1, 4], amount=0.5)
+    assert graph.top_k_successors(1, k=2) == [2, 3]
+    assert (1, 4) not in graph.weights and (1, 4) not in graph.pheromones
+    assert graph.stats()["evicted_node_cap"] == 1
+
+
+def test_global_budget_keeps_strong_edges():
+    graph = MyceliumGraph(max_edges=4, prune_ratio=0.0)
+    for node in range(8):
+        graph.reinforce([node, node + 1], amount=float(node + 1))
+    stats = graph.stats()
+    assert stats["edges"] == 4
+    assert stats["evicted_budget"] == 4
+    assert set(graph.weights) == {(4, 5), (5, 6), (6, 7), (7, 8)}
+    assert graph.top_k_successors(7) == [8]
+
+
+def test_strongest_edge_tracks_reinforce_and_evaporate():
+    graph = MyceliumGraph()
+    assert graph.strongest_edge() is None
+    graph.reinforce([1, 2], amount=1.0)
+    graph.reinforce([3, 4], amount=2.0)
+    assert graph.strongest_edge() == ((3, 4), 2.0)
+    graph.reinforce([1, 2], amount=1.5)
+    assert graph.strongest_edge() == ((1, 2), 2.5)
+    graph.evaporate(0.5)
+    assert graph.strongest_edge() == ((1, 2), 1.25)
+    graph.pheromones = {(5, 6): 3.0}
+    graph.rebuild_index()
+    assert graph.strongest_edge() == ((5, 6), 3.0)
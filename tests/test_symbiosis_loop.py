@@ -1,7 +1,21 @@
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from symbio.autopoiesis import SynthesisCache, SynthesisPool, synthesize_thoughts
 from symbio.biocortex import BioCortex
+from symbio.bridge import text_to_pulses, texts_to_pulses
 from symbio.config import SymbioConfig, BioConfig, FieldConfig, SwarmConfig
+from symbio.event_log import EventLog, read_events
+from symbio.events import EventQueue, iter_by_kind, make_event
 from symbio.hpio import HPIO
+from symbio.feedback import apply_feedback
 from symbio.orchestrator import Orchestrator
+from symbio.types import Concept, Hotspot, Pulse
 
 
 def test_symbiosis_generates_feedback(tmp_path):
@@ -37,3 +51,239 @@ def test_autopoietic_cycle_creates_sentences():
     result = orchestrator.autopoietic_cycle(corpus, steps=20, threshold=0.1, max_sentences=2)
     assert result["sentences"]
     assert all(isinstance(sentence, str) and sentence for sentence in result["sentences"])
+
+
+def test_apply_feedback_reinforces_strongest_edge_once():
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+    cortex.graph.reinforce([1, 2], amount=1.0)
+    cortex.graph.reinforce([3, 4], amount=2.0)
+    hotspots = [Hotspot(position=(0, 0), value=0.5), Hotspot(position=(1, 1), value=1.0)]
+    result = apply_feedback(cortex, hotspots)
+    assert result["count"] == 2
+    assert [edge for edge, _ in result["reinforcements"]] == [(3, 4), (3, 4)]
+    expected = 2.0 + sum(amount for _, amount in result["reinforcements"])
+    assert abs(cortex.graph.pheromones[(3, 4)] - expected) < 1e-9
+    assert cortex.graph.pheromones[(1, 2)] == 1.0
+    assert cortex.neuromod.dopamine > 1.0
+
+
+def test_event_queue_coalesces_consecutive_events():
+    queue = EventQueue()
+    pulse_a = Pulse(position=(1, 1), amplitude=1.0, spread=1.0, tag="a")
+    pulse_b = Pulse(position=(2, 2), amplitude=1.0, spread=1.0, tag="b")
+    spot = Hotspot(position=(0, 0), value=1.0, tags={"a": 1.0})
+    queue.extend(
+        [
+            make_event("pulse", [pulse_a]),
+            make_event("pulse", [pulse_b]),
+            make_event("tick", {"step": 0}),
+            make_event("feedback", {"hotspots": [spot], "metrics": {"n": 1}}),
+            make_event("feedback", {"hotspots": [spot], "metrics": {"n": 2}}),
+            make_event("tick", {"step": 1}),
+            make_event("tick", {"step": 2}),
+        ]
+    )
+    assert queue.pop() == make_event("pulse", [pulse_a, pulse_b])
+    assert queue.pop().kind == "tick"
+    assert queue.pop() == make_event("feedback", {"hotspots": [spot, spot], "metrics": {"n": 2}})
+    assert [queue.pop().payload for _ in range(2)] == [{"step": 1}, {"step": 2}]
+    assert not queue
+    assert queue.coalesced == 2
+
+
+def test_feedback_interval_merges_feedback_within_episode():
+    def episode(interval):
+        cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+        cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse"])
+        hpio = HPIO(field_config=FieldConfig(shape=(8, 8)), swarm_config=SwarmConfig(n_agents=2))
+        orchestrator = Orchestrator(cortex, hpio, feedback_interval=interval)
+        summary = orchestrator.run_episode("Architektur des Denkens", steps=12)
+        feedback = list(iter_by_kind(orchestrator.event_log, "feedback"))
+        return summary, feedback
+
+    every_tick, single = episode(1)
+    batched, merged = episode(4)
+    assert every_tick["coalesced"] == 0 and len(single) == 12
+    assert len(merged) == 3 and batched["coalesced"] == 9
+    assert sum(len(event.payload["hotspots"]) for event in merged) == sum(
+        len(event.payload["hotspots"]) for event in single
+    )
+
+
+def test_run_episode_reports_throughput():
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+    cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse"])
+    hpio = HPIO(field_config=FieldConfig(shape=(8, 8)), swarm_config=SwarmConfig(n_agents=2))
+    orchestrator = Orchestrator(cortex, hpio)
+    summary = orchestrator.run_episode("Architektur", steps=5)
+    assert orchestrator.events_processed == summary["events"]
+    assert summary["events_per_sec"] > 0.0
+
+
+def test_event_log_keeps_ring_buffer_and_spills_to_jsonl(tmp_path):
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+    cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse"])
+    hpio = HPIO(field_config=FieldConfig(shape=(8, 8)), swarm_config=SwarmConfig(n_agents=2))
+    path = tmp_path / "events.jsonl"
+    with EventLog(capacity=4, path=path, batch_size=3) as log:
+        summary = Orchestrator(cortex, hpio, event_log=log).run_episode("Architektur", steps=6)
+    assert len(log) == 4
+    assert summary["events"] == log.total > 4
+    spilled = list(read_events(path))
+    assert len(spilled) == log.total
+    assert [event.kind for event in spilled[-4:]] == [event.kind for event in log]
+    ticks = list(iter_by_kind(read_events(path), "tick"))
+    assert [event.payload["step"] for event in ticks] == list(range(6))
+
+
+def test_event_log_reports_writer_errors_instead_of_hanging(tmp_path):
+    log = EventLog(path=tmp_path / "events.jsonl")
+    log.append(make_event("tick", {"step": object()}))
+    with pytest.raises(TypeError):
+        log.flush()
+    with pytest.raises(TypeError):
+        log.append(make_event("tick", {"step": 1}))
+    with pytest.raises(TypeError):
+        log.close()
+    assert log.total == 1
+    assert (tmp_path / "events.jsonl").read_text(encoding="utf-8") == ""
+
+
+def test_event_log_bounds_pending_writes(tmp_path):
+    with EventLog(path=tmp_path / "events.jsonl", max_pending=4, batch_size=2) as log:
+        assert log._queue.maxsize == 4
+        for step in range(50):
+            log.append(make_event("tick", {"step": step}))
+    assert [event.payload["step"] for event in read_events(tmp_path / "events.jsonl")] == list(range(50))
+
+
+def test_quiescent_field_skips_remaining_ticks():
+    def episode(tol):
+        cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+        cortex.partial_fit(["Die Architektur des Denkens verbindet Pulse"])
+        hpio = HPIO(
+            field_config=FieldConfig(shape=(8, 8), evaporate_rate=0.5),
+            swarm_config=SwarmConfig(n_agents=0),
+        )
+        orchestrator = Orchestrator(cortex, hpio, quiescence_tol=tol)
+        return cortex, orchestrator.run_episode("Architektur", steps=60)
+
+    cortex, summary = episode(1e-4)
+    reference, full = episode(None)
+    assert full["skipped_ticks"] == 0
+    assert 0 < summary["skipped_ticks"] < 60
+    assert summary["events"] < full["events"]
+    assert cortex.neuromod.dopamine == pytest.approx(reference.neuromod.dopamine)
+    assert cortex.graph.weights.keys() == reference.graph.weights.keys()
+    for key, weight in reference.graph.weights.items():
+        assert cortex.graph.weights[key] == pytest.approx(weight)
+
+
+def test_pooled_synthesis_dedups_tag_multisets_and_reuses_cache():
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+    cortex.partial_fit(["Bioinspirierte Architektur", "Feldreaktionen erzeugen neue Gedanken"])
+    hotspots = [
+        Hotspot(position=(0, 0), value=0.9, tags={"Architektur": 0.5, "neue": 0.4}),
+        Hotspot(position=(1, 1), value=0.8, tags={"neue": 0.6, "architektur": 0.2}),
+        Hotspot(position=(2, 2), value=0.7, tags={"Gedanken": 0.3, "agent:scout": 0.9}),
+    ]
+    pooled = []
+    for workers in (1, 2):
+        cache = SynthesisCache()
+        cortex.rng = random.Random(5)
+        cortex.last_neology = None
+        pooled.append(synthesize_thoughts(cortex, hotspots, workers=workers, cache=cache))
+        assert len(cache) == 2
+        assert cortex.last_neology is not None
+    assert pooled[0] == pooled[1]
+    sequential = synthesize_thoughts(cortex, hotspots)
+    assert len(sequential) == 3
+    assert pooled[0][0].startswith("architektur neue")
+    assert pooled[0][1].startswith("gedanken")
+
+    state = cortex.rng.getstate()
+    # Feedback verschiebt Dopamin, der Cache trifft trotzdem.
+    cortex.neuromod.dopamine += 0.3
+    again = synthesize_thoughts(cortex, hotspots, workers=2, cache=cache)
+    assert again == pooled[1]
+    assert cortex.rng.getstate() == state
+
+    pool = SynthesisPool(2)
+    try:
+        first = synthesize_thoughts(cortex, hotspots, workers=2, pool=pool)
+        executor = pool._executor
+        assert executor is not None
+        synthesize_thoughts(cortex, hotspots, workers=2, pool=pool)
+        assert pool._executor is executor
+        assert len(first) == 2
+        cortex.partial_fit(["Architektur erzeugt Gedanken"])
+        synthesize_thoughts(cortex, hotspots, workers=2, pool=pool)
+        assert pool._executor is not executor
+    finally:
+        pool.close()
+
+    cortex.partial_fit(["Neue Gedanken"])
+    synthesize_thoughts(cortex, hotspots, workers=1, cache=cache)
+    assert cortex.rng.getstate() != state
+    bounded = SynthesisCache(maxsize=1)
+    synthesize_thoughts(cortex, hotspots, workers=1, cache=bounded)
+    assert len(bounded) == 1
+
+
+def test_concept_placement_is_stable_across_processes_and_saved(tmp_path):
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8))
+    cortex.partial_fit(["Bioinspirierte Architektur"])
+    cortex.precompute_placements((12, 12))
+    position = cortex.concept_position("architektur", (12, 12))
+    script = (
+        "from symbio.biocortex import BioCortex\n"
+        "print(BioCortex().concept_position('architektur', (12, 12)))"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "123", "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == str(position)
+
+    cortex.save(tmp_path)
+    loaded = BioCortex.load(tmp_path, config=cortex.config)
+    assert loaded.placements == cortex.placements
+    pulses = loaded.concepts_to_pulses(loaded.extract_concepts("Architektur"), (12, 12))
+    assert all(pulse.position == loaded.placements[(12, 12)][pulse.tag] for pulse in pulses)
+    size = len(loaded.placements[(12, 12)])
+    assert loaded.concept_position("unbekannt", (12, 12)) == cortex.concept_position("unbekannt", (12, 12))
+    loaded.concept_position("unbekannt", (20, 20))
+    assert len(loaded.placements[(12, 12)]) == size and (20, 20) not in loaded.placements
+
+
+def test_batched_bridge_matches_per_text_pulses():
+    cortex = BioCortex(config=BioConfig(ngram_order=2, replay_capacity=8, concept_top_k=4))
+    corpus = ["Bioinspirierte Architektur", "Feldreaktionen erzeugen neue Gedanken"]
+    cortex.partial_fit(corpus)
+    texts = corpus * 3 + ["Architektur erzeugt Gedanken"]
+    config = FieldConfig(shape=(16, 16), backend="numpy")
+    single = HPIO(field_config=config, swarm_config=SwarmConfig(n_agents=0))
+    for text in texts:
+        single.inject_pulses(text_to_pulses(cortex, text, config.shape))
+    batched = HPIO(field_config=config, swarm_config=SwarmConfig(n_agents=0))
+    pulses = texts_to_pulses(cortex, texts, config.shape)
+    assert len({pulse.tag for pulse in pulses}) == len(pulses)
+    batched.inject_pulses(pulses)
+    np.testing.assert_allclose(batched.field.phi, single.field.phi, rtol=1e-12, atol=1e-12)
+    assert sorted(batched.field.channels) == sorted(single.field.channels)
+
+
+def test_batched_bridge_keeps_same_name_with_other_pheromone_apart(monkeypatch):
+    def concepts(self, tokens, lookup=None):
+        return [Concept("form", 0.5, 0.0), Concept("form", 0.5, 0.8)]
+
+    monkeypatch.setattr(BioCortex, "concepts_from_tokens", concepts)
+    cortex = BioCortex(config=BioConfig(ngram_order=2))
+    cortex.partial_fit(["Form folgt Funktion"])
+    texts = ["Form", "Funktion"]
+    pulses = texts_to_pulses(cortex, texts, (12, 12))
+    assert sorted(pulse.spread for pulse in pulses) == [1.5, 2.3]
+    single = [pulse for text in texts for pulse in text_to_pulses(cortex, text, (12, 12))]
+    for pulse in pulses:
+        same = [other.amplitude for other in single if other.spread == pulse.spread]
+        assert len(same) == 2 and pulse.amplitude == pytest.approx(sum(same))
@@ -1,6 +1,7 @@
 import pytest
 
 from symbio.tokenization import BioBPETokenizer
+from symbio.utils import normalize_text
 
 
 def test_tokenizer_roundtrip():
@@ -13,3 +14,33 @@ def test_tokenizer_roundtrip():
     assert isinstance(ids, list)
     assert reconstructed
     assert "biocortex" in reconstructed
+
+
+def _reference_encode(tokenizer: BioBPETokenizer, text: str) -> list[int]:
+    # Ursprüngliche Einzeltext-Schleife: jede Merge-Regel auf jede Sequenz.
+    seq = list(normalize_text(text))
+    for pair in tokenizer.merges:
+        seq = tokenizer._merge_sequence(seq, pair, "¤" + "".join(pair))
+    return [tokenizer.vocab[token] for token in seq]
+
+
+def test_encode_batch_matches_per_text_merge_loop():
+    tokenizer = BioBPETokenizer()
+    corpus = ["BioCortex ist adaptiv", "HPIO reagiert", "Feldreaktionen erzeugen neue Gedanken"]
+    tokenizer.fit(corpus, vocab_size=96)
+    texts = ["BioCortex reagiert", "hpio ist adaptiv", "BioCortex reagiert", "", "neue Felder"]
+    batch = tokenizer.encode_batch(texts)
+    assert batch == [_reference_encode(tokenizer, text) for text in texts]
+    batch[0].append(-1)
+    assert batch[2] != batch[0]
+
+
+def test_encode_batch_applies_merges_in_order():
+    tokenizer = BioBPETokenizer.from_json(
+        {
+            "merges": [["a", "b"], ["¤ab", "c"], ["b", "b"]],
+            "vocab": {" ": 0, "a": 1, "b": 2, "c": 3, "¤ab": 4, "¤¤abc": 5, "¤bb": 6},
+        }
+    )
+    texts = ["abc ab bb cab", "BBB", "c", ""]
+    assert tokenizer.encode_batch(texts) == [[5, 0, 4, 0, 6, 0, 3, 4], [6, 2], [3], []]